@@ -0,0 +1,67 @@
+from collections import Counter
+
+try:  # NumPy é opcional: sem ele, as mesmas agregações usam Counter/zip da biblioteca padrão
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+
+
+class MotorAgregacao:
+    """
+    Calcula os agrupamentos dos relatórios por plataforma
+    em lote, diretamente sobre as colunas do ArmazenamentoColunarInteracoes,
+    em vez de percorrer objeto por objeto.
+
+    Com NumPy disponível, as colunas são lidas sem cópia (np.frombuffer) e agrupadas
+    com bincount/unique; sem NumPy, a contagem é feita por Counter sobre as colunas
+    (laço em C). Os resultados são estruturas simples (dicionários), formatadas
+    depois pela camada de impressão do sistema.
+
+    Complexidade de cada agregação: O(m), m = número de interações.
+    """
+
+    def __init__(self, armazenamento, usar_numpy=None):
+        self._armazenamento = armazenamento
+        self._usar_numpy = (np is not None) if usar_numpy is None else (usar_numpy and np is not None)
+
+    def _coluna(self, nome):
+        coluna = getattr(self._armazenamento, nome)
+        if self._usar_numpy:
+            return np.frombuffer(coluna, dtype=coluna.typecode)
+        return coluna
+
+    def contagem_por_plataforma(self):
+        """
+        Retorna {id_plataforma: quantidade de interações}.
+        """
+        plataformas = self._coluna("ids_plataforma")
+        if self._usar_numpy:
+            contagem = np.bincount(plataformas)
+            return {int(id_plat): int(qtd) for id_plat, qtd in enumerate(contagem) if qtd and id_plat}
+        contagem = Counter(plataformas)
+        contagem.pop(0, None)  # 0 = interação sem plataforma
+        return dict(contagem)
+
+    def distribuicao_tipos_por_plataforma(self):
+        """
+        Retorna {id_plataforma: {tipo_interacao: quantidade}}.
+        Plataforma 0 agrupa as interações sem plataforma.
+        """
+        tipos = ArmazenamentoColunarInteracoes.TIPOS_INTERACAO
+        plataformas = self._coluna("ids_plataforma")
+        codigos = self._coluna("codigos_tipo")
+        distribuicao = {}
+        if self._usar_numpy:
+            # Chave combinada plataforma * nº de tipos + código do tipo
+            chaves = plataformas.astype(np.int64) * len(tipos) + codigos
+            contagem = np.bincount(chaves)
+            for chave in np.nonzero(contagem)[0]:
+                id_plat, codigo = divmod(int(chave), len(tipos))
+                distribuicao.setdefault(id_plat, {})[tipos[codigo]] = int(contagem[chave])
+            return distribuicao
+        # Ordena pelas chaves para obter a mesma ordem do caminho com NumPy
+        for (id_plat, codigo), qtd in sorted(Counter(zip(plataformas, codigos)).items()):
+            distribuicao.setdefault(id_plat, {})[tipos[codigo]] = qtd
+        return distribuicao
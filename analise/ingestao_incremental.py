@@ -0,0 +1,118 @@
+import csv
+import hashlib
+import json
+import mmap
+import os
+
+from analise.leitor_csv import termina_entre_aspas
+
+VERSAO_CHECKPOINT = 1
+# Bytes finais do trecho já processado usados para detectar arquivo reescrito
+JANELA_IMPRESSAO = 4096
+
+
+def calcular_impressao(caminho_arquivo, offset):
+    """
+    Hash (sha1) dos até JANELA_IMPRESSAO bytes que terminam em `offset`.
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        inicio = max(0, offset - JANELA_IMPRESSAO)
+        arquivo.seek(inicio)
+        return hashlib.sha1(arquivo.read(offset - inicio)).hexdigest()
+
+
+def ler_checkpoint(caminho_checkpoint):
+    """
+    Lê o checkpoint (JSON). Retorna None se não existir ou for de outra versão.
+    """
+    try:
+        with open(caminho_checkpoint, encoding='utf-8') as arquivo:
+            checkpoint = json.load(arquivo)
+    except (FileNotFoundError, ValueError):
+        return None
+    if checkpoint.get("versao") != VERSAO_CHECKPOINT:
+        return None
+    return checkpoint
+
+
+def salvar_checkpoint(caminho_checkpoint, checkpoint):
+    """
+    Grava o checkpoint em um arquivo temporário e troca de forma atômica.
+    """
+    caminho_temporario = caminho_checkpoint + ".tmp"
+    with open(caminho_temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump(dict(checkpoint, versao=VERSAO_CHECKPOINT), arquivo, ensure_ascii=False)
+    os.replace(caminho_temporario, caminho_checkpoint)
+
+
+def _fim_ultimo_registro_completo(arquivo, inicio, tamanho):
+    """
+    Retorna o offset logo após o último registro completo em [inicio, tamanho): o
+    registro termina na última quebra de linha fora de aspas (um campo entre aspas pode
+    conter quebras de linha). O trecho depois dela, mesmo que pareça ter todos os
+    campos, pode ser uma linha ainda sendo escrita e fica para a próxima leitura.
+
+    As linhas sem aspas são puladas com buscas em bytes; só as linhas com aspas
+    são percorridas caractere a caractere.
+    Complexidade: O(tamanho - inicio), em buscas de bytes
+    """
+    if tamanho <= inicio:
+        return inicio
+    with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        ultima_quebra = mapa.rfind(b"\n", inicio, tamanho)
+        if ultima_quebra < 0:
+            return inicio
+        posicao = inicio
+        while True:
+            aspas = mapa.find(b'"', posicao, ultima_quebra)
+            if aspas < 0:
+                return ultima_quebra + 1
+            # Percorre o registro que contém as aspas até a quebra de linha fora delas
+            inicio_registro = mapa.rfind(b"\n", posicao, aspas) + 1 or posicao
+            inicio_linha = inicio_registro
+            entre_aspas = False
+            while True:
+                fim_linha = mapa.find(b"\n", inicio_linha, ultima_quebra + 1)
+                entre_aspas = termina_entre_aspas(mapa[inicio_linha:fim_linha], entre_aspas)
+                if not entre_aspas:
+                    break
+                if fim_linha == ultima_quebra:
+                    # O campo entre aspas ainda não foi fechado: o registro está incompleto
+                    return inicio_registro
+                inicio_linha = fim_linha + 1
+            if fim_linha == ultima_quebra:
+                return ultima_quebra + 1
+            posicao = fim_linha + 1
+
+
+def localizar_novas_linhas(caminho_arquivo, checkpoint=None, arquivo_completo=False):
+    """
+    Retorna (campos, inicio, fim): o cabeçalho e o intervalo de bytes com os registros
+    completos ainda não processados. Sem checkpoint, o intervalo começa após o cabeçalho.
+    Retorna (None, 0, 0) se o arquivo ainda não tiver um cabeçalho completo.
+
+    Com arquivo_completo=True (nenhum processo está escrevendo no arquivo), o intervalo
+    vai até o fim do arquivo, incluindo uma última linha sem quebra de linha.
+
+    Lança ValueError se o arquivo ficou menor que o offset do checkpoint (truncado)
+    ou se os bytes já processados mudaram (arquivo reescrito).
+    Complexidade: O(1) leituras, exceto a busca do último registro completo
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        tamanho = os.fstat(arquivo.fileno()).st_size
+        if checkpoint is not None:
+            inicio = checkpoint["offset"]
+            if tamanho < inicio:
+                raise ValueError("O arquivo ficou menor que o último ponto processado (truncado).")
+            campos = checkpoint["campos"]
+        else:
+            cabecalho = arquivo.readline()
+            if not cabecalho.endswith(b"\n"):
+                return None, 0, 0
+            campos = next(csv.reader([cabecalho.decode('utf-8')], delimiter=';'))
+            inicio = arquivo.tell()
+        fim = tamanho if arquivo_completo else _fim_ultimo_registro_completo(arquivo, inicio, tamanho)
+
+    if checkpoint is not None and calcular_impressao(caminho_arquivo, inicio) != checkpoint["impressao"]:
+        raise ValueError("O trecho já processado do arquivo foi alterado (arquivo reescrito).")
+    return campos, inicio, fim
@@ -0,0 +1,240 @@
+import csv
+import os
+from array import array
+
+from analise.leitor_csv import ler_csv_mmap
+from analise.usuarios_unicos import EstimadorUsuariosUnicos
+from entidades.conteudo import criar_conteudo
+from entidades.plataforma import Plataforma
+from entidades.usuario import Usuario
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+from estruturas_dados.histograma import HistogramaDuracoes
+from estruturas_dados.hyperloglog import HyperLogLog
+from estruturas_dados.indice_temporal import IndiceTemporal
+
+
+def dividir_em_blocos(caminho_arquivo, quantidade_blocos):
+    """
+    Divide o arquivo (sem o cabeçalho) em até `quantidade_blocos` intervalos de bytes
+    [inicio, fim) que começam e terminam em limites de linha.
+    Retorna (cabecalho, lista de intervalos).
+
+    Supõe que nenhum campo contenha quebra de linha (o CSV do sistema não usa aspas).
+    Complexidade: O(b), b = quantidade de blocos (cada ajuste lê apenas uma linha)
+    """
+    tamanho = os.path.getsize(caminho_arquivo)
+    with open(caminho_arquivo, 'rb') as arquivo:
+        cabecalho = arquivo.readline()
+        inicio_dados = arquivo.tell()
+        passo = max(1, (tamanho - inicio_dados) // max(1, quantidade_blocos))
+
+        limites = [inicio_dados]
+        posicao = inicio_dados + passo
+        while posicao < tamanho:
+            # Avança até o início da próxima linha
+            arquivo.seek(posicao - 1)
+            arquivo.readline()
+            posicao_alinhada = arquivo.tell()
+            if posicao_alinhada >= tamanho:
+                break
+            if posicao_alinhada > limites[-1]:
+                limites.append(posicao_alinhada)
+            posicao = posicao_alinhada + passo
+        limites.append(tamanho)
+
+    campos = next(csv.reader([cabecalho.decode('utf-8')], delimiter=';'))
+    intervalos = [(limites[i], limites[i + 1]) for i in range(len(limites) - 1) if limites[i] < limites[i + 1]]
+    return campos, intervalos
+
+
+class AgregadosUsuariosBloco:
+    """
+    Índices de linha e agregados dos usuários de um bloco guardados em arrays
+    (listas de tamanho variável em formato CSR: valores concatenados + limites),
+    em vez de uma lista por usuário. Assim o bloco volta ao processo principal
+    como algumas dezenas de objetos, sem o custo de desserializar (e de o coletor
+    de lixo percorrer) milhões de listas e tuplas pequenas.
+
+    adicionar recebe e a iteração devolve (id_usuario, índices, agregados), com os
+    agregados no formato de Usuario.exportar_agregados.
+    Complexidade: O(t) para adicionar e para percorrer, t = tamanho dos dados do usuário
+    """
+
+    # Listas de pares (chave, valor) dos agregados, com o tipo de cada array
+    _LISTAS = (("tipos", 'b', 'q'), ("tempo_plataforma", 'i', 'q'), ("contagem_plataforma", 'i', 'q'))
+
+    def __init__(self):
+        self.ids = array('q')
+        self.limites_indices = array('q', [0])
+        self.indices = array('q')
+        # engajamento, tempo, durações válidas e comentários, quatro por usuário
+        self.totais = array('q')
+        self.listas = {nome: (array('q', [0]), array(tipo_chave), array(tipo_valor))
+                       for nome, tipo_chave, tipo_valor in self._LISTAS}
+        self.limites_conteudos = array('q', [0])
+        self.conteudos = array('q')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def adicionar(self, id_usuario, indices, agregados):
+        tipos, engajamento, tempo, duracoes_validas, comentarios, tempo_plataforma, contagem_plataforma, \
+            conteudos = agregados
+        self.ids.append(id_usuario)
+        self.indices.extend(indices)
+        self.limites_indices.append(len(self.indices))
+        self.totais.extend((engajamento, tempo, duracoes_validas, comentarios))
+        codigo_por_tipo = ArmazenamentoColunarInteracoes.CODIGO_POR_TIPO
+        pares_por_lista = ([(codigo_por_tipo[tipo], quantidade) for tipo, quantidade in tipos],
+                           tempo_plataforma, contagem_plataforma)
+        for (limites, chaves, valores), pares in zip(self.listas.values(), pares_por_lista):
+            for chave, valor in pares:
+                chaves.append(chave)
+                valores.append(valor)
+            limites.append(len(chaves))
+        self.conteudos.extend(conteudos)
+        self.limites_conteudos.append(len(self.conteudos))
+
+    def __iter__(self):
+        tipos_interacao = ArmazenamentoColunarInteracoes.TIPOS_INTERACAO
+        listas = list(self.listas.values())
+        for posicao, id_usuario in enumerate(self.ids):
+            pares = []
+            for limites, chaves, valores in listas:
+                inicio, fim = limites[posicao], limites[posicao + 1]
+                pares.append(zip(chaves[inicio:fim], valores[inicio:fim]))
+            tipos, tempo_plataforma, contagem_plataforma = pares
+            agregados = [((tipos_interacao[codigo], quantidade) for codigo, quantidade in tipos),
+                         *self.totais[4 * posicao:4 * posicao + 4], tempo_plataforma, contagem_plataforma,
+                         self.conteudos[self.limites_conteudos[posicao]:self.limites_conteudos[posicao + 1]]]
+            yield (id_usuario,
+                   self.indices[self.limites_indices[posicao]:self.limites_indices[posicao + 1]],
+                   agregados)
+
+
+class BlocoAgregado:
+    """
+    Resultado de um bloco do CSV processado em um processo de trabalho, já resumido
+    em agregados parciais que o processo principal apenas soma aos existentes:
+
+    - linhas: quantidade de linhas lidas do bloco (válidas ou não)
+    - armazenamento: colunas das linhas válidas, com ids de plataforma locais (1, 2, ...)
+      e sem ids de interação (atribuídos na mesclagem, na ordem do arquivo)
+    - plataformas: [(nome, posição da primeira linha válida que a usa)], na ordem dos ids locais
+    - conteudos: [(id_conteudo, tipo_conteudo, nome, categoria, índices locais, agregados)]
+    - usuarios: AgregadosUsuariosBloco com (id_usuario, índices locais, agregados), com
+      ids de plataforma locais nos agregados
+    - indice_plataforma: {id local da plataforma: ids dos conteúdos}
+    - duracoes: {id local da plataforma: pares (duração, quantidade) do histograma}
+    - usuarios_unicos: EstimadorUsuariosUnicos do bloco
+    - rejeitadas: [(posição, linha)] das linhas que falham no processamento, com a
+      quantidade de linhas válidas anteriores; são reprocessadas pelo caminho serial,
+      que reporta o erro exatamente como no processamento sem blocos
+    """
+
+    def __init__(self, linhas, armazenamento, plataformas, conteudos, usuarios, indice_plataforma, duracoes,
+                 usuarios_unicos, rejeitadas):
+        self.linhas = linhas
+        self.armazenamento = armazenamento
+        self.plataformas = plataformas
+        self.conteudos = conteudos
+        self.usuarios = usuarios
+        self.indice_plataforma = indice_plataforma
+        self.duracoes = duracoes
+        self.usuarios_unicos = usuarios_unicos
+        self.rejeitadas = rejeitadas
+
+
+def agregar_bloco(caminho_arquivo, campos, inicio, fim, precisao=HyperLogLog.PRECISAO_PADRAO,
+                  tamanho_bucket=IndiceTemporal.TAMANHO_BUCKET_PADRAO):
+    """
+    Executada nos processos de trabalho: lê e interpreta o intervalo [inicio, fim) do
+    arquivo, grava as linhas em colunas e acumula os agregados de cada conteúdo e
+    usuário (com os próprios Conteudo.contabilizar e Usuario.contabilizar), os
+    histogramas de duração e os sketches de usuários únicos do bloco.
+    Devolve um BlocoAgregado, que o processo principal soma sem interpretar as linhas.
+    Os mais ativos não são calculados aqui: o MotorMaisAtivos do processo principal lê
+    as colunas anexadas na ordem do arquivo, como no processamento serial.
+    Complexidade: O(k), k = linhas do bloco
+    """
+    armazenamento = ArmazenamentoColunarInteracoes()
+    tipos_interacao = ArmazenamentoColunarInteracoes.TIPOS_INTERACAO
+    codigos_tipo = armazenamento.codigos_tipo
+    duracoes_armazenadas = armazenamento.duracoes
+    plataformas = {}        # nome -> Plataforma com id local
+    primeiras_linhas = []   # posição da primeira linha válida de cada plataforma
+    conteudos = {}
+    tipos_conteudo = {}     # id_conteudo -> tipo_conteudo da primeira linha válida
+    usuarios = {}
+    indice_plataforma = {}
+    duracoes = {}
+    rejeitadas = []
+    linhas = 0
+
+    for item in ler_csv_mmap(caminho_arquivo, campos, inicio, fim):
+        linhas += 1
+        if not isinstance(item, tuple):
+            rejeitadas.append((len(armazenamento), item))
+            continue
+        (id_usuario, id_conteudo, nome_conteudo, _, timestamp_epoch, tipo, duracao, comentario,
+         nome_plataforma, categoria, tipo_conteudo) = item
+        try:
+            # Mesmas validações do processamento serial (nome da Plataforma e colunas)
+            plataforma = plataformas.get(nome_plataforma)
+            nova_plataforma = plataforma is None
+            if nova_plataforma:
+                plataforma = Plataforma(nome_plataforma, len(plataformas) + 1)
+            indice = armazenamento.adicionar(id_usuario, id_conteudo, plataforma.id_plataforma, tipo,
+                                             timestamp_epoch, duracao, comentario, interacao_id=0)
+        except ValueError:
+            rejeitadas.append((len(armazenamento), item))
+            continue
+        if nova_plataforma:
+            plataformas[nome_plataforma] = plataforma
+            primeiras_linhas.append(indice)
+            armazenamento.registrar_plataforma(plataforma)
+
+        conteudo = conteudos.get(id_conteudo)
+        if conteudo is None:
+            # Os índices das linhas ficam em um array simples (não há visões no bloco)
+            conteudo = conteudos[id_conteudo] = criar_conteudo(tipo_conteudo, id_conteudo, nome_conteudo,
+                                                               categoria, array('q'))
+            tipos_conteudo[id_conteudo] = tipo_conteudo
+            armazenamento.registrar_conteudo(conteudo)
+        usuario = usuarios.get(id_usuario)
+        if usuario is None:
+            usuario = usuarios[id_usuario] = Usuario(id_usuario, array('q'))
+
+        # Valores como ficaram nas colunas (tipo e duração normalizados, comentário sem espaços)
+        tipo = tipos_interacao[codigos_tipo[indice]]
+        duracao = duracoes_armazenadas[indice]
+        comentario = armazenamento.comentario(indice)
+        conteudo._interacoes.append(indice)
+        conteudo.contabilizar(tipo, duracao, comentario)
+        usuario.interacoes_realizadas.append(indice)
+        usuario.contabilizar(tipo, duracao, comentario, plataforma, conteudo)
+        indice_plataforma.setdefault(plataforma.id_plataforma, set()).add(id_conteudo)
+        if duracao > 0:
+            histograma = duracoes.get(plataforma.id_plataforma)
+            if histograma is None:
+                histograma = duracoes[plataforma.id_plataforma] = HistogramaDuracoes()
+            histograma.adicionar(duracao)
+
+    agregados_usuarios = AgregadosUsuariosBloco()
+    for id_usuario, usuario in usuarios.items():
+        agregados_usuarios.adicionar(id_usuario, usuario.interacoes_realizadas, usuario.exportar_agregados())
+    usuarios_unicos = EstimadorUsuariosUnicos(armazenamento, precisao, tamanho_bucket)
+    usuarios_unicos.atualizar()
+    return BlocoAgregado(
+        linhas,
+        armazenamento,
+        [(nome, primeira) for nome, primeira in zip(plataformas, primeiras_linhas)],
+        [(id_conteudo, tipos_conteudo[id_conteudo], conteudo.nome_conteudo, conteudo.categoria,
+          conteudo._interacoes, conteudo.exportar_agregados())
+         for id_conteudo, conteudo in conteudos.items()],
+        agregados_usuarios,
+        indice_plataforma,
+        {id_plataforma: histograma.exportar() for id_plataforma, histograma in duracoes.items()},
+        usuarios_unicos,
+        rejeitadas,
+    )
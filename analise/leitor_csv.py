@@ -0,0 +1,215 @@
+import csv
+import mmap
+import os
+
+from entidades.interacao import converter_timestamp_epoch
+
+# Tamanho dos blocos copiados do arquivo mapeado (cortados em limite de linha)
+TAMANHO_BLOCO = 1 << 20
+
+
+def interpretar_linha(linha):
+    """
+    Converte uma linha do CSV (dicionário do csv.DictReader) na tupla de campos usada
+    por SistemaAnaliseEngajamento._registrar_interacao:
+    (id_usuario, id_conteudo, nome_conteudo, timestamp, timestamp_epoch, tipo_interacao,
+     duracao, comentario, nome_plataforma, categoria, tipo_conteudo)
+
+    Não depende do estado do sistema, por isso pode ser executada em outros processos.
+    Lança exceção para linhas inválidas, como o processamento serial. Plataforma vazia
+    gera o mesmo ValueError de Plataforma, na mesma ordem em que o processamento
+    original validava os campos (depois da categoria).
+    Complexidade: O(1)
+    """
+    id_usuario = int(linha['id_usuario'])
+    id_conteudo = int(linha['id_conteudo'])
+    nome_conteudo = linha['nome_conteudo']
+    timestamp = linha['timestamp_interacao']
+    tipo = linha['tipo_interacao']
+
+    valor_duracao = linha['watch_duration_seconds']
+    duracao = int(valor_duracao) if valor_duracao.strip().isdigit() and int(valor_duracao) >= 0 else 0
+
+    comentario = linha['comment_text']
+    nome_plataforma = linha['plataforma']
+    categoria = linha['categorias'].strip().lower()
+    if not nome_plataforma or not nome_plataforma.strip():
+        raise ValueError("Nome da plataforma não pode ser vazio.")
+    tipo_conteudo = linha['tipo_conteudo'].strip().lower()
+
+    return (id_usuario, id_conteudo, nome_conteudo, timestamp, converter_timestamp_epoch(timestamp), tipo,
+            duracao, comentario, nome_plataforma, categoria, tipo_conteudo)
+
+
+def linha_como_dicionario(texto, campos):
+    """
+    Interpreta uma linha com o módulo csv (aspas, campos faltando ou sobrando) e
+    devolve o mesmo dicionário que o csv.DictReader produziria.
+    """
+    valores = next(csv.reader([texto], delimiter=';'), [])
+    linha = dict(zip(campos, valores))
+    if len(valores) > len(campos):
+        linha[None] = valores[len(campos):]
+    for campo in campos[len(valores):]:
+        linha[campo] = None
+    return linha
+
+
+def termina_entre_aspas(linha, entre_aspas):
+    """
+    Indica se a linha (bytes, sem a quebra) termina dentro de um campo entre aspas,
+    com as regras do módulo csv: aspas só abrem um campo no início dele, e "" dentro
+    de um campo entre aspas é uma aspa literal.
+    `entre_aspas` indica se a linha continua um campo aberto na linha anterior.
+    Complexidade: O(tamanho da linha)
+    """
+    aspas, separador = ord('"'), ord(';')
+    # 0: início de campo, 1: campo sem aspas, 2: entre aspas, 3: aspa dentro de aspas
+    estado = 2 if entre_aspas else 0
+    for caractere in linha:
+        if estado == 2:
+            if caractere == aspas:
+                estado = 3
+        elif caractere == separador:
+            estado = 0
+        elif estado == 0:
+            estado = 2 if caractere == aspas else 1
+        elif estado == 3:
+            estado = 2 if caractere == aspas else 1
+    return estado == 2
+
+
+def _interpretar_com_csv(linha, campos):
+    # Registro com aspas ou campos a mais/menos: tupla, ou o dicionário se for inválido
+    linha_csv = linha_como_dicionario(linha.decode('utf-8'), campos)
+    try:
+        return interpretar_linha(linha_csv)
+    except Exception:
+        return linha_csv
+
+
+class _CacheTexto(dict):
+    """
+    Decodifica (e normaliza) cada valor distinto uma única vez; os valores repetidos
+    passam a compartilhar o mesmo objeto str.
+    """
+
+    def __init__(self, normalizar=None):
+        super().__init__()
+        self._normalizar = normalizar
+
+    def __missing__(self, bruto):
+        texto = bruto.decode('utf-8')
+        if self._normalizar is not None:
+            texto = self._normalizar(texto)
+        self[bruto] = texto
+        return texto
+
+
+def _normalizar_minusculas(texto):
+    return texto.strip().lower()
+
+
+def ler_csv_mmap(caminho_arquivo, campos=None, inicio=None, fim=None):
+    """
+    Lê o CSV (separado por ';') a partir do arquivo mapeado em memória e gera, para
+    cada linha, a mesma tupla de interpretar_linha, sem criar o dicionário do
+    csv.DictReader. Os blocos do arquivo são divididos em linhas e campos como bytes;
+    inteiros são convertidos direto dos bytes e textos repetidos (plataforma, tipos,
+    categorias, nomes de conteúdo) são decodificados uma vez e compartilhados.
+
+    Os registros são separados pelas quebras de linha fora de aspas: um campo entre
+    aspas com quebra de linha (ex.: comment_text) continua no mesmo registro.
+    Registros com aspas ou com quantidade de campos diferente do cabeçalho passam pelo
+    módulo csv. Linhas que não podem ser interpretadas são geradas como dicionário
+    (como no csv.DictReader), para que o chamador reporte o erro pelo caminho serial.
+
+    Parâmetros:
+        campos (list): nomes das colunas; se None, lidos do cabeçalho do arquivo
+        inicio / fim (int): intervalo de bytes a ler (padrão: após o cabeçalho até o fim);
+            deve começar e terminar em limites de registro
+    Complexidade: O(m)
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        tamanho = os.fstat(arquivo.fileno()).st_size
+        if tamanho == 0:
+            return
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if campos is None:
+                fim_cabecalho = mapa.find(b"\n")
+                fim_cabecalho = tamanho if fim_cabecalho < 0 else fim_cabecalho + 1
+                campos = next(csv.reader([mapa[:fim_cabecalho].decode('utf-8')], delimiter=';'), [])
+                if inicio is None:
+                    inicio = fim_cabecalho
+            inicio = 0 if inicio is None else inicio
+            fim = tamanho if fim is None else min(fim, tamanho)
+            yield from _interpretar_intervalo(mapa, campos, inicio, fim)
+
+
+def _interpretar_intervalo(mapa, campos, inicio, fim):
+    quantidade_campos = len(campos)
+    try:
+        (i_usuario, i_conteudo, i_nome, i_timestamp, i_tipo, i_duracao, i_comentario, i_plataforma,
+         i_categoria, i_tipo_conteudo) = (campos.index(nome) for nome in (
+            'id_usuario', 'id_conteudo', 'nome_conteudo', 'timestamp_interacao', 'tipo_interacao',
+            'watch_duration_seconds', 'comment_text', 'plataforma', 'categorias', 'tipo_conteudo'))
+    except ValueError:
+        # Falta alguma coluna: todas as linhas vão para o caminho serial, que reporta o erro
+        quantidade_campos = -1
+
+    nomes = _CacheTexto()
+    tipos = _CacheTexto()
+    plataformas = _CacheTexto()
+    categorias = _CacheTexto(_normalizar_minusculas)
+    tipos_conteudo = _CacheTexto(_normalizar_minusculas)
+
+    posicao = inicio
+    pendente = None  # linhas de um registro com aspas abertas (quebra de linha dentro de um campo)
+    while posicao < fim:
+        corte = fim
+        if fim - posicao > TAMANHO_BLOCO:
+            corte = mapa.rfind(b"\n", posicao, posicao + TAMANHO_BLOCO) + 1 or fim
+        linhas = mapa[posicao:corte].split(b"\n")
+        if not linhas[-1]:
+            linhas.pop()  # o bloco termina em quebra de linha
+        posicao = corte
+
+        for linha in linhas:
+            if linha.endswith(b"\r"):
+                linha = linha[:-1]
+            if pendente is not None:
+                # Enquanto o campo entre aspas não fecha, a quebra de linha faz parte dele
+                pendente.append(linha)
+                if termina_entre_aspas(linha, True):
+                    continue
+                linha = b"\n".join(pendente)
+                pendente = None
+            elif not linha:
+                continue
+            elif b'"' in linha and termina_entre_aspas(linha, False):
+                pendente = [linha]
+                continue
+            valores = linha.split(b";")
+            if len(valores) != quantidade_campos or b'"' in linha:
+                yield _interpretar_com_csv(linha, campos)
+                continue
+
+            try:
+                nome_plataforma = plataformas[valores[i_plataforma]]
+                if not nome_plataforma.strip():
+                    raise ValueError("Nome da plataforma não pode ser vazio.")
+                valor_duracao = valores[i_duracao]
+                duracao = int(valor_duracao) if valor_duracao.strip().isdigit() else 0
+                timestamp = valores[i_timestamp].decode('utf-8')
+                yield (int(valores[i_usuario]), int(valores[i_conteudo]), nomes[valores[i_nome]],
+                       timestamp, converter_timestamp_epoch(timestamp), tipos[valores[i_tipo]], duracao,
+                       valores[i_comentario].decode('utf-8'), nome_plataforma,
+                       categorias[valores[i_categoria]], tipos_conteudo[valores[i_tipo_conteudo]])
+            except Exception:
+                yield linha_como_dicionario(linha.decode('utf-8'), campos)
+
+    if pendente is not None:
+        # Aspas não fechadas até o fim: o registro vai até o fim, como no csv.DictReader
+        if mapa[fim - 1:fim] == b"\n":
+            pendente.append(b"")
+        yield _interpretar_com_csv(b"\n".join(pendente), campos)
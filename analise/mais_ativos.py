@@ -0,0 +1,122 @@
+from collections import Counter
+
+from estruturas_dados.space_saving import SpaceSaving
+
+
+class MotorMaisAtivos:
+    """
+    Usuários, conteúdos e pares (usuário, conteúdo) mais ativos, por quantidade de
+    interações e por tempo assistido, em memória limitada: um SpaceSaving por
+    combinação de dimensão e critério, cada um com no máximo `capacidade` contadores.
+
+    Assim como o IndiceTemporal, lê as colunas do ArmazenamentoColunarInteracoes e
+    processa sob demanda apenas as linhas novas (atualizar).
+
+    As linhas entram nos resumos em lotes de LINHAS_POR_LOTE: os pesos de cada chave
+    são somados no lote e o resumo recebe o lote inteiro de uma vez
+    (SpaceSaving.adicionar_lote, com as garantias de erro de mesclar). Os lotes são alinhados
+    aos índices das linhas, e o lote incompleto do final só é aplicado a uma cópia do
+    resumo consultado; assim o resultado depende apenas das linhas e da sua ordem, e
+    não de quando atualizar é chamado (processamento serial, paralelo ou incremental,
+    ou estado restaurado de um snapshot dão os mesmos mais ativos).
+
+    Complexidades:
+    - atualizar: O(k + (k / L) · (C + d) log C), k = linhas novas, L = LINHAS_POR_LOTE,
+      d = chaves distintas por lote, C = capacidade
+    - mais_ativos: O(C log k) + O(L + (C + d) log C) se houver lote incompleto
+    - Memória: O(capacidade) por dimensão e critério, independente de usuários e conteúdos
+    """
+
+    DIMENSOES = ("usuarios", "conteudos", "pares")
+    CRITERIOS = ("interacoes", "tempo")
+    LINHAS_POR_LOTE = 8192
+
+    def __init__(self, armazenamento, capacidade=SpaceSaving.CAPACIDADE_PADRAO):
+        self._armazenamento = armazenamento
+        self._capacidade = capacidade
+        self._contadores = {(dimensao, criterio): SpaceSaving(capacidade)
+                            for dimensao in self.DIMENSOES for criterio in self.CRITERIOS}
+        self._linhas_processadas = 0
+
+    @property
+    def capacidade(self):
+        return self._capacidade
+
+    def atualizar(self):
+        """
+        Processa os lotes completos de linhas acrescentadas ao armazenamento desde a
+        última atualização; as linhas do lote incompleto ficam para a próxima.
+        """
+        total = len(self._armazenamento)
+        inicio = self._linhas_processadas
+        fim = (inicio // self.LINHAS_POR_LOTE + 1) * self.LINHAS_POR_LOTE
+        while fim <= total:
+            for (dimensao, criterio), contadores in self._contadores.items():
+                self._aplicar_lote(contadores, dimensao, criterio, inicio, fim)
+            inicio, fim = fim, fim + self.LINHAS_POR_LOTE
+        self._linhas_processadas = inicio
+
+    def _aplicar_lote(self, contadores, dimensao, criterio, inicio, fim):
+        """
+        Soma ao SpaceSaving os pesos das linhas [inicio, fim), agregados por chave na
+        ordem da primeira ocorrência da chave no lote.
+        Complexidade: O(L + (C + d) log C), L = fim - inicio, d = chaves distintas
+        """
+        armazenamento = self._armazenamento
+        if dimensao == "usuarios":
+            chaves = armazenamento.ids_usuario[inicio:fim]
+        elif dimensao == "conteudos":
+            chaves = armazenamento.ids_conteudo[inicio:fim]
+        else:
+            chaves = zip(armazenamento.ids_usuario[inicio:fim], armazenamento.ids_conteudo[inicio:fim])
+        if criterio == "interacoes":
+            pesos = Counter(chaves)
+        else:
+            pesos = {}
+            for chave, duracao in zip(chaves, armazenamento.duracoes[inicio:fim]):
+                if duracao > 0:
+                    pesos[chave] = pesos.get(chave, 0) + duracao
+        contadores.adicionar_lote(pesos)
+
+    def exportar(self):
+        """
+        Retorna os contadores, após processar os lotes completos de linhas novas, em
+        estruturas simples (para o snapshot): {"capacidade", "linhas_processadas",
+        "contadores": [[dimensao, criterio, SpaceSaving.exportar()]]}. As linhas do lote
+        incompleto são lidas das colunas depois de restaurar.
+        """
+        self.atualizar()
+        return {"capacidade": self._capacidade, "linhas_processadas": self._linhas_processadas,
+                "contadores": [[dimensao, criterio, contadores.exportar()]
+                               for (dimensao, criterio), contadores in self._contadores.items()]}
+
+    def restaurar(self, dados):
+        """
+        Substitui os contadores pelos exportados (exportar); linhas acrescentadas depois
+        são processadas normalmente. Os pares voltam a ser tuplas (usuário, conteúdo).
+        """
+        for dimensao, criterio, (total, itens) in dados["contadores"]:
+            if dimensao == "pares":
+                itens = [(tuple(par), contagem, erro) for par, contagem, erro in itens]
+            self._contadores[dimensao, criterio] = SpaceSaving.a_partir_de(self._capacidade, (total, itens))
+        self._linhas_processadas = dados["linhas_processadas"]
+
+    def mais_ativos(self, dimensao, criterio="interacoes", k=10):
+        """
+        Retorna [(chave, valor, erro)] dos k mais ativos da dimensão ('usuarios',
+        'conteudos' ou 'pares') pelo critério ('interacoes' ou 'tempo', em segundos).
+        O valor real está entre valor - erro e valor. Lança ValueError se a dimensão ou
+        o critério forem inválidos.
+        """
+        if dimensao not in self.DIMENSOES:
+            raise ValueError(f"Dimensão inválida: '{dimensao}'. Use uma de {list(self.DIMENSOES)}.")
+        if criterio not in self.CRITERIOS:
+            raise ValueError(f"Critério inválido: '{criterio}'. Use um de {list(self.CRITERIOS)}.")
+        self.atualizar()
+        contadores = self._contadores[dimensao, criterio]
+        total = len(self._armazenamento)
+        if self._linhas_processadas < total:
+            # O lote incompleto entra só na cópia, para não depender de quando foi consultado
+            contadores = contadores.copiar()
+            self._aplicar_lote(contadores, dimensao, criterio, self._linhas_processadas, total)
+        return contadores.primeiros(k)
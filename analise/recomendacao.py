@@ -0,0 +1,135 @@
+from estruturas_dados.heap_indexado import HeapIndexado
+from estruturas_dados.ordenacao import merge_sort
+
+
+class MotorRecomendacao:
+    """
+    Mantém, por categoria, os conteúdos membros e os normalizadores máximos
+    (maior total de interações de engajamento e maior tempo total consumido),
+    atualizados a cada interação recebida.
+
+    A pontuação de um conteúdo na categoria é:
+        peso_interacoes * (interacoes / max_interacoes) + peso_tempo * (tempo / max_tempo)
+
+    Com os pesos padrão, cada categoria tem um HeapIndexado de máximo com a prioridade
+    (pontuação, -id_conteudo) de cada membro, atualizada na própria interação. Se a
+    interação muda um máximo da categoria, todas as pontuações mudam juntas: a categoria
+    é marcada e o heap é remontado em O(c) (heapify) na próxima consulta.
+
+    Outros pesos recalculam e ordenam a categoria inteira; esses rankings ficam em um
+    cache limitado a LIMITE_RANKINGS_PERSONALIZADOS entradas (o menos usado sai primeiro),
+    válido até a categoria receber uma nova interação.
+
+    Complexidades (c = conteúdos da categoria, g = categorias do conteúdo):
+    - atualizar_conteudo: O(g log c)
+    - recomendar com os pesos padrão: O(top_n log top_n); O(c) a mais se um máximo mudou
+    - recomendar com outros pesos: O(top_n) com o ranking no cache; O(c log c) para recalcular
+    """
+
+    PESOS_PADRAO = (0.6, 0.4)
+    LIMITE_RANKINGS_PERSONALIZADOS = 32
+
+    def __init__(self):
+        self._membros = {}          # categoria -> {id_conteudo: Conteudo}
+        self._max_interacoes = {}   # categoria -> maior total de engajamento
+        self._max_tempo = {}        # categoria -> maior tempo total consumido
+        self._heaps = {}            # categoria -> HeapIndexado id_conteudo -> (pontuação padrão, -id)
+        self._desatualizadas = set()  # categorias cujos máximos mudaram desde a montagem do heap
+        self._versoes = {}          # categoria -> quantidade de atualizações recebidas
+        self._rankings_personalizados = {}  # (categoria, pesos) -> (versão, [(Conteudo, pontuação)])
+
+    def atualizar_conteudo(self, conteudo):
+        """
+        Registra o estado atual do conteúdo (após nova interação) em cada uma de suas categorias.
+        """
+        interacoes = conteudo.calcular_total_interacoes_engajamento()
+        tempo = conteudo.calcular_tempo_total_consumo()
+        for categoria in conteudo.categorias:
+            self._membros.setdefault(categoria, {})[conteudo.id_conteudo] = conteudo
+            self._versoes[categoria] = self._versoes.get(categoria, 0) + 1
+            maximo_mudou = False
+            if interacoes > self._max_interacoes.get(categoria, 0):
+                self._max_interacoes[categoria] = interacoes
+                maximo_mudou = True
+            if tempo > self._max_tempo.get(categoria, 0):
+                self._max_tempo[categoria] = tempo
+                maximo_mudou = True
+            if maximo_mudou or categoria not in self._heaps:
+                self._desatualizadas.add(categoria)
+            elif categoria not in self._desatualizadas:
+                self._heaps[categoria].inserir_ou_atualizar(
+                    conteudo.id_conteudo, self._prioridade(categoria, conteudo, *self.PESOS_PADRAO))
+
+    def normalizadores(self, categoria):
+        """
+        Retorna (max_interacoes, max_tempo) da categoria.
+        """
+        categoria = categoria.strip().lower()
+        return self._max_interacoes.get(categoria, 0), self._max_tempo.get(categoria, 0)
+
+    def _prioridade(self, categoria, conteudo, peso_interacoes, peso_tempo):
+        # Entre pontuações iguais, o menor id vem primeiro
+        max_interacoes, max_tempo = self.normalizadores(categoria)
+        pontuacao = 0.0
+        if max_interacoes:
+            pontuacao += peso_interacoes * (conteudo.calcular_total_interacoes_engajamento() / max_interacoes)
+        if max_tempo:
+            pontuacao += peso_tempo * (conteudo.calcular_tempo_total_consumo() / max_tempo)
+        return pontuacao, -conteudo.id_conteudo
+
+    def _heap_padrao(self, categoria):
+        """
+        Retorna o heap da categoria com os pesos padrão, remontando-o se um máximo mudou.
+        Complexidade: O(1), ou O(c) para remontar
+        """
+        if categoria in self._desatualizadas:
+            pares = [(id_conteudo, self._prioridade(categoria, conteudo, *self.PESOS_PADRAO))
+                     for id_conteudo, conteudo in self._membros[categoria].items()]
+            self._heaps[categoria] = HeapIndexado.a_partir_de(pares, maximo=True)
+            self._desatualizadas.discard(categoria)
+        return self._heaps[categoria]
+
+    def _ranking_personalizado(self, categoria, pesos):
+        """
+        Retorna o ranking completo da categoria com pesos diferentes dos padrão, usando o
+        cache limitado enquanto a categoria não recebe novas interações.
+        Complexidade: O(1) no cache; O(c log c) para recalcular
+        """
+        chave_cache = (categoria, pesos)
+        versao = self._versoes[categoria]
+        em_cache = self._rankings_personalizados.pop(chave_cache, None)
+        if em_cache is None or em_cache[0] != versao:
+            # Ids em ordem crescente: empates ficam em ordem de id (ordenação estável)
+            membros = self._membros[categoria]
+            pontuacoes = [(membros[id_conteudo], self._prioridade(categoria, membros[id_conteudo], *pesos)[0])
+                          for id_conteudo in sorted(membros)]
+            em_cache = (versao, merge_sort(pontuacoes, key=lambda item: item[1], reverse=True))
+            if len(self._rankings_personalizados) >= self.LIMITE_RANKINGS_PERSONALIZADOS:
+                # Dicionários preservam a ordem de inserção: o primeiro é o menos usado
+                del self._rankings_personalizados[next(iter(self._rankings_personalizados))]
+        # Reinserido no fim, como o mais recentemente usado
+        self._rankings_personalizados[chave_cache] = em_cache
+        return em_cache[1]
+
+    def ranking(self, categoria, peso_interacoes=0.6, peso_tempo=0.4, top_n=None):
+        """
+        Retorna [(Conteudo, pontuação)] da categoria, da maior para a menor pontuação
+        (apenas os top_n primeiros, se informado).
+        """
+        categoria = categoria.strip().lower()
+        if categoria not in self._membros:
+            return []
+        pesos = (peso_interacoes, peso_tempo)
+        if pesos != self.PESOS_PADRAO:
+            ranking = self._ranking_personalizado(categoria, pesos)
+            return ranking if top_n is None else ranking[:top_n]
+        heap = self._heap_padrao(categoria)
+        membros = self._membros[categoria]
+        quantidade = len(heap) if top_n is None else top_n
+        return [(membros[id_conteudo], pontuacao) for id_conteudo, (pontuacao, _) in heap.primeiros(quantidade)]
+
+    def recomendar(self, categoria, top_n=5, peso_interacoes=0.6, peso_tempo=0.4):
+        """
+        Retorna os top_n conteúdos da categoria pela pontuação combinada.
+        """
+        return [conteudo for conteudo, _ in self.ranking(categoria, peso_interacoes, peso_tempo, top_n)]
@@ -1,33 +1,96 @@
 import csv
-from collections import defaultdict
+import os
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
 from entidades.usuario import Usuario
 from entidades.plataforma import Plataforma
-from entidades.conteudo import Video, Podcast, Artigo
+from entidades.conteudo import criar_conteudo
 from entidades.interacao import Interacao
 
 from estruturas_dados.fila import Fila
 from estruturas_dados.arvore_binaria_busca import ArvoreBinariaBusca
+from estruturas_dados.arvore_avl import ArvoreAVL
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+from estruturas_dados.histograma import HistogramaDuracoes
+from estruturas_dados.selecao import selecionar_top_k
+from estruturas_dados.ordenacao import merge_sort, radix_sort
+from estruturas_dados.indice_texto import IndiceTexto
+from estruturas_dados.indice_temporal import IndiceTemporal
+from analise.agregacao import MotorAgregacao
+from analise.leitor_csv import interpretar_linha, ler_csv_mmap
+from analise.ingestao_paralela import dividir_em_blocos, agregar_bloco
+from analise.ingestao_incremental import (ler_checkpoint, salvar_checkpoint, localizar_novas_linhas,
+                                          calcular_impressao)
+from analise.recomendacao import MotorRecomendacao
+from analise.tendencias import MotorTendencias
+from analise.usuarios_unicos import EstimadorUsuariosUnicos
+from analise.mais_ativos import MotorMaisAtivos
+from analise.snapshot import salvar_snapshot, restaurar_snapshot
 
 class SistemaAnaliseEngajamento:
 
-    def __init__(self):
+    # Estruturas de índice disponíveis para conteúdos e usuários
+    TIPOS_INDICE = {"bst": ArvoreBinariaBusca, "avl": ArvoreAVL}
+    def __init__(self, tipo_indice="avl"):
+        """
+        Parâmetros:
+            tipo_indice (str): estrutura usada para indexar conteúdos e usuários.
+                'avl' (padrão) mantém a árvore balanceada mesmo com ids em ordem crescente;
+                'bst' usa a Árvore Binária de Busca simples.
+
+        As interações ficam apenas no armazenamento colunar: Conteudo e Usuario guardam
+        os índices das suas linhas e recebem visões leves (InteracaoColunar), sem um
+        objeto Interacao por linha do CSV.
+        """
+        if tipo_indice not in self.TIPOS_INDICE:
+            raise ValueError(f"Tipo de índice inválido: '{tipo_indice}'. Use um de {list(self.TIPOS_INDICE)}.")
+        classe_indice = self.TIPOS_INDICE[tipo_indice]
         # Dicionário para plataformas (chave: nome_plataforma)
         self._plataformas_registradas = {}
-        # Árvores Binárias de Busca para conteúdos e usuários
-        self._arvore_conteudos = ArvoreBinariaBusca()
-        self._arvore_usuarios = ArvoreBinariaBusca()
+        # Árvores de busca (BST ou AVL) para conteúdos e usuários
+        self._arvore_conteudos = classe_indice()
+        self._arvore_usuarios = classe_indice()
         # Fila para armazenar linhas brutas do CSV
         self._fila_interacoes_brutas = Fila()
         # Contador para gerar IDs para plataformas
         self._proximo_id_plataforma = 1
+        # Armazenamento colunar das interações e motor de agregação sobre ele
+        self._armazenamento_colunar = ArmazenamentoColunarInteracoes()
+        self._motor_agregacao = MotorAgregacao(self._armazenamento_colunar)
+        # Índice invertido dos nomes dos conteúdos (id_conteudo -> nome)
+        self._indice_nomes = IndiceTexto()
+        # Índices secundários: id_plataforma -> ids de conteúdos e categoria -> ids de conteúdos
+        self._indice_plataforma_conteudos = {}
+        self._indice_categoria_conteudos = {}
+        # Rankings de recomendação por categoria, atualizados na ingestão
+        self._motor_recomendacao = MotorRecomendacao()
+        # Plataformas por nome normalizado (minúsculas), para buscas sem diferenciar maiúsculas
+        self._plataformas_por_nome_normalizado = {}
+        # Durações válidas (> 0) por id de plataforma, acumuladas durante a ingestão
+        self._duracoes_por_plataforma = {}
+        # Agregados por hora (conteúdo, plataforma e tipo) para relatórios por período
+        self._indice_temporal = IndiceTemporal(self._armazenamento_colunar)
+        # Conteúdos em alta na janela deslizante, atualizados a cada interação
+        self._motor_tendencias = MotorTendencias()
+        # Usuários únicos aproximados (HyperLogLog) por conteúdo, plataforma, categoria e hora
+        self._usuarios_unicos = EstimadorUsuariosUnicos(self._armazenamento_colunar)
+        # Usuários, conteúdos e pares mais ativos em memória limitada (Space-Saving)
+        self._mais_ativos = MotorMaisAtivos(self._armazenamento_colunar)
+        # Posição da última ingestão incremental do CSV (offset, linhas, cabeçalho...)
+        self._checkpoint_csv = None
 
     # Plataforma continua dicionário, pois poucas plataformas
     def cadastrar_plataforma(self, nome_plataforma):
         if nome_plataforma not in self._plataformas_registradas:
             nova = Plataforma(nome_plataforma, self._proximo_id_plataforma)
             self._plataformas_registradas[nome_plataforma] = nova
+            self._plataformas_por_nome_normalizado.setdefault(nova.nome_plataforma.lower(), nova)
             self._proximo_id_plataforma += 1
+            self._armazenamento_colunar.registrar_plataforma(nova)
         return self._plataformas_registradas[nome_plataforma]
 
     def obter_plataforma(self, nome_plataforma):
@@ -53,168 +116,544 @@ class SistemaAnaliseEngajamento:
 
     def processar_interacoes_da_fila(self):
         """
-        Processa as linhas da fila, criando objetos Plataforma, Conteudo, Usuario e Interacao.
+        Processa as linhas da fila, criando objetos Plataforma, Conteudo e Usuario e
+        registrando as interações no armazenamento colunar.
         Complexidade: O(m log n), sendo m o número de interações e n o número de conteúdos/usuários,
-        pois inserções e buscas na BST são O(log n) no caso médio.
+        pois inserções e buscas na AVL são O(log n) no pior caso (na BST simples, apenas no caso médio).
         """
-        while not self._fila_interacoes_brutas.esta_vazia():
-            linha = self._fila_interacoes_brutas.desenfileirar()
-            try:
-                id_usuario = int(linha['id_usuario'])
-                id_conteudo = int(linha['id_conteudo'])
-                nome_conteudo = linha['nome_conteudo']
-                timestamp = linha['timestamp_interacao']
-                tipo = linha['tipo_interacao']
-
-                valor_duracao = linha['watch_duration_seconds']
-                duracao = int(valor_duracao) if valor_duracao.strip().isdigit() and int(valor_duracao) >= 0 else 0
-
-                comentario = linha['comment_text']
-                nome_plataforma = linha['plataforma']
-                categoria = linha['categoria'].strip().lower()
-                plataforma = self.obter_plataforma(nome_plataforma)
-
-                tipo_conteudo = linha['tipo_conteudo'].strip().lower()
-
-                # Buscar Conteudo na BST
-                conteudo = self._arvore_conteudos.buscar(id_conteudo)
-                if conteudo is None:
-                    # Criar conteúdo conforme tipo (default Video)
-                    if tipo_conteudo == "podcast":
-                        conteudo = Podcast(id_conteudo, nome_conteudo, 0, categoria)
-                    elif tipo_conteudo == "artigo":
-                        conteudo = Artigo(id_conteudo, nome_conteudo, 0, categoria)
-                    else:
-                        conteudo = Video(id_conteudo, nome_conteudo, 0, categoria)
+        self._processar_fila(self._fila_interacoes_brutas)
+
+    def carregar_e_processar_em_lotes(self, caminho_arquivo, tamanho_lote=10000, callback_progresso=None):
+        """
+        Modo streaming: lê o CSV (leitor_csv.ler_csv_mmap) e processa as linhas em lotes de até `tamanho_lote`,
+        usando uma fila limitada. Cada lote é processado assim que a fila enche, então
+        o pico de memória das linhas brutas depende do tamanho do lote, e não do arquivo.
+
+        Parâmetros:
+            caminho_arquivo (str): caminho do CSV
+            tamanho_lote (int): quantidade máxima de linhas brutas em memória
+            callback_progresso (callable): chamado após cada lote com
+                (linhas_processadas, linhas_por_segundo)
+        Retorna:
+            quantidade de linhas lidas do CSV
+        Complexidade: O(m log n), memória adicional O(tamanho_lote)
+        """
+        try:
+            return self._processar_em_lotes(ler_csv_mmap(caminho_arquivo), tamanho_lote, callback_progresso)
+        except FileNotFoundError:
+            print(f"Erro: O arquivo '{caminho_arquivo}' não foi encontrado.")
+        except Exception as e:
+            print(f"Erro ao carregar CSV: {e}")
+        return 0
+
+    def _processar_em_lotes(self, linhas, tamanho_lote=10000, callback_progresso=None):
+        """
+        Consome o iterável de linhas (tuplas do leitor_csv ou dicionários) em lotes de até
+        `tamanho_lote` através de uma fila limitada. Usado pela leitura em lotes e pela
+        ingestão incremental.
+        Retorna:
+            quantidade de linhas consumidas
+        """
+        fila = Fila(capacidade_maxima=tamanho_lote)
+        linhas_processadas = 0
+        inicio = time.perf_counter()
+        # enfileirar_lote para quando a fila enche, sem consumir linhas a mais do leitor
+        while fila.enfileirar_lote(linhas) > 0:
+            linhas_processadas += fila.tamanho()
+            self._processar_fila(fila)
+            if callback_progresso:
+                decorrido = time.perf_counter() - inicio
+                taxa = linhas_processadas / decorrido if decorrido > 0 else 0.0
+                callback_progresso(linhas_processadas, taxa)
+        return linhas_processadas
+
+    def carregar_csv_paralelo(self, caminho_arquivo, processos=None, blocos_por_processo=4):
+        """
+        Modo paralelo: divide o CSV em intervalos de bytes alinhados a limites de linha
+        e processa cada intervalo em um processo separado (ver ingestao_paralela.agregar_bloco),
+        que devolve as colunas do bloco e os agregados parciais de cada conteúdo e usuário.
+        O processo principal só soma esses agregados, na ordem do arquivo, então o
+        resultado (inclusive os ids das interações e as mensagens de erro) é idêntico ao
+        do processamento serial. Os mais ativos (Space-Saving, sensível à ordem das
+        linhas) são atualizados no processo principal sobre as colunas já anexadas, na
+        ordem do arquivo, e também coincidem com os do processamento serial.
+
+        No máximo `processos` blocos ficam aguardando a mesclagem ao mesmo tempo, para
+        que a memória não cresça com a quantidade de blocos.
+
+        Parâmetros:
+            caminho_arquivo (str): caminho do CSV
+            processos (int): número de processos (padrão: número de CPUs); 1 dispensa o pool
+            blocos_por_processo (int): blocos por processo, para equilibrar a carga
+        Retorna:
+            quantidade de linhas lidas do CSV
+        Complexidade: O(m / P) para processar os blocos com P processos
+        + O(m + B · (c + u) log n) para mesclar (B blocos, c e u conteúdos e usuários distintos por bloco)
+        """
+        processos = processos or os.cpu_count() or 1
+        try:
+            campos, intervalos = dividir_em_blocos(caminho_arquivo, processos * blocos_por_processo)
+        except FileNotFoundError:
+            print(f"Erro: O arquivo '{caminho_arquivo}' não foi encontrado.")
+            return 0
 
-                    conteudo._categoria = categoria
-                    self._arvore_conteudos.inserir(conteudo.id_conteudo, conteudo)
+        # Os sketches dos blocos precisam dos mesmos parâmetros dos deste sistema
+        parametros = (self._usuarios_unicos.precisao, self._usuarios_unicos.tamanho_bucket)
+        linhas_processadas = 0
+        try:
+            if processos == 1:
+                for inicio, fim in intervalos:
+                    bloco = agregar_bloco(caminho_arquivo, campos, inicio, fim, *parametros)
+                    linhas_processadas += self._mesclar_bloco(bloco)
+            else:
+                with ProcessPoolExecutor(max_workers=processos) as executor:
+                    # Blocos mesclados na ordem de envio (ordem do arquivo)
+                    pendentes = deque()
+                    for inicio, fim in intervalos:
+                        pendentes.append(executor.submit(agregar_bloco, caminho_arquivo, campos, inicio, fim,
+                                                         *parametros))
+                        if len(pendentes) > processos:
+                            linhas_processadas += self._mesclar_bloco(pendentes.popleft().result())
+                    while pendentes:
+                        linhas_processadas += self._mesclar_bloco(pendentes.popleft().result())
+        except Exception as e:
+            print(f"Erro ao carregar CSV: {e}")
+        finally:
+            # A janela de tendências só depende das interações mais recentes
+            self.configurar_tendencias(self._motor_tendencias.janela_minutos)
+        return linhas_processadas
 
-                # Buscar Usuario na BST
-                usuario = self._arvore_usuarios.buscar(id_usuario)
-                if usuario is None:
-                    usuario = Usuario(id_usuario)
-                    self._arvore_usuarios.inserir(usuario.id_usuario, usuario)
+    @property
+    def checkpoint_csv(self):
+        return self._checkpoint_csv
 
-                # Criar interação e associar
-                interacao = Interacao(id_usuario, timestamp, tipo, duracao, comentario, conteudo, plataforma)
-                conteudo.adicionar_interacao(interacao)
-                usuario.registrar_interacao(interacao)
+    def carregar_incremental(self, caminho_arquivo, caminho_checkpoint=None, tamanho_lote=10000,
+                             callback_progresso=None, arquivo_completo=False):
+        """
+        Modo incremental (append-only): processa apenas as linhas acrescentadas ao CSV
+        desde a última chamada, a partir do offset em bytes guardado no checkpoint.
+        Na primeira chamada (sem checkpoint) o arquivo é processado inteiro.
+        Só são lidos registros completos (terminados por quebra de linha fora de aspas); um
+        registro ainda sendo escrito fica para a próxima chamada. Com arquivo_completo=True
+        (nenhum processo escrevendo no CSV), a última linha sem quebra também é lida.
+
+        Com caminho_checkpoint, o checkpoint é gravado nesse arquivo (JSON pequeno) e relido
+        após reiniciar, desde que corresponda ao estado atual (mesma quantidade de
+        interações, ex.: estado restaurado de um snapshot salvo junto com o checkpoint).
+        Se o arquivo foi truncado ou reescrito, nada é processado e o erro é informado.
+        As linhas novas passam pelo mesmo processamento em lotes de carregar_e_processar_em_lotes
+        (tamanho_lote e callback_progresso têm o mesmo significado).
 
+        Retorna:
+            quantidade de linhas novas lidas
+        Complexidade: O(k log n), k = linhas novas
+        """
+        checkpoint = self._checkpoint_csv
+        if checkpoint is None and caminho_checkpoint:
+            salvo = ler_checkpoint(caminho_checkpoint)
+            if salvo is not None and salvo["interacoes"] == len(self._armazenamento_colunar):
+                checkpoint = salvo
+                Interacao.avancar_proximo_id(salvo["proximo_id_interacao"])
+        if checkpoint is None and len(self._armazenamento_colunar) > 0:
+            print("Erro: não há checkpoint compatível com as interações já carregadas.")
+            return 0
+
+        try:
+            campos, inicio, fim = localizar_novas_linhas(caminho_arquivo, checkpoint, arquivo_completo)
+        except FileNotFoundError:
+            print(f"Erro: O arquivo '{caminho_arquivo}' não foi encontrado.")
+            return 0
+        except ValueError as e:
+            print(f"Erro: {e} Recarregue o arquivo completo.")
+            return 0
+        if campos is None:
+            return 0
+
+        linhas_novas = self._processar_em_lotes(ler_csv_mmap(caminho_arquivo, campos, inicio, fim),
+                                                tamanho_lote, callback_progresso)
+
+        self._checkpoint_csv = {
+            "offset": fim,
+            "linhas": (checkpoint["linhas"] if checkpoint else 0) + linhas_novas,
+            "interacoes": len(self._armazenamento_colunar),
+            "proximo_id_interacao": Interacao.proximo_id(),
+            "campos": campos,
+            "impressao": calcular_impressao(caminho_arquivo, fim),
+        }
+        if caminho_checkpoint:
+            salvar_checkpoint(caminho_checkpoint, self._checkpoint_csv)
+        return linhas_novas
+
+    def carregar_csv_mmap(self, caminho_arquivo):
+        """
+        Lê o CSV com o leitor sobre mmap (ver leitor_csv.ler_csv_mmap), que gera as
+        tuplas de campos direto dos bytes do arquivo, sem um dicionário por linha.
+        Retorna:
+            quantidade de linhas lidas do CSV
+        Complexidade: O(m log n)
+        """
+        try:
+            return self._processar_em_lotes(ler_csv_mmap(caminho_arquivo))
+        except FileNotFoundError:
+            print(f"Erro: O arquivo '{caminho_arquivo}' não foi encontrado.")
+        except Exception as e:
+            print(f"Erro ao carregar CSV: {e}")
+        return 0
+
+    def _mesclar_bloco(self, bloco):
+        """
+        Soma ao sistema um BlocoAgregado (ver ingestao_paralela.agregar_bloco).
+
+        Plataformas novas e ids de interação são atribuídos na ordem do arquivo,
+        intercalados com as linhas rejeitadas do bloco, que passam pelo caminho serial
+        (e reportam o erro). Em seguida as colunas são anexadas ao armazenamento, cada
+        conteúdo e usuário do bloco recebe os seus índices de linha e agregados parciais,
+        e os sketches de usuários únicos do bloco são mesclados. Os mais ativos não são
+        mesclados: o MotorMaisAtivos processa as linhas anexadas, na ordem do arquivo.
+        Retorna a quantidade de linhas lidas do bloco.
+        Complexidade: O(k log C + (c + u) log n + s · 2^P), k = linhas, c e u = conteúdos e
+        usuários do bloco, s = sketches HyperLogLog do bloco, C = capacidade dos mais ativos
+        """
+        colunas = bloco.armazenamento
+        ids = array('q')
+        ids_plataforma_locais = [0]
+        proxima_plataforma = 0
+        linhas_com_id = 0
+        for posicao, linha in bloco.rejeitadas + [(len(colunas), None)]:
+            while (proxima_plataforma < len(bloco.plataformas)
+                   and bloco.plataformas[proxima_plataforma][1] < posicao):
+                nome_plataforma = bloco.plataformas[proxima_plataforma][0]
+                ids_plataforma_locais.append(self.obter_plataforma(nome_plataforma).id_plataforma)
+                proxima_plataforma += 1
+            if posicao > linhas_com_id:
+                primeiro_id = Interacao.proximo_id()
+                ids.extend(range(primeiro_id, primeiro_id + posicao - linhas_com_id))
+                Interacao.avancar_proximo_id(primeiro_id + posicao - linhas_com_id)
+                linhas_com_id = posicao
+            if linha is not None:
+                try:
+                    if isinstance(linha, tuple):
+                        self._registrar_interacao(*linha)
+                    else:
+                        self._processar_linha(linha)
+                except Exception as e:
+                    print(f"Erro ao processar linha: {linha} -> {e}")
+
+        armazenamento = self._armazenamento_colunar
+        # Os sketches do bloco valem para as linhas logo após as já indexadas
+        self._usuarios_unicos.atualizar()
+        ids_plataforma = array(armazenamento.ids_plataforma.typecode,
+                               map(ids_plataforma_locais.__getitem__, colunas.ids_plataforma))
+        inicio = armazenamento.anexar(colunas, ids, ids_plataforma)
+        plataformas_por_id = {id_local: armazenamento.obter_plataforma(id_plataforma)
+                              for id_local, id_plataforma in enumerate(ids_plataforma_locais) if id_local}
+
+        conteudos_por_id = {}
+        for id_conteudo, tipo_conteudo, nome_conteudo, categoria, indices, agregados in bloco.conteudos:
+            conteudo = self._arvore_conteudos.buscar(id_conteudo)
+            if conteudo is None:
+                conteudo = self._cadastrar_conteudo(tipo_conteudo, id_conteudo, nome_conteudo, categoria)
+            conteudo._interacoes.acrescentar_indices(indices, inicio)
+            conteudo.mesclar_agregados(agregados)
+            self._motor_recomendacao.atualizar_conteudo(conteudo)
+            conteudos_por_id[id_conteudo] = conteudo
+
+        for id_usuario, indices, agregados in bloco.usuarios:
+            usuario = self._arvore_usuarios.buscar(id_usuario)
+            if usuario is None:
+                usuario = Usuario(id_usuario, armazenamento.nova_sequencia())
+                self._arvore_usuarios.inserir(usuario.id_usuario, usuario)
+            usuario.interacoes_realizadas.acrescentar_indices(indices, inicio)
+            usuario.mesclar_agregados(agregados, plataformas_por_id, conteudos_por_id)
+
+        self._usuarios_unicos.mesclar(bloco.usuarios_unicos, dict(enumerate(ids_plataforma_locais)))
+
+        for id_local, ids_conteudo in bloco.indice_plataforma.items():
+            self._indice_plataforma_conteudos.setdefault(ids_plataforma_locais[id_local], set()).update(ids_conteudo)
+        for id_local, pares in bloco.duracoes.items():
+            id_plataforma = ids_plataforma_locais[id_local]
+            histograma = self._duracoes_por_plataforma.get(id_plataforma)
+            if histograma is None:
+                histograma = self._duracoes_por_plataforma[id_plataforma] = HistogramaDuracoes()
+            for duracao, quantidade in pares:
+                histograma.adicionar(duracao, quantidade)
+        self._mais_ativos.atualizar()
+        return bloco.linhas
+
+    def _processar_fila(self, fila):
+        """
+        Consome todas as linhas da fila informada (dicionários do csv.DictReader ou
+        tuplas já interpretadas pelo leitor_csv) e atualiza os sketches de usuários únicos
+        e os contadores de mais ativos.
+        Complexidade: O(k log n), k = linhas na fila
+        """
+        while not fila.esta_vazia():
+            linha = fila.desenfileirar()
+            try:
+                if isinstance(linha, tuple):
+                    self._registrar_interacao(*linha)
+                else:
+                    self._processar_linha(linha)
             except Exception as e:
                 print(f"Erro ao processar linha: {linha} -> {e}")
+        self._usuarios_unicos.atualizar()
+        self._mais_ativos.atualizar()
+
+    def _processar_linha(self, linha):
+        """
+        Interpreta uma linha do CSV e registra a interação correspondente.
+        Complexidade: O(log n)
+        """
+        self._registrar_interacao(*interpretar_linha(linha))
+
+    def _registrar_interacao(self, id_usuario, id_conteudo, nome_conteudo, timestamp, timestamp_epoch, tipo,
+                             duracao, comentario, nome_plataforma, categoria, tipo_conteudo):
+        """
+        Cria (ou reaproveita) Plataforma, Conteudo e Usuario a partir dos campos já
+        interpretados (ver leitor_csv.interpretar_linha) e registra a interação no
+        armazenamento colunar.
+        Complexidade: O(log n)
+        """
+        plataforma = self.obter_plataforma(nome_plataforma)
+
+        # A linha entra primeiro nas colunas: se algum valor não couber (ValueError),
+        # nenhum conteúdo ou usuário é criado para ela
+        colunar = self._armazenamento_colunar
+        indice = colunar.adicionar(id_usuario, id_conteudo, plataforma.id_plataforma, tipo,
+                                   timestamp_epoch, duracao, comentario)
+
+        # Buscar Conteudo na árvore
+        conteudo = self._arvore_conteudos.buscar(id_conteudo)
+        if conteudo is None:
+            # O conteúdo guarda apenas os índices das suas linhas (default Video)
+            conteudo = self._cadastrar_conteudo(tipo_conteudo, id_conteudo, nome_conteudo, categoria)
+
+        # Buscar Usuario na árvore
+        usuario = self._arvore_usuarios.buscar(id_usuario)
+        if usuario is None:
+            usuario = Usuario(id_usuario, colunar.nova_sequencia())
+            self._arvore_usuarios.inserir(usuario.id_usuario, usuario)
+
+        # Associar a visão da linha ao conteúdo e ao usuário
+        interacao = colunar.obter(indice)
+        conteudo.adicionar_interacao(interacao)
+        usuario.registrar_interacao(interacao)
+        self._indice_plataforma_conteudos.setdefault(plataforma.id_plataforma, set()).add(id_conteudo)
+        self._motor_recomendacao.atualizar_conteudo(conteudo)
+        self._motor_tendencias.registrar(interacao)
+
+        if duracao > 0:
+            histograma = self._duracoes_por_plataforma.get(plataforma.id_plataforma)
+            if histograma is None:
+                histograma = self._duracoes_por_plataforma[plataforma.id_plataforma] = HistogramaDuracoes()
+            histograma.adicionar(duracao)
+
+    def _cadastrar_conteudo(self, tipo_conteudo, id_conteudo, nome_conteudo, categoria):
+        """
+        Cria um conteúdo ainda não registrado e o insere na árvore e nos índices.
+        Complexidade: O(log n)
+        """
+        conteudo = criar_conteudo(tipo_conteudo, id_conteudo, nome_conteudo, categoria,
+                                  self._armazenamento_colunar.nova_sequencia())
+        self._arvore_conteudos.inserir(conteudo.id_conteudo, conteudo)
+        self._armazenamento_colunar.registrar_conteudo(conteudo)
+        self._indice_nomes.adicionar(conteudo.id_conteudo, conteudo.nome_conteudo)
+        for nome_categoria in conteudo.categorias:
+            self._indice_categoria_conteudos.setdefault(nome_categoria, set()).add(conteudo.id_conteudo)
+        return conteudo
+
+    def salvar_snapshot(self, caminho_snapshot, caminho_csv=None):
+        """
+        Salva o estado processado em um snapshot binário (ver analise/snapshot.py).
+        Se caminho_csv for informado, o snapshot fica associado ao mtime e ao tamanho
+        desse arquivo e é invalidado quando ele mudar.
+        Complexidade: O(m + n + u)
+        """
+        salvar_snapshot(self, caminho_snapshot, caminho_csv)
+
+    @classmethod
+    def carregar_snapshot(cls, caminho_snapshot, caminho_csv=None, tipo_indice="avl", aceitar_acrescimo=False):
+        """
+        Cria um sistema (modo colunar) a partir de um snapshot, sem reprocessar o CSV.
+        Retorna None se o snapshot não existir, for de outra versão ou estiver
+        desatualizado em relação ao CSV. Com aceitar_acrescimo=True, um CSV que apenas
+        cresceu é aceito; as linhas novas são lidas depois com carregar_incremental.
+        O índice temporal, a janela de tendências, os sketches de usuários únicos e os
+        contadores de mais ativos vêm prontos do snapshot (não são reconstruídos a partir das colunas).
+        Complexidade: O(n log n + u log u), sem percorrer as m interações em Python
+        """
+        if not os.path.exists(caminho_snapshot):
+            return None
+        sistema = cls(tipo_indice=tipo_indice)
+        try:
+            if not restaurar_snapshot(sistema, caminho_snapshot, caminho_csv, aceitar_acrescimo):
+                return None
+        except Exception as e:
+            print(f"Erro ao carregar snapshot: {e}")
+            return None
+        return sistema
 
     def gerar_relatorio_engajamento_conteudos(self, top_n=None):
         """
         Gera relatório dos conteúdos com maior engajamento.
         Complexidade:
-        - Percurso em ordem da BST: O(n), n = número de conteúdos
-        - Ordenação Quick Sort: O(n log n) no caso médio
+        - Percurso em ordem da árvore: O(n), n = número de conteúdos
+        - Ordenação Radix Sort (chaves inteiras): O(n · b), ou O(n log k) com top_n = k
         """
-        conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-        if not conteudos:
+        linhas = self.iterar_relatorio_engajamento_conteudos(top_n)
+        primeira = next(linhas, None)
+        if primeira is None:
             print("Nenhum conteúdo registrado para gerar relatório.")
             return
 
-        # Ordenar pelo total de interações
-        conteudos_ordenados = self._quick_sort(
-            conteudos,
-            key=lambda c: c.calcular_total_interacoes_engajamento(),
-            reverse=True
-        )
+        print("\n-> -> RESULTADOS DE ENGAJAMENTO DE CONTEÚDOS <- <-\n")
+        for bloco in chain([primeira], linhas):
+            for texto in bloco:
+                print(texto)
 
+    def iterar_relatorio_engajamento_conteudos(self, top_n=None):
+        """
+        Gera, sob demanda, o bloco de linhas (lista de textos) de cada conteúdo do relatório
+        de engajamento, do mais engajado para o menos engajado.
+        A ordem usa os contadores de engajamento (O(1) por conteúdo); o detalhamento de cada
+        conteúdo (tipos, tempos e comentários) só é calculado quando o bloco é consumido.
+        Complexidade: O(n · b) para ordenar + O(i) por bloco consumido
+        """
+        conteudos = [valor for chave, valor in self._arvore_conteudos.iterar_em_ordem()]
+        if not conteudos:
+            return
+
+        # Ordenar pelo total de interações (com top_n, seleciona apenas os top_n via heap)
+        chave_engajamento = lambda c: c.calcular_total_interacoes_engajamento()
         if top_n:
-            conteudos_ordenados = conteudos_ordenados[:top_n]
+            conteudos_ordenados = selecionar_top_k(conteudos, top_n, key=chave_engajamento)
+        else:
+            # Chaves inteiras: Radix Sort estável
+            conteudos_ordenados = radix_sort(conteudos, key=chave_engajamento, reverse=True)
 
-        print("\n-> -> RESULTADOS DE ENGAJAMENTO DE CONTEÚDOS <- <-\n")
         for conteudo in conteudos_ordenados:
-            print(f"ID: {conteudo.id_conteudo} - {conteudo.nome_conteudo}")
-            print(f"Total de interações: {conteudo.calcular_total_interacoes_engajamento()}")
+            bloco = [f"ID: {conteudo.id_conteudo} - {conteudo.nome_conteudo}",
+                     f"Total de interações: {conteudo.calcular_total_interacoes_engajamento()}"]
 
             contagem_tipos = conteudo.calcular_contagem_por_tipo_interacao()
             if contagem_tipos:
-                print("Interações por tipo:")
+                bloco.append("Interações por tipo:")
                 for tipo, qtd in contagem_tipos.items():
-                    print(f"- {tipo}: {qtd}")
+                    bloco.append(f"- {tipo}: {qtd}")
 
             tempo_total = conteudo.calcular_tempo_total_consumo()
             if tempo_total > 0:
                 tempo_medio = conteudo.calcular_media_tempo_consumo()
-                print(f"Tempo total assistido: {tempo_total} segundos ou {self.converter_segundos(tempo_total)}")
-                print(f"Média de tempo assistido: {tempo_medio:.2f} segundos")
+                bloco.append(f"Tempo total assistido: {tempo_total} segundos ou {self.converter_segundos(tempo_total)}")
+                bloco.append(f"Média de tempo assistido: {tempo_medio:.2f} segundos")
 
             comentarios = conteudo.listar_comentarios()
             if comentarios:
-                print(f"Quantidade de comentários: {len(comentarios)}")
+                bloco.append(f"Quantidade de comentários: {len(comentarios)}")
                 for idx, c in enumerate(comentarios):
-                    print(f"Comentário {idx+1}: {c}")
+                    bloco.append(f"Comentário {idx+1}: {c}")
 
-            print("\n\n")
+            bloco.append("\n\n")
+            yield bloco
 
     def gerar_relatorio_atividade_usuarios(self, top_n=None):
         """
         Gera relatório das atividades dos usuários.
         Complexidade semelhante ao relatório de conteúdos.
         """
-        usuarios = [valor for chave, valor in self._arvore_usuarios.percurso_em_ordem()]
-        if not usuarios:
+        linhas = self.iterar_relatorio_atividade_usuarios()
+        primeira = next(linhas, None)
+        if primeira is None:
             print("Nenhum usuário registrado para gerar relatório.")
             return
 
         print("\n-> -> RESULTADOS DE ATIVIDADE DE USUÁRIOS <- <-\n")
-        for usuario in usuarios:
-            print(f"Usuário (ID): {usuario.id_usuario}")
-            print(f"Número de Interações: {len(usuario.interacoes_realizadas)}")
+        for bloco in chain([primeira], linhas):
+            for texto in bloco:
+                print(texto)
+
+    def iterar_relatorio_atividade_usuarios(self, id_inicial=None, id_final=None):
+        """
+        Gera, sob demanda e em ordem de id, o bloco de linhas (lista de textos) de cada usuário
+        com id_inicial <= id <= id_final (None = sem limite). Só os usuários consumidos são
+        visitados na árvore e detalhados.
+        Complexidade: O(log u) para posicionar (AVL) + O(k) por bloco consumido
+        """
+        for _, usuario in self._arvore_usuarios.iterar_intervalo(id_inicial, id_final):
+            bloco = [f"Usuário (ID): {usuario.id_usuario}",
+                     f"Número de Interações: {len(usuario.interacoes_realizadas)}"]
 
             contagem = usuario.calcular_contagem_por_tipo_interacao()
             if contagem:
-                print("Contagem por tipo de interação:")
+                bloco.append("Contagem por tipo de interação:")
                 for tipo, qtd in contagem.items():
-                    print(f"             {tipo}: {qtd}")
+                    bloco.append(f"             {tipo}: {qtd}")
 
             total_consumo = usuario.calcular_tempo_total_consumo()
             if total_consumo > 0:
                 media_consumo = usuario.calcular_media_tempo_consumo()
-                print(f"Tempo total assistido: {total_consumo} segundos ou {self.converter_segundos(total_consumo)}")
-                print(f"Média de tempo assistido: {media_consumo:.2f} segundos")
+                bloco.append(f"Tempo total assistido: {total_consumo} segundos ou {self.converter_segundos(total_consumo)}")
+                bloco.append(f"Média de tempo assistido: {media_consumo:.2f} segundos")
 
-            comentarios = usuario.listar_comentarios()
-            if comentarios:
-                print(f"Quantidade de comentários: {len(comentarios)}")
+            # Só percorre as interações se houver comentários a exibir
+            if usuario.calcular_quantidade_comentarios():
+                comentarios = usuario.listar_comentarios()
+                bloco.append(f"Quantidade de comentários: {len(comentarios)}")
                 for idx, c in enumerate(comentarios):
-                    print(f"Comentário {idx+1}: {c}")
+                    bloco.append(f"Comentário {idx+1}: {c}")
 
-            conteudos_unicos = usuario.obter_conteudos_unicos_consumidos()
-            if conteudos_unicos:
-                print(f"Conteúdos únicos consumidos: {len(conteudos_unicos)}")
+            total_conteudos_unicos = usuario.contar_conteudos_unicos_consumidos()
+            if total_conteudos_unicos:
+                bloco.append(f"Conteúdos únicos consumidos: {total_conteudos_unicos}")
 
             plataformas_frequentes = usuario.plataformas_mais_frequentes(top_n=5)
             if plataformas_frequentes:
-                print("Top 5 Plataformas Mais Frequentes:")
+                bloco.append("Top 5 Plataformas Mais Frequentes:")
                 for plat, cont in plataformas_frequentes:
-                    print(f"             {plat.nome_plataforma}: {cont} interação(ões)")
+                    bloco.append(f"             {plat.nome_plataforma}: {cont} interação(ões)")
 
-            print("\n\n")
+            bloco.append("\n\n")
+            yield bloco
 
-    def gerar_relatorio_top_conteudos_consumidos(self, n=5):
+    def _valores_conteudos(self, posicao, inicio=None, fim=None):
+        """
+        Retorna [(Conteudo, valor)] em ordem de id, com o valor da posição informada do
+        agregado do IndiceTemporal (contagem de um tipo ou tempo total) no período [inicio, fim).
+        Apenas conteúdos com interações no período aparecem.
+        Complexidade: proporcional à janela (ver IndiceTemporal.agregar) + O(c log c), c = conteúdos na janela
+        """
+        por_conteudo, _ = self._indice_temporal.agregar(inicio, fim)
+        return [(self._armazenamento_colunar.obter_conteudo(id_conteudo), por_conteudo[id_conteudo][posicao])
+                for id_conteudo in sorted(por_conteudo)]
+
+    def _agregados_plataformas(self, inicio=None, fim=None):
+        """
+        Retorna {id_plataforma: agregado} do período (sem a plataforma 0, de interações sem plataforma).
+        """
+        _, por_plataforma = self._indice_temporal.agregar(inicio, fim)
+        por_plataforma.pop(0, None)
+        return por_plataforma
+
+    def gerar_relatorio_top_conteudos_consumidos(self, n=5, inicio=None, fim=None):
         """
         Gera o ranking dos top N conteúdos pelo tempo total consumido.
+        Com inicio/fim, considera apenas as interações do período [inicio, fim).
+        Complexidade: O(n log N), seleção por heap limitado a N elementos
+        (com período, proporcional à janela no IndiceTemporal).
         """
-        conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-        if not conteudos:
+        if inicio is None and fim is None:
+            pares = [(valor, valor.calcular_tempo_total_consumo())
+                     for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
+        else:
+            pares = self._valores_conteudos(IndiceTemporal.POSICAO_TEMPO, inicio, fim)
+        if not pares:
             print("Nenhum conteúdo registrado.")
             return
 
-        conteudos_ordenados = self._quick_sort(
-            conteudos,
-            key=lambda c: c.calcular_tempo_total_consumo(),
-            reverse=True
-        )
-        top = conteudos_ordenados[:n]
+        top = selecionar_top_k(pares, n, key=lambda par: par[1])
 
         print("\n-> -> TOP CONTEÚDOS POR TEMPO TOTAL CONSUMIDO <- <-\n")
-        for idx, c in enumerate(top):
-            tempo_total = c.calcular_tempo_total_consumo()
+        for idx, (c, tempo_total) in enumerate(top):
             print(f"{idx+1}o. {c.nome_conteudo} ({self.converter_segundos(tempo_total)} consumidos)")
     
     def relatorio_comentarios_por_conteudo(self):
@@ -237,21 +676,19 @@ class SistemaAnaliseEngajamento:
                 print("  Nenhum comentário registrado.")
             print()
 
-    def relatorio_plataforma_maior_engajamento(self):
+    def relatorio_plataforma_maior_engajamento(self, inicio=None, fim=None):
         """
-        Exibe a(s) plataforma(s) com maior número de interações no sistema.
+        Exibe a(s) plataforma(s) com maior número de interações no sistema
+        (ou no período [inicio, fim), se informado).
+        Complexidade: O(m), contagem em lote sobre a coluna de plataformas
+        (com período, proporcional à janela no IndiceTemporal).
         """
-        # Dicionário para acumular contagem de interações por plataforma
-        contagem = {}
-
-        # Percorrer todos os conteúdos e suas interações
-        conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-        for conteudo in conteudos:
-            for interacao in conteudo._interacoes:
-                plataforma = interacao.plataforma_interacao
-                if plataforma:
-                    nome = plataforma.nome_plataforma
-                    contagem[nome] = contagem.get(nome, 0) + 1
+        if inicio is None and fim is None:
+            contagem = self._motor_agregacao.contagem_por_plataforma()
+        else:
+            quantidade_tipos = IndiceTemporal.QUANTIDADE_TIPOS
+            contagem = {id_plataforma: sum(agregado[:quantidade_tipos])
+                        for id_plataforma, agregado in self._agregados_plataformas(inicio, fim).items()}
 
         if not contagem:
             print("Nenhuma interação registrada em nenhuma plataforma.")
@@ -259,11 +696,12 @@ class SistemaAnaliseEngajamento:
 
         # Encontrar maior valor
         max_interacoes = max(contagem.values())
-        plataformas_top = [nome for nome, qtd in contagem.items() if qtd == max_interacoes]
+        plataformas_top = [plataforma for plataforma in self.listar_plataformas()
+                           if contagem.get(plataforma.id_plataforma) == max_interacoes]
 
         print("\n-> -> PLATAFORMA(S) COM MAIOR ENGAJAMENTO <- <-\n")
-        for nome in plataformas_top:
-            print(f"Plataforma: {nome} | Total de interações: {max_interacoes}")
+        for plataforma in plataformas_top:
+            print(f"Plataforma: {plataforma.nome_plataforma} | Total de interações: {max_interacoes}")
 
     def relatorio_conteudos_mais_comentados(self, top_n=5):
         """
@@ -274,14 +712,8 @@ class SistemaAnaliseEngajamento:
             print("Nenhum conteúdo registrado.")
             return
 
-        # Ordena os conteúdos pela quantidade de comentários
-        conteudos_ordenados = self._quick_sort(
-            conteudos,
-            key=lambda c: len(c.listar_comentarios()),
-            reverse=True
-        )
-
-        top = conteudos_ordenados[:top_n]
+        # Seleciona os conteúdos pela quantidade de comentários
+        top = selecionar_top_k(conteudos, top_n, key=lambda c: c.calcular_quantidade_comentarios())
 
         print("\n-> -> CONTEÚDOS MAIS COMENTADOS <- <-\n")
         for idx, c in enumerate(top):
@@ -291,33 +723,61 @@ class SistemaAnaliseEngajamento:
                 print(f"   Comentário {i+1}: {texto}")
             print()
 
-    def relatorio_tempo_medio_consumo_por_plataforma(self):
+    def estatisticas_consumo_por_plataforma(self):
+        """
+        Retorna {nome_plataforma: {"media", "mediana", "p95", "total", "quantidade"}}
+        das durações válidas (> 0), a partir dos acumuladores mantidos na ingestão.
+        Plataformas sem dados de consumo não aparecem no resultado.
+        Complexidade: O(p × d), p = plataformas, d = durações distintas por plataforma;
+        não percorre as interações.
         """
-        Exibe o tempo médio de consumo por plataforma.
+        estatisticas = {}
+        for plataforma in self.listar_plataformas():
+            histograma = self._duracoes_por_plataforma.get(plataforma.id_plataforma)
+            if histograma is None or histograma.contagem == 0:
+                continue
+            estatisticas[plataforma.nome_plataforma] = {
+                "media": histograma.media(),
+                "mediana": histograma.mediana(),
+                "p95": histograma.percentil(95),
+                "total": histograma.soma,
+                "quantidade": histograma.contagem,
+            }
+        return estatisticas
+
+    def relatorio_tempo_medio_consumo_por_plataforma(self, inicio=None, fim=None):
+        """
+        Exibe o tempo médio (e a mediana e o p95) de consumo por plataforma.
+        Com inicio/fim, exibe apenas a média do período [inicio, fim), calculada
+        pelos agregados do IndiceTemporal (os histogramas cobrem todo o histórico).
+        Complexidade: O(p × d), em uma única passada pelos acumuladores por plataforma.
         """
         plataformas = self.listar_plataformas()
         if not plataformas:
             print("Nenhuma plataforma registrada.")
             return
 
+        if inicio is not None or fim is not None:
+            agregados = self._agregados_plataformas(inicio, fim)
+            print("\n-> -> TEMPO MÉDIO DE CONSUMO POR PLATAFORMA (PERÍODO) <- <-\n")
+            for plataforma in plataformas:
+                agregado = agregados.get(plataforma.id_plataforma)
+                if agregado and agregado[IndiceTemporal.POSICAO_DURACOES]:
+                    media = agregado[IndiceTemporal.POSICAO_TEMPO] / agregado[IndiceTemporal.POSICAO_DURACOES]
+                    print(f"{plataforma.nome_plataforma}: {media:.2f} segundos em média")
+                else:
+                    print(f"{plataforma.nome_plataforma}: Sem dados de consumo.")
+            return
+
+        estatisticas = self.estatisticas_consumo_por_plataforma()
+
         print("\n-> -> TEMPO MÉDIO DE CONSUMO POR PLATAFORMA <- <-\n")
 
         for plataforma in plataformas:
-            total_tempo = 0
-            total_interacoes = 0
-
-            conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-            for conteudo in conteudos:
-                for interacao in conteudo._interacoes:
-                    if interacao.plataforma_interacao == plataforma:
-                        duracao = interacao.watch_duration_seconds
-                        if isinstance(duracao, int) and duracao > 0:
-                            total_tempo += duracao
-                            total_interacoes += 1
-
-            if total_interacoes > 0:
-                media = total_tempo / total_interacoes
-                print(f"{plataforma.nome_plataforma}: {media:.2f} segundos em média")
+            dados = estatisticas.get(plataforma.nome_plataforma)
+            if dados:
+                print(f"{plataforma.nome_plataforma}: {dados['media']:.2f} segundos em média "
+                      f"(mediana: {dados['mediana']:.1f} s, p95: {dados['p95']} s)")
             else:
                 print(f"{plataforma.nome_plataforma}: Sem dados de consumo.")
 
@@ -325,14 +785,16 @@ class SistemaAnaliseEngajamento:
     def _ordenar_alfabeticamente_az(self, lista, atributo):
         """
         Ordena uma lista de objetos em ordem alfabética A → Z com base no atributo fornecido.
+        Merge Sort estável: nomes iguais mantêm a ordem original.
         """
-        return self._quick_sort(lista, key=lambda obj: getattr(obj, atributo).lower(), reverse=False)
+        return merge_sort(lista, key=lambda obj: getattr(obj, atributo).lower(), reverse=False)
 
     def _ordenar_alfabeticamente_za(self, lista, atributo):
         """
         Ordena uma lista de objetos em ordem alfabética Z → A com base no atributo fornecido.
+        Merge Sort estável: nomes iguais mantêm a ordem original.
         """
-        return self._quick_sort(lista, key=lambda obj: getattr(obj, atributo).lower(), reverse=True)
+        return merge_sort(lista, key=lambda obj: getattr(obj, atributo).lower(), reverse=True)
     
 
     def relatorio_conteudos_ordenados_por_nome(self, ordem='AZ'):
@@ -361,129 +823,307 @@ class SistemaAnaliseEngajamento:
             print(f"{idx+1} - {conteudo.nome_conteudo}")
 
     
-    def relatorio_total_interacoes_por_tipo_conteudo(self):
+    def relatorio_total_interacoes_por_tipo_conteudo(self, inicio=None, fim=None):
         """
         Exibe o total de interações agrupadas por tipo de conteúdo (Video, Podcast, Artigo).
+        Com inicio/fim, conta apenas as interações do período [inicio, fim).
+        Complexidade: O(n), pois usa apenas a quantidade de interações de cada conteúdo
+        (com período, proporcional à janela no IndiceTemporal).
         """
         contagem = {"Video": 0, "Podcast": 0, "Artigo": 0, "Outro": 0}
 
-        conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-        for conteudo in conteudos:
+        if inicio is None and fim is None:
+            pares = [(valor, len(valor._interacoes)) for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
+        else:
+            por_conteudo, _ = self._indice_temporal.agregar(inicio, fim)
+            quantidade_tipos = IndiceTemporal.QUANTIDADE_TIPOS
+            pares = [(self._armazenamento_colunar.obter_conteudo(id_conteudo), sum(agregado[:quantidade_tipos]))
+                     for id_conteudo, agregado in por_conteudo.items()]
+        for conteudo, quantidade in pares:
             tipo = type(conteudo).__name__
             if tipo in contagem:
-                contagem[tipo] += len(conteudo._interacoes)
+                contagem[tipo] += quantidade
             else:
-                contagem["Outro"] += len(conteudo._interacoes)
+                contagem["Outro"] += quantidade
 
         print("\n-> -> TOTAL DE INTERAÇÕES POR TIPO DE CONTEÚDO <- <-\n")
         for tipo, qtd in contagem.items():
             print(f"{tipo}: {qtd} interações")
 
-    def relatorio_top_conteudos_mais_visualizados(self, top_n=5):
+    def _contagens_do_tipo(self, tipo, inicio=None, fim=None):
         """
-        Exibe os top N conteúdos com maior número de visualizações iniciadas ('view_start').
+        Retorna [(Conteudo, quantidade de interações do tipo)] em ordem de id,
+        de todo o histórico ou apenas do período [inicio, fim).
         """
-        conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-        if not conteudos:
+        if inicio is None and fim is None:
+            return [(valor, valor.contar_interacoes_do_tipo(tipo))
+                    for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
+        return self._valores_conteudos(ArmazenamentoColunarInteracoes.CODIGO_POR_TIPO[tipo], inicio, fim)
+
+    def relatorio_top_conteudos_mais_visualizados(self, top_n=5, inicio=None, fim=None):
+        """
+        Exibe os top N conteúdos com maior número de visualizações iniciadas ('view_start'),
+        opcionalmente apenas no período [inicio, fim).
+        """
+        pares = self._contagens_do_tipo("view_start", inicio, fim)
+        if not pares:
             print("Nenhum conteúdo disponível.")
             return
 
-        # Ordenar pelo número de interações do tipo 'view_start'
-        conteudos_ordenados = self._quick_sort(
-            conteudos,
-            key=lambda c: c.calcular_contagem_por_tipo_interacao().get("view_start", 0),
-            reverse=True
-        )
-
-        top = conteudos_ordenados[:top_n]
+        # Selecionar pelo número de interações do tipo 'view_start'
+        top = selecionar_top_k(pares, top_n, key=lambda par: par[1])
 
         print("\n-> -> TOP CONTEÚDOS MAIS VISUALIZADOS (view_start) <- <-\n")
-        for idx, c in enumerate(top):
-            num_views = c.calcular_contagem_por_tipo_interacao().get("view_start", 0)
+        for idx, (c, num_views) in enumerate(top):
             print(f"{idx+1}o. {c.nome_conteudo} - {num_views} visualização(ões) iniciadas")
 
-    def relatorio_top_conteudos_mais_curtidos(self, top_n=5):
+    def relatorio_top_conteudos_mais_curtidos(self, top_n=5, inicio=None, fim=None):
         """
-        Exibe os top N conteúdos com mais curtidas ('like').
+        Exibe os top N conteúdos com mais curtidas ('like'), opcionalmente apenas no período [inicio, fim).
         """
-        conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
-        if not conteudos:
+        pares = self._contagens_do_tipo("like", inicio, fim)
+        if not pares:
             print("Nenhum conteúdo disponível.")
             return
 
-        # Ordenar pelos likes
-        conteudos_ordenados = self._quick_sort(
-            conteudos,
-            key=lambda c: c.calcular_contagem_por_tipo_interacao().get("like", 0),
-            reverse=True
-        )
-
-        top = conteudos_ordenados[:top_n]
+        # Selecionar pelos likes
+        top = selecionar_top_k(pares, top_n, key=lambda par: par[1])
 
         print("\n-> -> TOP CONTEÚDOS MAIS CURTIDOS <- <-\n")
-        for idx, c in enumerate(top):
-            total_likes = c.calcular_contagem_por_tipo_interacao().get("like", 0)
+        for idx, (c, total_likes) in enumerate(top):
             print(f"{idx+1}o. {c.nome_conteudo} - {total_likes} curtida(s)")
 
-    def buscar_conteudo_por_nome(self, texto_busca):
+    def buscar_conteudo_por_nome(self, texto_busca, apenas_prefixo=False):
         """
-        Pesquisa e retorna uma lista de conteúdos cujo nome contenha o texto informado.
+        Pesquisa e retorna uma lista de conteúdos (em ordem de id) cujo nome contenha o texto informado.
+        A busca ignora maiúsculas e acentos ("jornal" encontra "Jornal Nacional").
+        Com apenas_prefixo=True, exige que alguma palavra do nome comece com o texto.
+        Complexidade: proporcional às listas de postagem consultadas e aos r resultados
+        (O(r log r) para ordená-los), sem percorrer os demais conteúdos.
         """
-        texto_busca = texto_busca.lower()  # Busca case-insensitive
-        resultados = []
-
-        # Retorna lista de tuplas (chave, valor)
-        todos_conteudos = self._arvore_conteudos.percurso_em_ordem()
-
-        # Itera desempacotando a tupla para acessar o objeto Conteudo (valor)
-        for _, conteudo in todos_conteudos:
-            if texto_busca in conteudo.nome_conteudo.lower():
-                resultados.append(conteudo)
-
-        return resultados
+        if apenas_prefixo:
+            ids = self._indice_nomes.buscar_prefixo(texto_busca)
+        else:
+            ids = self._indice_nomes.buscar(texto_busca)
+        return [self._arvore_conteudos.buscar(id_conteudo) for id_conteudo in sorted(ids)]
 
     def buscar_conteudos_por_plataforma(self, nome_plataforma):
         """
-        Retorna uma lista de conteúdos que tiveram interações associadas à plataforma especificada.
+        Retorna uma lista de conteúdos (em ordem de id) que tiveram interações associadas à plataforma especificada.
+        Complexidade: O(r log n), r = conteúdos encontrados, usando o índice plataforma -> conteúdos.
         """
-        nome_plataforma = nome_plataforma.strip().lower()
-        conteudos_encontrados = set()
-
-        todos_conteudos = [valor for chave, valor in self._arvore_conteudos.percurso_em_ordem()]
+        return self.buscar_conteudos(plataforma=nome_plataforma)
 
-        for conteudo in todos_conteudos:
-            for interacao in conteudo._interacoes:
-                if interacao.plataforma_interacao and interacao.plataforma_interacao.nome_plataforma.lower() == nome_plataforma:
-                    conteudos_encontrados.add(conteudo)
-                    break 
+    def proximos_conteudos(self, id_conteudo, quantidade=50):
+        """
+        Retorna os `quantidade` conteúdos com id maior que `id_conteudo`, em ordem de id
+        (o id informado não precisa existir).
+        Complexidade: O(log n + quantidade)
+        """
+        proximo = self._arvore_conteudos.sucessor(id_conteudo)
+        if proximo is None:
+            return []
+        return [valor for chave, valor in islice(self._arvore_conteudos.iterar_intervalo(proximo[0]), quantidade)]
 
-        return list(conteudos_encontrados)
+    def dividir_usuarios_em_faixas(self, partes):
+        """
+        Divide os ids de usuários em até `partes` faixas (id_inicial, id_final) com a mesma
+        quantidade de usuários, para repartir o relatório de atividade
+        (ver iterar_relatorio_atividade_usuarios).
+        Complexidade: O(partes · log u)
+        """
+        return self._arvore_usuarios.dividir_em_faixas(partes)
 
-    def relatorio_distribuicao_interacoes_por_plataforma(self):
+    def buscar_conteudos(self, plataforma=None, categoria=None):
         """
-        Exibe a distribuição de tipos de interações por plataforma.
+        Retorna os conteúdos (em ordem de id) que atendem a todos os filtros informados:
+        - plataforma: nome da plataforma em que o conteúdo teve interações
+        - categoria: uma das categorias do conteúdo (campo multivalorado, ex.: "Novela,Drama")
+        Os filtros são comparados sem diferenciar maiúsculas. Sem filtros, retorna lista vazia.
+        Complexidade: O(min(p, c) + r log n), interseção dos índices secundários,
+        sendo p e c os tamanhos dos conjuntos filtrados e r o número de resultados.
         """
-        distribuicao = defaultdict(lambda: defaultdict(int))
+        conjuntos = []
+        if plataforma is not None:
+            encontrada = self._plataformas_por_nome_normalizado.get(plataforma.strip().lower())
+            if encontrada is None:
+                return []
+            conjuntos.append(self._indice_plataforma_conteudos.get(encontrada.id_plataforma, set()))
+        if categoria is not None:
+            conjuntos.append(self._indice_categoria_conteudos.get(categoria.strip().lower(), set()))
+        if not conjuntos:
+            return []
 
-        # Percorre todos os conteúdos na BST
-        conteudos = [valor for _, valor in self._arvore_conteudos.percurso_em_ordem()]
-        for conteudo in conteudos:
-            for interacao in conteudo._interacoes:
-                plataforma = interacao.plataforma_interacao.nome_plataforma if interacao.plataforma_interacao else "Desconhecida"
-                tipo = interacao.tipo_interacao
-                distribuicao[plataforma][tipo] += 1
+        conjuntos.sort(key=len)
+        ids = set(conjuntos[0])
+        for conjunto in conjuntos[1:]:
+            ids &= conjunto
+        return [self._arvore_conteudos.buscar(id_conteudo) for id_conteudo in sorted(ids)]
+
+    def relatorio_distribuicao_interacoes_por_plataforma(self, inicio=None, fim=None):
+        """
+        Exibe a distribuição de tipos de interações por plataforma
+        (de todo o histórico ou do período [inicio, fim)).
+        Complexidade: O(m), contagem em lote por (plataforma, tipo)
+        (com período, proporcional à janela no IndiceTemporal).
+        """
+        if inicio is None and fim is None:
+            distribuicao = self._motor_agregacao.distribuicao_tipos_por_plataforma()
+        else:
+            tipos = ArmazenamentoColunarInteracoes.TIPOS_INTERACAO
+            _, por_plataforma = self._indice_temporal.agregar(inicio, fim)
+            distribuicao = {id_plataforma: {tipo: agregado[codigo] for codigo, tipo in enumerate(tipos)
+                                            if agregado[codigo]}
+                            for id_plataforma, agregado in por_plataforma.items()}
 
         print("\nDistribuição de interações por plataforma:\n")
-        for plataforma, tipos in distribuicao.items():
-            print(f"Plataforma: {plataforma}")
-            for tipo, quantidade in tipos.items():
+        for id_plataforma in sorted(distribuicao):
+            plataforma = self._armazenamento_colunar.obter_plataforma(id_plataforma)
+            nome = plataforma.nome_plataforma if plataforma else "Desconhecida"
+            print(f"Plataforma: {nome}")
+            for tipo, quantidade in distribuicao[id_plataforma].items():
                 print(f"- {tipo.capitalize()}: {quantidade}")
             print()
 
+
+    def configurar_tendencias(self, janela_minutos):
+        """
+        Troca a duração da janela de "em alta" e reconstrói as contagens a partir das
+        interações já registradas nessa janela (usando o IndiceTemporal).
+        Complexidade: O(e log e), e = interações na nova janela
+        """
+        motor = MotorTendencias(janela_minutos)
+        armazenamento = self._armazenamento_colunar
+        if len(armazenamento):
+            fim_janela = max(armazenamento.timestamps)
+            motor.avancar_tempo(fim_janela)
+            inicio = fim_janela - int(janela_minutos * 60) + 1
+            for indice in self._indice_temporal.linhas(inicio=inicio):
+                motor.registrar(armazenamento.obter(indice))
+        self._motor_tendencias = motor
+
+    def conteudos_em_alta(self, top_n=10):
+        """
+        Retorna [(Conteudo, interações de engajamento na janela)] dos top_n conteúdos em alta.
+        Complexidade: O(k log k), k = top_n; não percorre o histórico.
+        """
+        return self._motor_tendencias.em_alta(top_n)
+
+    def relatorio_conteudos_em_alta(self, top_n=10):
+        """
+        Exibe os conteúdos em alta na janela deslizante (últimos N minutos dos eventos).
+        """
+        em_alta = self.conteudos_em_alta(top_n)
+        if not em_alta:
+            print("Nenhuma interação de engajamento na janela atual.")
+            return
+        print(f"\n-> -> CONTEÚDOS EM ALTA (últimos {self._motor_tendencias.janela_minutos:g} minutos) <- <-\n")
+        for idx, (conteudo, quantidade) in enumerate(em_alta):
+            print(f"{idx+1}o. {conteudo.nome_conteudo} - {quantidade} interação(ões) de engajamento")
+
+    def configurar_usuarios_unicos(self, precisao):
+        """
+        Troca a precisão dos sketches de usuários únicos (memória de 2^precisao bytes por
+        sketch, erro padrão ~1,04 / sqrt(2^precisao)). Os sketches são refeitos a partir das
+        interações já registradas na próxima consulta.
+        """
+        self._usuarios_unicos = EstimadorUsuariosUnicos(self._armazenamento_colunar, precisao)
+
+    def usuarios_unicos_conteudo(self, id_conteudo):
+        return self._usuarios_unicos.conteudo(id_conteudo)
+
+    def usuarios_unicos_plataforma(self, nome_plataforma):
+        plataforma = self._plataformas_por_nome_normalizado.get(nome_plataforma.strip().lower())
+        return self._usuarios_unicos.plataforma(plataforma.id_plataforma) if plataforma is not None else 0
+
+    def usuarios_unicos_categoria(self, categoria):
+        return self._usuarios_unicos.categoria(categoria)
+
+    def usuarios_unicos_periodo(self, inicio=None, fim=None):
+        """
+        Usuários únicos estimados no período, na granularidade de 1 hora.
+        """
+        return self._usuarios_unicos.periodo(inicio, fim)
+
+    def relatorio_usuarios_unicos(self, top_n=5):
+        """
+        Exibe a estimativa de usuários únicos no total, por plataforma, por categoria
+        e os top N conteúdos com mais usuários únicos.
+        Complexidade: O(s · 2^precisao + n log top_n), s = quantidade de sketches
+        """
+        estimador = self._usuarios_unicos
+        por_conteudo = estimador.estimativas_por_conteudo()
+        if not por_conteudo:
+            print("Nenhuma interação registrada.")
+            return
+
+        print(f"\n-> -> USUÁRIOS ÚNICOS (estimativa, erro padrão ~{estimador.erro_padrao:.1%}) <- <-\n")
+        print(f"Total: {estimador.total()}")
+
+        print("\nPor plataforma:")
+        for id_plataforma, quantidade in sorted(estimador.estimativas_por_plataforma().items()):
+            plataforma = self._armazenamento_colunar.obter_plataforma(id_plataforma)
+            print(f"  {plataforma.nome_plataforma}: {quantidade}")
+
+        print("\nPor categoria:")
+        for categoria, quantidade in sorted(estimador.estimativas_por_categoria().items()):
+            print(f"  {categoria}: {quantidade}")
+
+        top = selecionar_top_k(sorted(por_conteudo.items()), top_n, key=lambda par: par[1])
+        print(f"\nTop {top_n} conteúdos por usuários únicos:")
+        for idx, (id_conteudo, quantidade) in enumerate(top):
+            conteudo = self._armazenamento_colunar.obter_conteudo(id_conteudo)
+            print(f"{idx+1}o. {conteudo.nome_conteudo} - {quantidade} usuário(s)")
+
+    def configurar_mais_ativos(self, capacidade):
+        """
+        Troca a quantidade de contadores por dimensão e critério dos mais ativos. Quanto maior,
+        menor o erro das contagens. Os contadores são refeitos na próxima consulta.
+        """
+        self._mais_ativos = MotorMaisAtivos(self._armazenamento_colunar, capacidade)
+
+    def mais_ativos(self, dimensao, criterio="interacoes", top_n=10):
+        """
+        Retorna [(chave, valor, erro)] dos top_n usuários ('usuarios'), conteúdos ('conteudos')
+        ou pares (id_usuario, id_conteudo) ('pares') por 'interacoes' ou 'tempo'.
+        Complexidade: O(capacidade log top_n), sem percorrer usuários ou conteúdos
+        """
+        return self._mais_ativos.mais_ativos(dimensao, criterio, top_n)
+
+    def relatorio_mais_ativos(self, top_n=5):
+        """
+        Exibe os usuários, conteúdos e pares (usuário, conteúdo) mais ativos por quantidade
+        de interações e por tempo assistido. Valores marcados com '~' são aproximados
+        (limite superior; o erro máximo aparece entre parênteses).
+        """
+        if not len(self._armazenamento_colunar):
+            print("Nenhuma interação registrada.")
+            return
+
+        def descrever(dimensao, chave):
+            if dimensao == "usuarios":
+                return f"Usuário {chave}"
+            if dimensao == "conteudos":
+                return self._armazenamento_colunar.obter_conteudo(chave).nome_conteudo
+            id_usuario, id_conteudo = chave
+            return f"Usuário {id_usuario} - {self._armazenamento_colunar.obter_conteudo(id_conteudo).nome_conteudo}"
+
+        titulos = {"usuarios": "USUÁRIOS", "conteudos": "CONTEÚDOS", "pares": "PARES USUÁRIO/CONTEÚDO"}
+        for dimensao in MotorMaisAtivos.DIMENSOES:
+            for criterio in MotorMaisAtivos.CRITERIOS:
+                print(f"\n-> -> {titulos[dimensao]} MAIS ATIVOS POR "
+                      f"{'INTERAÇÕES' if criterio == 'interacoes' else 'TEMPO ASSISTIDO'} <- <-\n")
+                for idx, (chave, valor, erro) in enumerate(self.mais_ativos(dimensao, criterio, top_n)):
+                    texto = f"{valor} interação(ões)" if criterio == "interacoes" else self.converter_segundos(valor)
+                    if erro:
+                        texto = f"~{texto} (erro máx. {erro})"
+                    print(f"{idx+1}o. {descrever(dimensao, chave)} - {texto}")
+
     def recomendar_conteudos_por_categoria(self, categoria, top_n=5, peso_interacoes=0.6, peso_tempo=0.4):
         """
         Recomenda conteúdos da categoria informada, ordenando por uma métrica combinada
-        de engajamento (número de interações) e tempo total assistido.
+        de engajamento (número de interações) e tempo total assistido, cada um normalizado
+        pelo maior valor da categoria.
 
         Parâmetros:
             categoria (str): categoria desejada para recomendação
@@ -492,36 +1132,13 @@ class SistemaAnaliseEngajamento:
             peso_tempo (float): peso para o tempo total consumido (0 a 1)
         Retorna:
             lista de conteúdos recomendados (objetos Conteudo)
+        Complexidade: O(top_n log top_n) com os pesos padrão (ranking mantido a cada
+        interação, remontado em O(c) se um máximo da categoria mudou); com outros pesos,
+        O(c log c) para recalcular, c = conteúdos da categoria.
         """
-
-        # Obter todos os conteúdos da categoria solicitada
-        conteudos_da_categoria = [
-            conteudo for _, conteudo in self._arvore_conteudos.percurso_em_ordem()
-            if conteudo.categoria and conteudo.categoria.lower() == categoria.lower()
-        ]
-
-        if not conteudos_da_categoria:
+        recomendados = self._motor_recomendacao.recomendar(categoria, top_n, peso_interacoes, peso_tempo)
+        if not recomendados:
             print(f"Nenhum conteúdo encontrado para a categoria '{categoria}'.")
-            return []
-
-        # Calcular métrica combinada para cada conteúdo
-        lista_pontuacoes = []
-        for conteudo in conteudos_da_categoria:
-            total_interacoes = conteudo.calcular_total_interacoes_engajamento()
-            tempo_total = conteudo.calcular_tempo_total_consumo()
-
-            pontuacao = (
-                peso_interacoes * (total_interacoes / max_interacoes) +
-                peso_tempo * (tempo_total / max_tempo)
-            )
-            lista_pontuacoes.append((conteudo, pontuacao))
-
-        # Ordenar pelos scores descendentes
-        lista_pontuacoes.sort(key=lambda x: x[1], reverse=True)
-
-        # Pegar os top_n conteúdos recomendados
-        recomendados = [item[0] for item in lista_pontuacoes[:top_n]]
-
         return recomendados
 
 
@@ -535,43 +1152,3 @@ class SistemaAnaliseEngajamento:
         minutos = int((total_segundos % 3600) // 60)
         segundos = int(total_segundos % 60)
         return f"{horas}:{minutos:02}:{segundos:02}"
-
-    # --- Algoritmos de Ordenação ---
-
-    def _quick_sort(self, array, key=lambda x: x, low=0, high=None, reverse=False):
-        """
-        Quick Sort para ordenar listas.
-        Tempo médio: O(n log n), pior caso: O(n²).
-        """
-        if high is None:
-            high = len(array) - 1
-
-        def partition(arr, low, high):
-            pivot = key(arr[high])
-            i = low - 1
-            for j in range(low, high):
-                if (key(arr[j]) > pivot if reverse else key(arr[j]) < pivot):
-                    i += 1
-                    arr[i], arr[j] = arr[j], arr[i]
-            arr[i+1], arr[high] = arr[high], arr[i+1]
-            return i + 1
-
-        if low < high:
-            pi = partition(array, low, high)
-            self._quick_sort(array, key, low, pi - 1, reverse)
-            self._quick_sort(array, key, pi + 1, high, reverse)
-        return array
-
-    def _insertion_sort(self, array, key=lambda x: x, reverse=False):
-        """
-        Insertion Sort para ordenar listas pequenas.
-        Tempo: O(n²) no geral, eficiente para listas pequenas.
-        """
-        for i in range(1, len(array)):
-            current = array[i]
-            j = i - 1
-            while j >= 0 and ((key(array[j]) < key(current)) if reverse else (key(array[j]) > key(current))):
-                array[j + 1] = array[j]
-                j -= 1
-            array[j + 1] = current
-        return array
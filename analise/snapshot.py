@@ -0,0 +1,287 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+
+from entidades.usuario import Usuario
+from entidades.plataforma import Plataforma
+from entidades.conteudo import Video, Podcast, Artigo
+from entidades.interacao import Interacao
+from analise.mais_ativos import MotorMaisAtivos
+from analise.tendencias import MotorTendencias
+from analise.usuarios_unicos import EstimadorUsuariosUnicos
+from estruturas_dados.histograma import HistogramaDuracoes
+from estruturas_dados.indice_temporal import IndiceTemporal
+
+# Layout do arquivo (little-endian):
+#   cabeçalho:  magic (8s) | versão (H) | reservado (H) | quantidade de seções (I)
+#               | mtime do CSV em ns (q) | tamanho do CSV em bytes (q)
+#   diretório:  por seção, nome (24s) | typecode do array (8s) | offset (q) | tamanho em bytes (q)
+#   seções:     bytes de cada seção, começando em offsets múltiplos de 8
+# As colunas numéricas são gravadas com array.tobytes(), então cada seção pode ser lida
+# direto do arquivo mapeado em memória (memoryview.cast) ou copiada com array.frombytes().
+# As estruturas derivadas das colunas (índice temporal, janela de tendências, sketches
+# HyperLogLog e contadores Space-Saving) também são gravadas, para que a restauração
+# não precise percorrer as interações.
+MAGIC = b"GLOBOSNP"
+VERSAO = 4
+FORMATO_CABECALHO = struct.Struct("<8sHHIqq")
+FORMATO_SECAO = struct.Struct("<24s8sqq")
+ALINHAMENTO = 8
+
+CLASSES_CONTEUDO = {"Video": Video, "Podcast": Podcast, "Artigo": Artigo}
+
+
+def _assinatura_csv(caminho_csv):
+    """
+    Retorna (mtime em ns, tamanho) do CSV de origem, ou (0, 0) se não informado.
+    """
+    if not caminho_csv:
+        return 0, 0
+    info = os.stat(caminho_csv)
+    return info.st_mtime_ns, info.st_size
+
+
+def _agrupar_linhas(coluna_ids, ids_em_ordem):
+    """
+    Agrupa os índices das linhas por id (formato CSR): retorna (ponteiros, indices),
+    em que as linhas do i-ésimo id de ids_em_ordem são indices[ponteiros[i]:ponteiros[i + 1]].
+    Complexidade: O(m), m = linhas
+    """
+    grupos = {}
+    for indice, id_entidade in enumerate(coluna_ids):
+        grupo = grupos.get(id_entidade)
+        if grupo is None:
+            grupo = grupos[id_entidade] = array('q')
+        grupo.append(indice)
+    ponteiros = array('q', [0])
+    indices = array('q')
+    for id_entidade in ids_em_ordem:
+        indices.extend(grupos.get(id_entidade, ()))
+        ponteiros.append(len(indices))
+    return ponteiros, indices
+
+
+def _ordem_de_chegada(entidades, coluna_ids):
+    """
+    Ordena as entidades pela primeira linha em que aparecem, reproduzindo a ordem
+    de inserção original nos índices de nomes, categorias e recomendação.
+    """
+    primeira_linha = {}
+    for indice, id_entidade in enumerate(coluna_ids):
+        if id_entidade not in primeira_linha:
+            primeira_linha[id_entidade] = indice
+    fim = len(coluna_ids)
+    return sorted(entidades, key=lambda par: primeira_linha.get(par[0], fim))
+
+
+def salvar_snapshot(sistema, caminho_snapshot, caminho_csv=None):
+    """
+    Grava o estado processado do sistema (plataformas, conteúdos, usuários, colunas de
+    interações e agregados) em um arquivo binário versionado.
+    O mtime e o tamanho do CSV de origem ficam no cabeçalho, para invalidar o snapshot
+    quando o CSV mudar. A gravação usa um arquivo temporário e troca atômica.
+    Complexidade: O(m + n + u), m = interações, n = conteúdos, u = usuários
+    """
+    armazenamento = sistema._armazenamento_colunar
+    indice_temporal = sistema._indice_temporal.exportar()
+    motor_tendencias = sistema._motor_tendencias
+    agora_tendencias, tendencias = motor_tendencias.exportar()
+    metadados_usuarios_unicos, usuarios_unicos = sistema._usuarios_unicos.exportar()
+    conteudos = _ordem_de_chegada(sistema._arvore_conteudos.percurso_em_ordem(), armazenamento.ids_conteudo)
+    usuarios = _ordem_de_chegada(sistema._arvore_usuarios.percurso_em_ordem(), armazenamento.ids_usuario)
+
+    metadados = {
+        "proximo_id_interacao": Interacao.proximo_id(),
+        "proximo_id_plataforma": sistema._proximo_id_plataforma,
+        "plataformas": [[p.id_plataforma, nome] for nome, p in sistema._plataformas_registradas.items()],
+        "conteudos": [[c.id_conteudo, type(c).__name__, c.nome_conteudo, c.categoria, c.exportar_agregados()]
+                      for _, c in conteudos],
+        "usuarios": [[u.id_usuario, u.exportar_agregados()] for _, u in usuarios],
+        "indice_plataforma": [[id_plataforma, sorted(ids)]
+                              for id_plataforma, ids in sistema._indice_plataforma_conteudos.items()],
+        "duracoes": [[id_plataforma, histograma.exportar()]
+                     for id_plataforma, histograma in sistema._duracoes_por_plataforma.items()],
+        "indice_temporal": {"tamanho_bucket": sistema._indice_temporal.tamanho_bucket,
+                            "linhas_indexadas": len(armazenamento)},
+        "tendencias": {"janela_minutos": motor_tendencias.janela_minutos, "agora": agora_tendencias},
+        "usuarios_unicos": metadados_usuarios_unicos,
+        "mais_ativos": sistema._mais_ativos.exportar(),
+    }
+
+    secoes = [("metadados", "B", json.dumps(metadados, ensure_ascii=False).encode("utf-8"))]
+    for nome, coluna in armazenamento.colunas().items():
+        secoes.append((nome, coluna.typecode, coluna.tobytes()))
+    # Comentários separados por \0 (não aparece em texto vindo do CSV)
+    secoes.append(("comentarios", "B", "\0".join(armazenamento.comentarios).encode("utf-8")))
+    for prefixo, entidades, coluna_ids in (("conteudo", conteudos, armazenamento.ids_conteudo),
+                                           ("usuario", usuarios, armazenamento.ids_usuario)):
+        ponteiros, indices = _agrupar_linhas(coluna_ids, [chave for chave, _ in entidades])
+        secoes.append((prefixo + "_ptr", "q", ponteiros.tobytes()))
+        secoes.append((prefixo + "_idx", "q", indices.tobytes()))
+    for prefixo, colunas in (("tmp_", indice_temporal), ("tend_", tendencias), ("hll_", usuarios_unicos)):
+        for nome, coluna in colunas.items():
+            secoes.append((prefixo + nome, coluna.typecode, coluna.tobytes()))
+
+    mtime_csv, tamanho_csv = _assinatura_csv(caminho_csv)
+    posicao = FORMATO_CABECALHO.size + FORMATO_SECAO.size * len(secoes)
+    diretorio = []
+    for nome, typecode, dados in secoes:
+        posicao += -posicao % ALINHAMENTO
+        diretorio.append(FORMATO_SECAO.pack(nome.encode("ascii"), typecode.encode("ascii"), posicao, len(dados)))
+        posicao += len(dados)
+
+    caminho_temporario = caminho_snapshot + ".tmp"
+    with open(caminho_temporario, "wb") as arquivo:
+        arquivo.write(FORMATO_CABECALHO.pack(MAGIC, VERSAO, 0, len(secoes), mtime_csv, tamanho_csv))
+        arquivo.write(b"".join(diretorio))
+        for _, _, dados in secoes:
+            arquivo.write(b"\0" * (-arquivo.tell() % ALINHAMENTO))
+            arquivo.write(dados)
+    os.replace(caminho_temporario, caminho_snapshot)
+
+
+def ler_secoes(caminho_snapshot, caminho_csv=None, aceitar_acrescimo=False):
+    """
+    Mapeia o snapshot em memória e retorna (mapa, {nome: (typecode, memoryview)}),
+    ou None se o arquivo não for um snapshot desta versão ou se o CSV de origem
+    tiver sido modificado depois dele (mtime mais novo ou tamanho diferente).
+    Com aceitar_acrescimo=True, um CSV maior que o registrado é aceito (arquivo
+    append-only; a integridade do trecho antigo é conferida na ingestão incremental).
+    As memoryviews apontam para o arquivo mapeado, sem cópia; o chamador deve
+    liberá-las antes de fechar o mapa.
+    """
+    try:
+        mtime_csv, tamanho_csv = _assinatura_csv(caminho_csv)
+    except OSError:
+        return None
+    with open(caminho_snapshot, "rb") as arquivo:
+        if os.fstat(arquivo.fileno()).st_size < FORMATO_CABECALHO.size:
+            return None
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, versao, _, quantidade, mtime_salvo, tamanho_salvo = FORMATO_CABECALHO.unpack_from(mapa, 0)
+    if magic != MAGIC or versao != VERSAO:
+        mapa.close()
+        return None
+    if caminho_csv:
+        cresceu = aceitar_acrescimo and tamanho_csv > tamanho_salvo
+        if not cresceu and (mtime_csv > mtime_salvo or tamanho_csv != tamanho_salvo):
+            mapa.close()
+            return None
+
+    visao = memoryview(mapa)
+    secoes = {}
+    for i in range(quantidade):
+        nome, typecode, offset, tamanho = FORMATO_SECAO.unpack_from(
+            mapa, FORMATO_CABECALHO.size + i * FORMATO_SECAO.size)
+        secoes[nome.rstrip(b"\0").decode("ascii")] = (typecode.rstrip(b"\0").decode("ascii"),
+                                                       visao[offset:offset + tamanho])
+    visao.release()
+    return mapa, secoes
+
+
+def _para_array(secao):
+    typecode, dados = secao
+    coluna = array(typecode)
+    coluna.frombytes(dados)
+    return coluna
+
+
+def restaurar_snapshot(sistema, caminho_snapshot, caminho_csv=None, aceitar_acrescimo=False):
+    """
+    Carrega o snapshot em um sistema recém-criado em modo colunar.
+    As colunas são copiadas do arquivo mapeado em blocos (array.frombytes) e cada
+    Conteudo/Usuario recebe a sua sequência de linhas e os agregados já calculados,
+    sem reprocessar as interações. O índice temporal (buckets montados no primeiro
+    acesso), a janela de tendências, os sketches de usuários únicos e os contadores
+    de mais ativos também são restaurados prontos.
+    Retorna False se o snapshot for inválido ou estiver desatualizado.
+    As árvores são montadas já balanceadas com a_partir_de_ordenados, em vez de uma
+    inserção por chave.
+    Complexidade: O(n log n + u log u) para ordenar os ids (sort em C), O(n + u) para
+    montar as árvores, O(B + e) para o índice temporal e as tendências (B = buckets,
+    e = eventos na janela), O(s · 2^P) para os s sketches HyperLogLog, O(C) para os
+    contadores de mais ativos, mais a cópia dos bytes das colunas
+    """
+    lido = ler_secoes(caminho_snapshot, caminho_csv, aceitar_acrescimo)
+    if lido is None:
+        return False
+    mapa, secoes = lido
+    try:
+        metadados = json.loads(bytes(secoes["metadados"][1]).decode("utf-8"))
+        armazenamento = sistema._armazenamento_colunar
+        colunas = {nome: _para_array(secoes[nome]) for nome in armazenamento.NOMES_COLUNAS}
+        texto_comentarios = bytes(secoes["comentarios"][1]).decode("utf-8")
+        comentarios = texto_comentarios.split("\0") if texto_comentarios else []
+        armazenamento.restaurar(colunas, comentarios)
+        linhas = {nome: _para_array(secoes[nome])
+                  for nome in ("conteudo_ptr", "conteudo_idx", "usuario_ptr", "usuario_idx")}
+        indice_temporal = {nome[len("tmp_"):]: _para_array(secao)
+                           for nome, secao in secoes.items() if nome.startswith("tmp_")}
+        tendencias = {nome[len("tend_"):]: _para_array(secao)
+                      for nome, secao in secoes.items() if nome.startswith("tend_")}
+        usuarios_unicos = {nome[len("hll_"):]: _para_array(secao)
+                           for nome, secao in secoes.items() if nome.startswith("hll_")}
+    finally:
+        for _, dados in secoes.values():
+            dados.release()
+        mapa.close()
+
+    Interacao.avancar_proximo_id(metadados["proximo_id_interacao"])
+    sistema._proximo_id_plataforma = metadados["proximo_id_plataforma"]
+    plataformas_por_id = {}
+    for id_plataforma, nome in metadados["plataformas"]:
+        plataforma = Plataforma(nome, id_plataforma)
+        plataformas_por_id[id_plataforma] = plataforma
+        sistema._plataformas_registradas[nome] = plataforma
+        sistema._plataformas_por_nome_normalizado.setdefault(plataforma.nome_plataforma.lower(), plataforma)
+        armazenamento.registrar_plataforma(plataforma)
+
+    conteudos_por_id = {}
+    pares_conteudos = []
+    ponteiros, indices = linhas["conteudo_ptr"], linhas["conteudo_idx"]
+    for i, (id_conteudo, classe, nome, categoria, agregados) in enumerate(metadados["conteudos"]):
+        sequencia = armazenamento.nova_sequencia(indices[ponteiros[i]:ponteiros[i + 1]])
+        conteudo = CLASSES_CONTEUDO.get(classe, Video)(id_conteudo, nome, 0, categoria, sequencia)
+        conteudo.restaurar_agregados(agregados)
+        conteudos_por_id[id_conteudo] = conteudo
+        pares_conteudos.append((id_conteudo, conteudo))
+        armazenamento.registrar_conteudo(conteudo)
+        sistema._indice_nomes.adicionar(id_conteudo, nome)
+        for nome_categoria in conteudo.categorias:
+            sistema._indice_categoria_conteudos.setdefault(nome_categoria, set()).add(id_conteudo)
+        sistema._motor_recomendacao.atualizar_conteudo(conteudo)
+
+    pares_conteudos.sort(key=lambda par: par[0])
+    sistema._arvore_conteudos = type(sistema._arvore_conteudos).a_partir_de_ordenados(pares_conteudos)
+
+    pares_usuarios = []
+    ponteiros, indices = linhas["usuario_ptr"], linhas["usuario_idx"]
+    for i, (id_usuario, agregados) in enumerate(metadados["usuarios"]):
+        usuario = Usuario(id_usuario, armazenamento.nova_sequencia(indices[ponteiros[i]:ponteiros[i + 1]]))
+        usuario.restaurar_agregados(agregados, plataformas_por_id, conteudos_por_id)
+        pares_usuarios.append((id_usuario, usuario))
+    pares_usuarios.sort(key=lambda par: par[0])
+    sistema._arvore_usuarios = type(sistema._arvore_usuarios).a_partir_de_ordenados(pares_usuarios)
+
+    for id_plataforma, ids in metadados["indice_plataforma"]:
+        sistema._indice_plataforma_conteudos[id_plataforma] = set(ids)
+    for id_plataforma, pares in metadados["duracoes"]:
+        sistema._duracoes_por_plataforma[id_plataforma] = HistogramaDuracoes.a_partir_de(pares)
+
+    # Estruturas derivadas gravadas prontas: as interações não são reindexadas
+    dados_temporal = metadados["indice_temporal"]
+    sistema._indice_temporal = IndiceTemporal(armazenamento, dados_temporal["tamanho_bucket"])
+    sistema._indice_temporal.restaurar(indice_temporal, dados_temporal["linhas_indexadas"])
+    dados_tendencias = metadados["tendencias"]
+    sistema._motor_tendencias = MotorTendencias.a_partir_de(dados_tendencias["janela_minutos"],
+                                                            dados_tendencias["agora"], tendencias, conteudos_por_id)
+    dados_usuarios_unicos = metadados["usuarios_unicos"]
+    sistema._usuarios_unicos = EstimadorUsuariosUnicos(armazenamento, dados_usuarios_unicos["precisao"],
+                                                       dados_usuarios_unicos["tamanho_bucket"])
+    sistema._usuarios_unicos.restaurar(dados_usuarios_unicos, usuarios_unicos)
+    sistema._mais_ativos = MotorMaisAtivos(armazenamento, metadados["mais_ativos"]["capacidade"])
+    sistema._mais_ativos.restaurar(metadados["mais_ativos"])
+    return True
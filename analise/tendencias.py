@@ -0,0 +1,129 @@
+from array import array
+from collections import Counter
+from heapq import heapify, heappush, heappop
+
+from entidades.conteudo import Conteudo
+from estruturas_dados.heap_indexado import HeapIndexado
+
+
+class MotorTendencias:
+    """
+    Conteúdos "em alta": contagem das interações de engajamento (as mesmas de
+    Conteudo.calcular_total_interacoes_engajamento) na janela deslizante
+    (agora - janela, agora], atualizada a cada interação recebida.
+
+    O tempo é o dos próprios eventos: "agora" é o maior timestamp já visto (ou o
+    informado em avancar_tempo). Cada evento entra em uma fila de expiração (heap
+    por timestamp), então eventos fora de ordem também expiram no momento certo;
+    eventos que já chegam fora da janela são ignorados.
+
+    As contagens da janela ficam em um HeapIndexado de máximo com prioridade
+    (contagem, -id_conteudo): empates ficam em ordem de id.
+
+    Complexidades:
+    - registrar: O(log n + log e) amortizado, n = conteúdos na janela, e = eventos na janela
+    - em_alta(k): O(k log k)
+    - exportar / a_partir_de (snapshot): O(e)
+    """
+
+    JANELA_PADRAO_MINUTOS = 60
+
+    def __init__(self, janela_minutos=JANELA_PADRAO_MINUTOS):
+        if janela_minutos <= 0:
+            raise ValueError("A janela deve ter duração positiva.")
+        self._janela_segundos = int(janela_minutos * 60)
+        self._agora = None
+        self._expiracoes = []             # heap de (timestamp_epoch, id_conteudo)
+        self._contagens = HeapIndexado(maximo=True)
+        self._conteudos = {}              # id_conteudo -> Conteudo (apenas os da janela)
+
+    @property
+    def janela_minutos(self):
+        return self._janela_segundos / 60
+
+    @property
+    def agora(self):
+        return self._agora
+
+    def __len__(self):
+        # Quantidade de eventos de engajamento dentro da janela
+        return len(self._expiracoes)
+
+    def registrar(self, interacao):
+        """
+        Conta a interação (Interacao ou visão colunar), se for de engajamento e estiver na janela.
+        """
+        if interacao.tipo_interacao not in Conteudo.TIPOS_ENGAJAMENTO:
+            return
+        conteudo = interacao.conteudo_associado
+        if conteudo is None:
+            return
+        timestamp = interacao.timestamp_epoch
+        if self._agora is None or timestamp > self._agora:
+            self._agora = timestamp
+        if timestamp <= self._agora - self._janela_segundos:
+            return
+
+        id_conteudo = conteudo.id_conteudo
+        heappush(self._expiracoes, (timestamp, id_conteudo))
+        contagem = self._contagens.prioridade(id_conteudo)[0] + 1 if id_conteudo in self._contagens else 1
+        self._contagens.inserir_ou_atualizar(id_conteudo, (contagem, -id_conteudo))
+        self._conteudos[id_conteudo] = conteudo
+        self._expirar()
+
+    def avancar_tempo(self, agora):
+        """
+        Move o fim da janela para `agora` (segundos desde a época), expirando os eventos antigos.
+        Não faz o tempo voltar.
+        """
+        if self._agora is None or agora > self._agora:
+            self._agora = agora
+        self._expirar()
+
+    def _expirar(self):
+        limite = self._agora - self._janela_segundos
+        while self._expiracoes and self._expiracoes[0][0] <= limite:
+            _, id_conteudo = heappop(self._expiracoes)
+            contagem = self._contagens.prioridade(id_conteudo)[0] - 1
+            if contagem:
+                self._contagens.inserir_ou_atualizar(id_conteudo, (contagem, -id_conteudo))
+            else:
+                self._contagens.remover(id_conteudo)
+                del self._conteudos[id_conteudo]
+
+    def exportar(self):
+        """
+        Retorna (agora, colunas) com os eventos da janela em colunas para o snapshot:
+        {"timestamps": array, "conteudos": array}.
+        """
+        return self._agora, {"timestamps": array('q', (timestamp for timestamp, _ in self._expiracoes)),
+                             "conteudos": array('q', (id_conteudo for _, id_conteudo in self._expiracoes))}
+
+    @classmethod
+    def a_partir_de(cls, janela_minutos, agora, colunas, conteudos_por_id):
+        """
+        Reconstrói o motor com os eventos exportados (exportar), sem percorrer o histórico.
+        conteudos_por_id traduz os ids dos conteúdos da janela para os objetos Conteudo.
+        """
+        motor = cls(janela_minutos)
+        motor._agora = agora
+        motor._expiracoes = list(zip(colunas["timestamps"], colunas["conteudos"]))
+        heapify(motor._expiracoes)
+        contagens = Counter(colunas["conteudos"])
+        motor._contagens = HeapIndexado.a_partir_de(
+            [(id_conteudo, (contagem, -id_conteudo)) for id_conteudo, contagem in contagens.items()], maximo=True)
+        motor._conteudos = {id_conteudo: conteudos_por_id[id_conteudo] for id_conteudo in contagens}
+        return motor
+
+    def contagem(self, id_conteudo):
+        """
+        Interações de engajamento do conteúdo dentro da janela.
+        """
+        return self._contagens.prioridade(id_conteudo)[0] if id_conteudo in self._contagens else 0
+
+    def em_alta(self, k=10):
+        """
+        Retorna [(Conteudo, contagem na janela)] dos k conteúdos em alta, do maior para o menor.
+        """
+        return [(self._conteudos[id_conteudo], prioridade[0])
+                for id_conteudo, prioridade in self._contagens.primeiros(k)]
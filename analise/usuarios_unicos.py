@@ -0,0 +1,234 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+from estruturas_dados.hyperloglog import HyperLogLog, hash_64
+from estruturas_dados.indice_temporal import IndiceTemporal, instante_para_epoch
+
+
+class EstimadorUsuariosUnicos:
+    """
+    Usuários únicos (aproximados) por conteúdo, plataforma, categoria e intervalo de
+    tempo, com um HyperLogLog para cada um, em vez de um conjunto exato de ids.
+
+    Assim como o IndiceTemporal, lê as colunas do ArmazenamentoColunarInteracoes e
+    indexa sob demanda apenas as linhas novas (atualizar). O hash de cada usuário é
+    calculado uma vez por linha e aplicado aos sketches da linha.
+
+    Consultas por período mesclam os sketches dos buckets que tocam [inicio, fim):
+    a granularidade é a do bucket (por padrão, 1 hora).
+
+    Complexidades:
+    - atualizar: O(k · g), k = linhas novas, g = categorias do conteúdo
+    - mesclar: O(s · 2^precisao), s = sketches do outro estimador
+    - exportar / restaurar (snapshot): O(s · 2^precisao), s = sketches
+    - estimativa de um conteúdo, plataforma ou categoria: O(2^precisao)
+    - periodo: O(log B + w · 2^precisao), B = buckets, w = buckets na janela
+    - Memória: até 2^precisao bytes por sketch, independente da quantidade de usuários
+    """
+
+    def __init__(self, armazenamento, precisao=HyperLogLog.PRECISAO_PADRAO,
+                 tamanho_bucket=IndiceTemporal.TAMANHO_BUCKET_PADRAO):
+        if tamanho_bucket <= 0:
+            raise ValueError("O tamanho do bucket deve ser positivo.")
+        self._armazenamento = armazenamento
+        self._total = HyperLogLog(precisao)
+        self._precisao = precisao
+        self._tamanho_bucket = tamanho_bucket
+        self._por_conteudo = {}
+        self._por_plataforma = {}
+        self._por_categoria = {}
+        self._por_bucket = {}
+        self._chaves_buckets = []          # chaves dos buckets em ordem crescente
+        self._categorias_por_conteudo = {}
+        self._linhas_indexadas = 0
+
+    @property
+    def precisao(self):
+        return self._precisao
+
+    @property
+    def erro_padrao(self):
+        return self._total.erro_padrao
+
+    @property
+    def tamanho_bucket(self):
+        return self._tamanho_bucket
+
+    def _sketch(self, sketches, chave):
+        sketch = sketches.get(chave)
+        if sketch is None:
+            sketch = sketches[chave] = HyperLogLog(self._precisao)
+        return sketch
+
+    def _categorias(self, id_conteudo):
+        categorias = self._categorias_por_conteudo.get(id_conteudo)
+        if categorias is None:
+            conteudo = self._armazenamento.obter_conteudo(id_conteudo)
+            categorias = conteudo.categorias if conteudo is not None else ()
+            self._categorias_por_conteudo[id_conteudo] = categorias
+        return categorias
+
+    def atualizar(self):
+        """
+        Indexa as linhas acrescentadas ao armazenamento desde a última atualização.
+        """
+        armazenamento = self._armazenamento
+        total = len(armazenamento)
+        if self._linhas_indexadas >= total:
+            return
+        ids_usuario = armazenamento.ids_usuario
+        ids_conteudo = armazenamento.ids_conteudo
+        ids_plataforma = armazenamento.ids_plataforma
+        timestamps = armazenamento.timestamps
+        tamanho = self._tamanho_bucket
+
+        for indice in range(self._linhas_indexadas, total):
+            valor_hash = hash_64(ids_usuario[indice])
+            id_conteudo = ids_conteudo[indice]
+            self._total.adicionar_hash(valor_hash)
+            self._sketch(self._por_conteudo, id_conteudo).adicionar_hash(valor_hash)
+            self._sketch(self._por_plataforma, ids_plataforma[indice]).adicionar_hash(valor_hash)
+
+            for categoria in self._categorias(id_conteudo):
+                self._sketch(self._por_categoria, categoria).adicionar_hash(valor_hash)
+
+            chave = timestamps[indice] // tamanho
+            if chave not in self._por_bucket:
+                insort(self._chaves_buckets, chave)
+            self._sketch(self._por_bucket, chave).adicionar_hash(valor_hash)
+        self._linhas_indexadas = total
+
+    def mesclar(self, outro, ids_plataforma):
+        """
+        Soma os sketches de outro estimador, que indexou as linhas anexadas ao armazenamento
+        logo depois das já indexadas por este (ex.: um bloco do CSV processado em outro
+        processo). ids_plataforma traduz os ids de plataforma do outro ({id do outro: id deste}).
+        As categorias vêm dos conteúdos deste armazenamento (uniões dos sketches por conteúdo).
+        Como HyperLogLog.mesclar guarda o maior registrador de cada posição, o resultado é
+        idêntico ao de indexar as mesmas linhas aqui.
+        Complexidade: O(s · 2^precisao), s = sketches do outro
+        """
+        if outro._precisao != self._precisao or outro._tamanho_bucket != self._tamanho_bucket:
+            raise ValueError("Só é possível mesclar estimadores de mesma precisão e tamanho de bucket.")
+        self._total.mesclar(outro._total)
+        for id_conteudo, sketch in outro._por_conteudo.items():
+            self._sketch(self._por_conteudo, id_conteudo).mesclar(sketch)
+            for categoria in self._categorias(id_conteudo):
+                self._sketch(self._por_categoria, categoria).mesclar(sketch)
+        for id_plataforma, sketch in outro._por_plataforma.items():
+            self._sketch(self._por_plataforma, ids_plataforma.get(id_plataforma, 0)).mesclar(sketch)
+        for chave, sketch in outro._por_bucket.items():
+            if chave not in self._por_bucket:
+                insort(self._chaves_buckets, chave)
+            self._sketch(self._por_bucket, chave).mesclar(sketch)
+        self._linhas_indexadas += outro._linhas_indexadas
+
+    # Grupos de sketches com chaves inteiras, gravados em colunas pelo snapshot
+    _GRUPOS = (("conteudo", "_por_conteudo"), ("plataforma", "_por_plataforma"), ("bucket", "_por_bucket"))
+
+    def exportar(self):
+        """
+        Retorna (metadados, colunas) para o snapshot, após indexar as linhas novas.
+        Os metadados têm a precisão, o tamanho do bucket, as linhas indexadas e os nomes
+        das categorias; as colunas, para cada grupo de sketches, as chaves ("<grupo>_chaves")
+        e os bytes de HyperLogLog.exportar concatenados ("<grupo>_dados", delimitados por
+        "<grupo>_ptr"). O sketch total fica em "total_dados".
+        Complexidade: O(s · 2^precisao), s = sketches
+        """
+        self.atualizar()
+        metadados = {"precisao": self._precisao, "tamanho_bucket": self._tamanho_bucket,
+                     "linhas_indexadas": self._linhas_indexadas, "categorias": list(self._por_categoria)}
+        colunas = {"total_dados": array('B', self._total.exportar())}
+        grupos = [(nome, getattr(self, atributo)) for nome, atributo in self._GRUPOS]
+        grupos.append(("categoria", self._por_categoria))
+        for nome, sketches in grupos:
+            if nome != "categoria":
+                colunas[nome + "_chaves"] = array('q', sketches)
+            ponteiros = colunas[nome + "_ptr"] = array('q', [0])
+            dados = colunas[nome + "_dados"] = array('B')
+            for sketch in sketches.values():
+                dados.frombytes(sketch.exportar())
+                ponteiros.append(len(dados))
+        return metadados, colunas
+
+    def restaurar(self, metadados, colunas):
+        """
+        Substitui os sketches pelos exportados (exportar) de um snapshot com a mesma
+        precisão e tamanho de bucket; linhas acrescentadas depois são indexadas normalmente.
+        ValueError se os parâmetros diferirem.
+        Complexidade: O(s · 2^precisao), s = sketches
+        """
+        if metadados["precisao"] != self._precisao or metadados["tamanho_bucket"] != self._tamanho_bucket:
+            raise ValueError("Só é possível restaurar sketches de mesma precisão e tamanho de bucket.")
+        precisao = self._precisao
+        self._total = HyperLogLog.a_partir_de(precisao, colunas["total_dados"])
+
+        def sketches(nome, chaves):
+            ponteiros, dados = colunas[nome + "_ptr"], colunas[nome + "_dados"]
+            return {chave: HyperLogLog.a_partir_de(precisao, dados[ponteiros[i]:ponteiros[i + 1]])
+                    for i, chave in enumerate(chaves)}
+
+        for nome, atributo in self._GRUPOS:
+            setattr(self, atributo, sketches(nome, colunas[nome + "_chaves"]))
+        self._por_categoria = sketches("categoria", metadados["categorias"])
+        self._chaves_buckets = sorted(self._por_bucket)
+        self._categorias_por_conteudo = {}
+        self._linhas_indexadas = metadados["linhas_indexadas"]
+
+    def total(self):
+        self.atualizar()
+        return self._total.estimar()
+
+    def conteudo(self, id_conteudo):
+        self.atualizar()
+        sketch = self._por_conteudo.get(id_conteudo)
+        return sketch.estimar() if sketch is not None else 0
+
+    def plataforma(self, id_plataforma):
+        self.atualizar()
+        sketch = self._por_plataforma.get(id_plataforma)
+        return sketch.estimar() if sketch is not None else 0
+
+    def categoria(self, categoria):
+        self.atualizar()
+        sketch = self._por_categoria.get(categoria.strip().lower())
+        return sketch.estimar() if sketch is not None else 0
+
+    def estimativas_por_conteudo(self):
+        """
+        Retorna {id_conteudo: usuários únicos estimados}.
+        """
+        self.atualizar()
+        return {id_conteudo: sketch.estimar() for id_conteudo, sketch in self._por_conteudo.items()}
+
+    def estimativas_por_plataforma(self):
+        """
+        Retorna {id_plataforma: usuários únicos estimados} (sem a plataforma 0, de interações sem plataforma).
+        """
+        self.atualizar()
+        return {id_plataforma: sketch.estimar()
+                for id_plataforma, sketch in self._por_plataforma.items() if id_plataforma}
+
+    def estimativas_por_categoria(self):
+        """
+        Retorna {categoria: usuários únicos estimados}.
+        """
+        self.atualizar()
+        return {categoria: sketch.estimar() for categoria, sketch in self._por_categoria.items()}
+
+    def periodo(self, inicio=None, fim=None):
+        """
+        Usuários únicos estimados nos buckets que tocam [inicio, fim)
+        (limites None = sem limite; aceitam epoch, datetime ou texto ISO).
+        """
+        self.atualizar()
+        inicio = instante_para_epoch(inicio)
+        fim = instante_para_epoch(fim)
+        tamanho = self._tamanho_bucket
+        chaves = self._chaves_buckets
+        primeiro = 0 if inicio is None else bisect_left(chaves, inicio // tamanho)
+        ultimo = len(chaves) if fim is None else bisect_right(chaves, (fim - 1) // tamanho)
+        uniao = HyperLogLog(self._precisao)
+        for chave in chaves[primeiro:ultimo]:
+            uniao.mesclar(self._por_bucket[chave])
+        return uniao.estimar()
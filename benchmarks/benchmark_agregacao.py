@@ -0,0 +1,126 @@
+"""
+Compara o MotorAgregacao (agrupamento em lote sobre as colunas) com os laços
+originais dos relatórios por plataforma, que percorriam conteúdo por conteúdo
+os objetos Interacao.
+
+As colunas são geradas sinteticamente com `--linhas` interações (padrão 10 milhões).
+Os laços originais precisam de um objeto Interacao por linha, por isso rodam sobre
+uma amostra menor (`--linhas-objetos`, padrão 1 milhão; 0 desativa).
+
+Uso:
+    python benchmarks/benchmark_agregacao.py [--linhas N] [--linhas-objetos N] [--sem-numpy]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from array import array
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analise.agregacao import MotorAgregacao, np  # noqa: E402
+from entidades.conteudo import Video  # noqa: E402
+from entidades.interacao import Interacao  # noqa: E402
+from entidades.plataforma import Plataforma  # noqa: E402
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes  # noqa: E402
+
+PLATAFORMAS = ("Globoplay", "G1", "TV Globo", "GE", "Gshow", "Receitas")
+QUANTIDADE_CONTEUDOS = 1000
+
+
+def gerar_colunas(linhas, semente):
+    """
+    Gera colunas sintéticas com plataformas e tipos sorteados.
+    Complexidade: O(linhas)
+    """
+    aleatorio = random.Random(semente)
+    quantidade_tipos = len(ArmazenamentoColunarInteracoes.TIPOS_INTERACAO)
+    armazenamento = ArmazenamentoColunarInteracoes()
+    colunas = {
+        "ids": array('q', range(1, linhas + 1)),
+        "ids_usuario": array('q', (aleatorio.randrange(1, 100000) for _ in range(linhas))),
+        "ids_conteudo": array('q', (aleatorio.randrange(1, QUANTIDADE_CONTEUDOS + 1) for _ in range(linhas))),
+        "ids_plataforma": array('i', (aleatorio.randrange(1, len(PLATAFORMAS) + 1) for _ in range(linhas))),
+        "codigos_tipo": array('b', (aleatorio.randrange(quantidade_tipos) for _ in range(linhas))),
+        "timestamps": array('q', bytes(8 * linhas)),
+        "duracoes": array('q', bytes(8 * linhas)),
+        "offsets_comentario": array('q', [-1]) * linhas,
+    }
+    armazenamento.restaurar(colunas, [])
+    return armazenamento
+
+
+def gerar_conteudos_com_objetos(linhas, semente):
+    """
+    Monta conteúdos com uma lista de objetos Interacao cada, como no modelo original.
+    Complexidade: O(linhas)
+    """
+    aleatorio = random.Random(semente)
+    tipos = ArmazenamentoColunarInteracoes.TIPOS_INTERACAO
+    plataformas = [Plataforma(nome, id_plataforma) for id_plataforma, nome in enumerate(PLATAFORMAS, 1)]
+    conteudos = [Video(id_conteudo, f"Conteúdo {id_conteudo}", 0) for id_conteudo in range(1, QUANTIDADE_CONTEUDOS + 1)]
+    for _ in range(linhas):
+        conteudo = aleatorio.choice(conteudos)
+        interacao = Interacao(aleatorio.randrange(1, 100000), "2024-10-20 20:05:12", aleatorio.choice(tipos),
+                              conteudo_associado=conteudo, plataforma_interacao=aleatorio.choice(plataformas))
+        conteudo.adicionar_interacao(interacao)
+    return conteudos
+
+
+def contagem_por_plataforma_original(conteudos):
+    contagem = {}
+    for conteudo in conteudos:
+        for interacao in conteudo._interacoes:
+            plataforma = interacao.plataforma_interacao
+            if plataforma:
+                nome = plataforma.nome_plataforma
+                contagem[nome] = contagem.get(nome, 0) + 1
+    return contagem
+
+
+def distribuicao_tipos_original(conteudos):
+    distribuicao = defaultdict(lambda: defaultdict(int))
+    for conteudo in conteudos:
+        for interacao in conteudo._interacoes:
+            plataforma = interacao.plataforma_interacao.nome_plataforma if interacao.plataforma_interacao else "Desconhecida"
+            distribuicao[plataforma][interacao.tipo_interacao] += 1
+    return distribuicao
+
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    funcao(*args)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--linhas", type=int, default=10_000_000)
+    parser.add_argument("--linhas-objetos", type=int, default=1_000_000)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--sem-numpy", action="store_true", help="força o caminho da biblioteca padrão")
+    args = parser.parse_args()
+
+    usar_numpy = np is not None and not args.sem_numpy
+    print(f"NumPy: {'sim' if usar_numpy else 'não'}")
+
+    inicio = time.perf_counter()
+    armazenamento = gerar_colunas(args.linhas, args.semente)
+    print(f"Colunas geradas: {args.linhas} linhas em {time.perf_counter() - inicio:.2f}s "
+          f"({armazenamento.memoria_estimada_bytes() / 2**20:.0f} MiB)")
+    motor = MotorAgregacao(armazenamento, usar_numpy=usar_numpy)
+    print(f"  motor contagem_por_plataforma:           {medir(motor.contagem_por_plataforma):.2f}s")
+    print(f"  motor distribuicao_tipos_por_plataforma: {medir(motor.distribuicao_tipos_por_plataforma):.2f}s")
+
+    if args.linhas_objetos > 0:
+        inicio = time.perf_counter()
+        conteudos = gerar_conteudos_com_objetos(args.linhas_objetos, args.semente)
+        print(f"Objetos gerados: {args.linhas_objetos} interações em {time.perf_counter() - inicio:.2f}s")
+        print(f"  laço original plataforma_maior: {medir(contagem_por_plataforma_original, conteudos):.2f}s")
+        print(f"  laço original distribuicao:     {medir(distribuicao_tipos_original, conteudos):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
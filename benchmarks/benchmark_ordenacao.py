@@ -0,0 +1,106 @@
+"""
+Compara merge_sort e radix_sort (estruturas_dados/ordenacao.py) com o Quick Sort
+recursivo que SistemaAnaliseEngajamento usava antes, medindo o tempo e a quantidade
+de chamadas a key() em entradas aleatórias e adversárias (já ordenadas, invertidas,
+todas iguais e poucas chaves distintas), sempre com reverse=True como nos relatórios.
+
+O Quick Sort usa o último elemento como pivô: nas entradas adversárias ele faz O(n²)
+comparações e precisa de recursão com profundidade n (o limite é elevado aqui).
+
+Uso:
+    python benchmarks/benchmark_ordenacao.py [--n N] [--sem-quick-sort]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estruturas_dados.ordenacao import merge_sort, radix_sort  # noqa: E402
+
+
+def quick_sort_original(array, key=lambda x: x, low=0, high=None, reverse=False):
+    """
+    Cópia do SistemaAnaliseEngajamento._quick_sort removido (pivô no último elemento).
+    Tempo médio: O(n log n), pior caso: O(n²).
+    """
+    if high is None:
+        high = len(array) - 1
+
+    def partition(arr, low, high):
+        pivot = key(arr[high])
+        i = low - 1
+        for j in range(low, high):
+            if (key(arr[j]) > pivot if reverse else key(arr[j]) < pivot):
+                i += 1
+                arr[i], arr[j] = arr[j], arr[i]
+        arr[i+1], arr[high] = arr[high], arr[i+1]
+        return i + 1
+
+    if low < high:
+        pi = partition(array, low, high)
+        quick_sort_original(array, key, low, pi - 1, reverse)
+        quick_sort_original(array, key, pi + 1, high, reverse)
+    return array
+
+
+def gerar_entradas(n, semente):
+    aleatorio = random.Random(semente)
+    aleatoria = [aleatorio.randrange(n * 10) for _ in range(n)]
+    return {
+        "aleatória": aleatoria,
+        "ordenada": sorted(aleatoria),
+        "invertida": sorted(aleatoria, reverse=True),
+        "todos iguais": [0] * n,
+        "4 distintos": [aleatorio.randrange(4) for _ in range(n)],
+    }
+
+
+def medir(ordenar, valores):
+    """
+    Ordena uma cópia de (valor, posição) pelo valor com reverse=True e retorna
+    (segundos, chamadas a key). Confere o resultado com sorted().
+    """
+    chamadas = 0
+
+    def chave(par):
+        nonlocal chamadas
+        chamadas += 1
+        return par[0]
+
+    lista = [(valor, posicao) for posicao, valor in enumerate(valores)]
+    inicio = time.perf_counter()
+    resultado = ordenar(lista, key=chave, reverse=True)
+    segundos = time.perf_counter() - inicio
+    esperado = sorted(valores, reverse=True)
+    if [valor for valor, _ in resultado] != esperado:
+        raise AssertionError(f"{ordenar.__name__} produziu uma ordem incorreta")
+    return segundos, chamadas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--sem-quick-sort", action="store_true",
+                        help="não executa o Quick Sort original (lento nas entradas adversárias)")
+    args = parser.parse_args()
+
+    algoritmos = [merge_sort, radix_sort]
+    if not args.sem_quick_sort:
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), args.n + 1000))
+        algoritmos.insert(0, quick_sort_original)
+
+    print(f"n = {args.n}, reverse=True (tempo / chamadas a key)")
+    for nome, valores in gerar_entradas(args.n, args.semente).items():
+        medicoes = []
+        for ordenar in algoritmos:
+            segundos, chamadas = medir(ordenar, valores)
+            medicoes.append(f"{ordenar.__name__} {segundos:.3f}s/{chamadas}")
+        print(f"  {nome:<13} " + "  ".join(medicoes))
+
+
+if __name__ == "__main__":
+    main()
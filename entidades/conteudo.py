@@ -1,11 +1,21 @@
 from entidades.plataforma import Plataforma
 
 class Conteudo:
-    def __init__(self, id_conteudo, nome_conteudo,categoria):
+    # Tipos de interação que contam como engajamento
+    TIPOS_ENGAJAMENTO = frozenset({"like", "share", "comment", "view_start"})
+
+    def __init__(self, id_conteudo, nome_conteudo,categoria, interacoes=None):
         self._id_conteudo = id_conteudo
         self._nome_conteudo = nome_conteudo
-        self._interacoes = []
+        # Coleção das interações (lista por padrão; pode ser uma sequência do armazenamento colunar)
+        self._interacoes = interacoes if interacoes is not None else []
         self._categoria = categoria
+        # Agregados mantidos a cada nova interação, para que as métricas sejam O(1)
+        self._contagem_por_tipo = {}
+        self._total_engajamento = 0
+        self._tempo_total_consumo = 0
+        self._quantidade_duracoes_validas = 0
+        self._quantidade_comentarios = 0
 
     @property
     def id_conteudo(self):
@@ -19,36 +29,86 @@ class Conteudo:
     def categoria(self):
         return self._categoria
 
+    @property
+    def categorias(self):
+        # Categorias individuais do campo multivalorado (ex.: "novela,drama" -> ("novela", "drama"))
+        if not self._categoria:
+            return ()
+        return tuple(c.strip().lower() for c in self._categoria.split(",") if c.strip())
+
     def adicionar_interacao(self, interacao):
+        """
+        Registra a interação e atualiza os contadores agregados.
+        Complexidade: O(1)
+        """
         self._interacoes.append(interacao)
+        self.contabilizar(interacao.tipo_interacao, interacao.watch_duration_seconds, interacao.comment_text)
+
+    def contabilizar(self, tipo, duracao, comentario):
+        """
+        Atualiza os contadores agregados com os campos de uma interação, sem guardá-la
+        (usado também ao resumir blocos do CSV em outros processos).
+        Complexidade: O(1)
+        """
+        self._contagem_por_tipo[tipo] = self._contagem_por_tipo.get(tipo, 0) + 1
+        if tipo in self.TIPOS_ENGAJAMENTO:
+            self._total_engajamento += 1
+
+        if isinstance(duracao, int) and duracao > 0:
+            self._tempo_total_consumo += duracao
+            self._quantidade_duracoes_validas += 1
+
+        if comentario is not None and comentario.strip() != "":
+            self._quantidade_comentarios += 1
 
     def calcular_total_interacoes_engajamento(self):
-        total = 0
-        for i in self._interacoes:
-            if i.tipo_interacao in ["like", "share", "comment","view_start"]:
-                total += 1
-        return total
+        # O(1): contador mantido em adicionar_interacao
+        return self._total_engajamento
 
     def calcular_contagem_por_tipo_interacao(self):
-        contagem = {}
-        for i in self._interacoes:
-            tipo = i.tipo_interacao
-            contagem[tipo] = contagem.get(tipo, 0) + 1
-        return contagem
+        # Retorna uma cópia para que o chamador não altere o contador interno
+        return dict(self._contagem_por_tipo)
+
+    def contar_interacoes_do_tipo(self, tipo):
+        # O(1): quantidade de interações de um único tipo
+        return self._contagem_por_tipo.get(tipo, 0)
 
     def calcular_tempo_total_consumo(self):
-        total = 0
-        for i in self._interacoes:
-            if isinstance(i.watch_duration_seconds, int) and i.watch_duration_seconds > 0:
-                total += i.watch_duration_seconds
-        return total
+        # O(1): soma das durações válidas (> 0)
+        return self._tempo_total_consumo
 
     def calcular_media_tempo_consumo(self):
-        duracoes = [i.watch_duration_seconds for i in self._interacoes if isinstance(i.watch_duration_seconds, int) and i.watch_duration_seconds > 0]
-        if duracoes:
-            return sum(duracoes) / len(duracoes)
+        # O(1): média das durações válidas (> 0)
+        if self._quantidade_duracoes_validas:
+            return self._tempo_total_consumo / self._quantidade_duracoes_validas
         return 0
 
+    def calcular_quantidade_comentarios(self):
+        # O(1): quantidade de comentários não vazios
+        return self._quantidade_comentarios
+
+    def exportar_agregados(self):
+        # Estado dos contadores em estruturas simples (usado pelo snapshot)
+        return [list(self._contagem_por_tipo.items()), self._total_engajamento, self._tempo_total_consumo,
+                self._quantidade_duracoes_validas, self._quantidade_comentarios]
+
+    def restaurar_agregados(self, dados):
+        # Restaura os contadores exportados por exportar_agregados, sem percorrer interações
+        tipos, self._total_engajamento, self._tempo_total_consumo, \
+            self._quantidade_duracoes_validas, self._quantidade_comentarios = dados
+        self._contagem_por_tipo = dict(tipos)
+
+    def mesclar_agregados(self, dados):
+        # Soma agregados parciais no formato de exportar_agregados (ex.: de um bloco do CSV
+        # processado em outro processo), sem percorrer interações
+        tipos, engajamento, tempo, duracoes_validas, comentarios = dados
+        for tipo, quantidade in tipos:
+            self._contagem_por_tipo[tipo] = self._contagem_por_tipo.get(tipo, 0) + quantidade
+        self._total_engajamento += engajamento
+        self._tempo_total_consumo += tempo
+        self._quantidade_duracoes_validas += duracoes_validas
+        self._quantidade_comentarios += comentarios
+
     def listar_comentarios(self):
         comentarios = []
         for i in self._interacoes:
@@ -78,8 +138,8 @@ class Conteudo:
 
 
 class Video(Conteudo):
-    def __init__(self, id_conteudo, nome_conteudo, duracao_total_video_seg, categoria=None):
-        super().__init__(id_conteudo, nome_conteudo, categoria)
+    def __init__(self, id_conteudo, nome_conteudo, duracao_total_video_seg, categoria=None, interacoes=None):
+        super().__init__(id_conteudo, nome_conteudo, categoria, interacoes)
         self.__duracao_total_video_seg = duracao_total_video_seg
 
     @property
@@ -94,8 +154,8 @@ class Video(Conteudo):
 
 
 class Podcast(Conteudo):
-    def __init__(self, id_conteudo, nome_conteudo, duracao_total_episodio_seg=0, categoria=None):
-        super().__init__(id_conteudo, nome_conteudo, categoria)
+    def __init__(self, id_conteudo, nome_conteudo, duracao_total_episodio_seg=0, categoria=None, interacoes=None):
+        super().__init__(id_conteudo, nome_conteudo, categoria, interacoes)
         self.__duracao_total_episodio_seg = duracao_total_episodio_seg
 
     @property
@@ -104,10 +164,22 @@ class Podcast(Conteudo):
 
 
 class Artigo(Conteudo):
-    def __init__(self, id_conteudo, nome_conteudo, tempo_leitura_estimado_seg=0, categoria=None):
-        super().__init__(id_conteudo, nome_conteudo, categoria)
+    def __init__(self, id_conteudo, nome_conteudo, tempo_leitura_estimado_seg=0, categoria=None, interacoes=None):
+        super().__init__(id_conteudo, nome_conteudo, categoria, interacoes)
         self.__tempo_leitura_estimado_seg = tempo_leitura_estimado_seg
 
     @property
     def tempo_leitura_estimado_seg(self):
         return self.__tempo_leitura_estimado_seg
+
+
+def criar_conteudo(tipo_conteudo, id_conteudo, nome_conteudo, categoria, interacoes=None):
+    """
+    Cria o conteúdo conforme o tipo informado no CSV ('podcast' ou 'artigo'; qualquer
+    outro valor cria um Video).
+    """
+    if tipo_conteudo == "podcast":
+        return Podcast(id_conteudo, nome_conteudo, 0, categoria, interacoes)
+    if tipo_conteudo == "artigo":
+        return Artigo(id_conteudo, nome_conteudo, 0, categoria, interacoes)
+    return Video(id_conteudo, nome_conteudo, 0, categoria, interacoes)
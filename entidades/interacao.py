@@ -1,22 +1,92 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from entidades.plataforma import Plataforma
 from entidades.conteudo import Conteudo
 
+# Referência para conversão entre datetime (sem fuso) e segundos desde a época
+EPOCA = datetime(1970, 1, 1)
+
+
+def datetime_para_epoch(momento):
+    """
+    Converte um datetime em segundos inteiros desde 1970-01-01.
+    Datetimes com fuso são convertidos para UTC antes.
+    """
+    if momento.tzinfo is not None:
+        momento = momento.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = momento - EPOCA
+    return delta.days * 86400 + delta.seconds
+
+
+def epoch_para_datetime(segundos):
+    """
+    Converte segundos desde 1970-01-01 de volta para datetime (sem fuso).
+    """
+    return EPOCA + timedelta(seconds=segundos)
+
+
+# Segundos desde a época de datetime.min, usado para timestamps inválidos
+EPOCH_INVALIDO = datetime_para_epoch(datetime.min)
+
+
+def converter_timestamp_epoch(timestamp):
+    """
+    Converte o texto do timestamp do CSV em segundos desde a época.
+    Valores inválidos são tratados como datetime.min, como em Interacao.
+    O datetime de fromisoformat (parser em C) é usado só para a conversão e descartado.
+    """
+    try:
+        momento = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return EPOCH_INVALIDO
+    if momento.tzinfo is not None:
+        return datetime_para_epoch(momento)
+    delta = momento - EPOCA
+    return delta.days * 86400 + delta.seconds
+
+
 class Interacao:
     TIPOS_INTERACAO_VALIDOS = {"view_start", "like", "share", "comment", "vote_bbb"}
     __proximo_id = 1  # Contador para gerar IDs únicos para interações
 
-    def __init__(self, id_usuario, timestamp, tipo_interacao, watch_duration_seconds=0, comment_text="", conteudo_associado=None, plataforma_interacao=None):
-        self.__interacao_id = Interacao.__proximo_id
+    @classmethod
+    def gerar_id(cls):
+        """
+        Reserva e retorna o próximo ID de interação.
+        Usado também pelas interações guardadas no armazenamento colunar.
+        """
+        id_gerado = Interacao.__proximo_id
         Interacao.__proximo_id += 1
+        return id_gerado
+
+    @classmethod
+    def proximo_id(cls):
+        """
+        Retorna o ID que será gerado na próxima interação, sem reservá-lo.
+        """
+        return Interacao.__proximo_id
+
+    @classmethod
+    def avancar_proximo_id(cls, valor):
+        """
+        Garante que os próximos IDs gerados sejam >= valor (usado ao restaurar estado salvo,
+        para não repetir IDs já existentes). Nunca faz o contador voltar.
+        """
+        if valor > Interacao.__proximo_id:
+            Interacao.__proximo_id = valor
+
+    def __init__(self, id_usuario, timestamp, tipo_interacao, watch_duration_seconds=0, comment_text="", conteudo_associado=None, plataforma_interacao=None, timestamp_epoch=None):
+        self.__interacao_id = Interacao.gerar_id()
 
         self.__id_usuario = int(id_usuario)
 
-        # Tenta converter timestamp para datetime; se inválido, define como datetime.min
-        try:
-            self.__timestamp_interacao = datetime.fromisoformat(timestamp)
-        except ValueError:
-            self.__timestamp_interacao = datetime.min
+        # Guarda o timestamp como segundos desde a época (inválido -> datetime.min);
+        # timestamp_epoch permite reaproveitar a conversão já feita na leitura do CSV
+        if timestamp_epoch is None:
+            if isinstance(timestamp, datetime):
+                timestamp_epoch = datetime_para_epoch(timestamp)
+            else:
+                timestamp_epoch = converter_timestamp_epoch(timestamp)
+        self.__timestamp_epoch = timestamp_epoch
         
         # Valida o tipo de interação, padrão para "view_start" se inválido
         self.__tipo_interacao = tipo_interacao if tipo_interacao in self.TIPOS_INTERACAO_VALIDOS else "view_start"
@@ -49,9 +119,14 @@ class Interacao:
     def id_usuario(self):
         return self.__id_usuario
 
+    @property
+    def timestamp_epoch(self):
+        return self.__timestamp_epoch
+
     @property
     def timestamp_interacao(self):
-        return self.__timestamp_interacao
+        # O datetime só é criado quando acessado
+        return epoch_para_datetime(self.__timestamp_epoch)
 
     @property
     def tipo_interacao(self):
@@ -69,7 +144,7 @@ class Interacao:
         if not isinstance(other, Interacao):
             return NotImplemented
         # Ordena pela data da interação (timestamp)
-        return self.__timestamp_interacao < other.timestamp_interacao
+        return self.__timestamp_epoch < other.timestamp_epoch
 
     def __str__(self):
         return f"Interação {self.__interacao_id}: {self.__tipo_interacao} por usuário {self.__id_usuario} em {self.conteudo_associado.nome_conteudo}"
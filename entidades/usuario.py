@@ -1,11 +1,23 @@
 from collections import Counter  # Importa Counter para contagem eficiente de elementos em listas
 
 class Usuario:  # Representa um usuário, suas interações e métricas associadas
-    def __init__(self, id_usuario):
+    def __init__(self, id_usuario, interacoes=None):
         # Atributo privado que armazena o ID do usuário
         self.__id_usuario = id_usuario
-        # Lista privada que armazenará objetos do tipo Interacao realizados pelo usuário
-        self.__interacoes_realizadas = []
+        # Coleção privada que armazenará as interações realizadas pelo usuário
+        # (lista por padrão; pode ser uma sequência do armazenamento colunar)
+        self.__interacoes_realizadas = interacoes if interacoes is not None else []
+        # Agregados atualizados a cada interação registrada, para que as métricas sejam O(1)
+        self.__contagem_por_tipo = {}
+        self.__total_engajamento = 0
+        self.__tempo_total_consumo = 0
+        self.__quantidade_duracoes_validas = 0
+        self.__quantidade_comentarios = 0
+        # Tempo consumido e número de interações por plataforma
+        self.__tempo_por_plataforma = {}
+        self.__contagem_por_plataforma = Counter()
+        # Conjunto de conteúdos distintos com os quais o usuário interagiu
+        self.__conteudos_unicos = set()
 
     @property
     def id_usuario(self):
@@ -18,84 +30,118 @@ class Usuario:  # Representa um usuário, suas interações e métricas associad
         return self.__interacoes_realizadas
 
     def registrar_interacao(self, interacao):
-        # Adiciona um objeto Interacao à lista de interações realizadas
+        # Adiciona um objeto Interacao à lista de interações realizadas e atualiza os agregados (O(1))
         self.__interacoes_realizadas.append(interacao)
+        self.contabilizar(interacao.tipo_interacao, interacao.watch_duration_seconds, interacao.comment_text,
+                          interacao.plataforma_interacao, interacao.conteudo_associado)
+
+    def contabilizar(self, tipo, duracao, comentario, plataforma, conteudo):
+        # Atualiza os agregados com os campos de uma interação, sem guardá-la
+        # (usado também ao resumir blocos do CSV em outros processos)
+        self.__contagem_por_tipo[tipo] = self.__contagem_por_tipo.get(tipo, 0) + 1
+        if tipo in ("like", "share", "comment"):
+            self.__total_engajamento += 1
+
+        # Considera apenas durações inteiras positivas
+        duracao_valida = isinstance(duracao, int) and duracao > 0
+        if duracao_valida:
+            self.__tempo_total_consumo += duracao
+            self.__quantidade_duracoes_validas += 1
+
+        if comentario:
+            self.__quantidade_comentarios += 1
+
+        if plataforma:
+            self.__contagem_por_plataforma[plataforma] += 1
+        if plataforma is not None and duracao_valida:
+            self.__tempo_por_plataforma[plataforma] = self.__tempo_por_plataforma.get(plataforma, 0) + duracao
+
+        if conteudo:
+            self.__conteudos_unicos.add(conteudo)
 
     def obter_interacoes_por_tipo(self, tipo_desejado: str) -> list:
         # Retorna uma lista filtrada apenas das interações que correspondem ao tipo_desejado
         return [i for i in self.__interacoes_realizadas if i.tipo_interacao == tipo_desejado]
 
     def obter_conteudos_unicos_consumidos(self) -> set:
-        # Retorna um conjunto (set) contendo os conteúdos únicos consumidos pelo usuário
-        conteudos = set()
-        for interacao in self.__interacoes_realizadas:
-            # Se a interação estiver associada a algum conteúdo, adiciona ao set
-            if interacao.conteudo_associado:
-                conteudos.add(interacao.conteudo_associado)
-        return conteudos
+        # Retorna uma cópia do conjunto (set) de conteúdos únicos consumidos pelo usuário
+        return set(self.__conteudos_unicos)
+
+    def contar_conteudos_unicos_consumidos(self) -> int:
+        # Retorna a quantidade de conteúdos únicos sem copiar o conjunto (O(1))
+        return len(self.__conteudos_unicos)
 
     def calcular_tempo_total_consumo_plataforma(self, plataforma) -> int:
-        # Calcula o tempo total (em segundos) que o usuário consumiu em uma dada plataforma
-        total_tempo = 0
-        for interacao in self.__interacoes_realizadas:
-            if interacao.plataforma_interacao == plataforma:
-                # Soma o tempo da interação, apenas se for um inteiro positivo
-                if isinstance(interacao.watch_duration_seconds, int) and interacao.watch_duration_seconds > 0:
-                    total_tempo += interacao.watch_duration_seconds
-        return total_tempo
+        # Retorna o tempo total (em segundos) que o usuário consumiu em uma dada plataforma (O(1))
+        return self.__tempo_por_plataforma.get(plataforma, 0)
 
     def plataformas_mais_frequentes(self, top_n=3) -> list:
-        # Retorna as top_n plataformas onde o usuário mais interagiu
-        plataformas = []
-        for interacao in self.__interacoes_realizadas:
-            if interacao.plataforma_interacao:
-                plataformas.append(interacao.plataforma_interacao)
-
-        # Usa Counter para contar frequências das plataformas na lista
-        contagem_plataformas = Counter(plataformas)
-
-        # Retorna as top_n plataformas mais frequentes em forma de lista de tuplas (plataforma, contagem)
-        top_plataformas = contagem_plataformas.most_common(top_n)
-        return top_plataformas
+        # Retorna as top_n plataformas onde o usuário mais interagiu, em forma de lista de tuplas (plataforma, contagem)
+        # O contador já está pronto; o custo depende apenas do número de plataformas
+        return self.__contagem_por_plataforma.most_common(top_n)
 
     def calcular_total_interacoes_engajamento(self):
-        # Conta o total de interações do tipo engajamento (like, share, comment)
-        total = 0
-        for i in self.__interacoes_realizadas:
-            if i.tipo_interacao in ["like", "share", "comment"]:
-                total += 1
-        return total
+        # Retorna o total de interações do tipo engajamento (like, share, comment)
+        return self.__total_engajamento
 
     def calcular_contagem_por_tipo_interacao(self):
-        # Retorna um dicionário com contagem das interações por tipo
-        contagem = {}
-        for i in self.__interacoes_realizadas:
-            tipo = i.tipo_interacao
-            if tipo not in contagem:
-                contagem[tipo] = 0
-            contagem[tipo] += 1
-        return contagem
+        # Retorna um dicionário (cópia) com contagem das interações por tipo
+        return dict(self.__contagem_por_tipo)
 
     def calcular_tempo_total_consumo(self):
-        # Calcula o tempo total consumido (em segundos) somando todas as interações com duração válida
-        total = 0
-        for i in self.__interacoes_realizadas:
-            if isinstance(i.watch_duration_seconds, int) and i.watch_duration_seconds > 0:
-                total += i.watch_duration_seconds
-        return total
+        # Retorna o tempo total consumido (em segundos) nas interações com duração válida
+        return self.__tempo_total_consumo
 
     def calcular_media_tempo_consumo(self):
         # Calcula a média do tempo consumido nas interações que possuem duração válida
-        duracoes = []
-        for i in self.__interacoes_realizadas:
-            d = i.watch_duration_seconds
-            if isinstance(d, int) and d > 0:
-                duracoes.append(d)
-        if duracoes:
-            return sum(duracoes) / len(duracoes)
+        if self.__quantidade_duracoes_validas:
+            return self.__tempo_total_consumo / self.__quantidade_duracoes_validas
         else:
             return 0
 
+    def calcular_quantidade_comentarios(self):
+        # Retorna a quantidade de comentários feitos pelo usuário (O(1))
+        return self.__quantidade_comentarios
+
+    def exportar_agregados(self):
+        # Exporta os agregados em estruturas simples, com plataformas e conteúdos representados por id (usado pelo snapshot)
+        return [
+            list(self.__contagem_por_tipo.items()),
+            self.__total_engajamento,
+            self.__tempo_total_consumo,
+            self.__quantidade_duracoes_validas,
+            self.__quantidade_comentarios,
+            [(p.id_plataforma, t) for p, t in self.__tempo_por_plataforma.items()],
+            [(p.id_plataforma, n) for p, n in self.__contagem_por_plataforma.items()],
+            [c.id_conteudo for c in self.__conteudos_unicos],
+        ]
+
+    def restaurar_agregados(self, dados, plataformas_por_id, conteudos_por_id):
+        # Restaura os agregados exportados, resolvendo ids de plataforma e de conteúdo para os objetos
+        (tipos, self.__total_engajamento, self.__tempo_total_consumo, self.__quantidade_duracoes_validas,
+         self.__quantidade_comentarios, tempo_plataforma, contagem_plataforma, conteudos) = dados
+        self.__contagem_por_tipo = dict(tipos)
+        self.__tempo_por_plataforma = {plataformas_por_id[p]: t for p, t in tempo_plataforma}
+        self.__contagem_por_plataforma = Counter({plataformas_por_id[p]: n for p, n in contagem_plataforma})
+        self.__conteudos_unicos = {conteudos_por_id[c] for c in conteudos}
+
+    def mesclar_agregados(self, dados, plataformas_por_id, conteudos_por_id):
+        # Soma agregados parciais no formato de exportar_agregados (ex.: de um bloco do CSV processado em outro processo)
+        (tipos, engajamento, tempo, duracoes_validas, comentarios, tempo_plataforma, contagem_plataforma,
+         conteudos) = dados
+        for tipo, quantidade in tipos:
+            self.__contagem_por_tipo[tipo] = self.__contagem_por_tipo.get(tipo, 0) + quantidade
+        self.__total_engajamento += engajamento
+        self.__tempo_total_consumo += tempo
+        self.__quantidade_duracoes_validas += duracoes_validas
+        self.__quantidade_comentarios += comentarios
+        for id_plataforma, segundos in tempo_plataforma:
+            plataforma = plataformas_por_id[id_plataforma]
+            self.__tempo_por_plataforma[plataforma] = self.__tempo_por_plataforma.get(plataforma, 0) + segundos
+        for id_plataforma, quantidade in contagem_plataforma:
+            self.__contagem_por_plataforma[plataformas_por_id[id_plataforma]] += quantidade
+        self.__conteudos_unicos.update(conteudos_por_id[c] for c in conteudos)
+
     def listar_comentarios(self):
         # Retorna uma lista de todos os comentários (texto) feitos pelo usuário
         comentarios = []
@@ -0,0 +1,179 @@
+from estruturas_dados.arvore_binaria_busca import NoArvore, ArvoreBinariaBusca, _tamanho
+
+
+class NoAVL(NoArvore):
+    """
+    Nó da Árvore AVL.
+    Além dos campos do nó da BST, guarda a altura da subárvore enraizada nele.
+    """
+
+    def __init__(self, chave, valor):
+        super().__init__(chave, valor)
+        self.altura = 1
+
+
+class ArvoreAVL(ArvoreBinariaBusca):
+    """
+    Árvore AVL (BST autobalanceada) com a mesma interface da ArvoreBinariaBusca.
+    Após cada inserção ou remoção, as alturas e os tamanhos das subárvores do caminho
+    percorrido são atualizados e rotações mantêm a diferença de altura entre subárvores
+    em no máximo 1.
+
+    Todas as operações são iterativas (usam uma pilha com o caminho da raiz até o nó),
+    portanto não dependem do limite de recursão do Python, mesmo com chaves inseridas
+    em ordem crescente (caso comum nos CSVs ordenados por id).
+
+    Complexidades (pior caso):
+    - Inserção, busca e remoção: O(log n)
+    - percurso_em_ordem: O(n); iterar_intervalo / buscar_intervalo: O(log n + k), k = pares gerados
+    - piso, teto, antecessor, sucessor, posicao, selecionar: O(log n)
+    - a_partir_de_ordenados: O(n), já balanceada (altura mínima); mesclar: O(n + m)
+    """
+
+    CLASSE_NO = NoAVL
+
+    # --- Auxiliares de altura e rotação ---
+
+    @staticmethod
+    def _altura(no):
+        return no.altura if no is not None else 0
+
+    def _atualizar(self, no):
+        no.altura = 1 + max(self._altura(no.esquerdo), self._altura(no.direito))
+        no.tamanho = 1 + _tamanho(no.esquerdo) + _tamanho(no.direito)
+
+    def _fator_balanceamento(self, no):
+        return self._altura(no.esquerdo) - self._altura(no.direito)
+
+    def _rotacionar_direita(self, no):
+        novo_topo = no.esquerdo
+        no.esquerdo = novo_topo.direito
+        novo_topo.direito = no
+        self._atualizar(no)
+        self._atualizar(novo_topo)
+        return novo_topo
+
+    def _rotacionar_esquerda(self, no):
+        novo_topo = no.direito
+        no.direito = novo_topo.esquerdo
+        novo_topo.esquerdo = no
+        self._atualizar(no)
+        self._atualizar(novo_topo)
+        return novo_topo
+
+    def _rebalancear(self, no):
+        """
+        Atualiza a altura do nó e aplica as rotações necessárias.
+        Retorna a nova raiz da subárvore.
+        """
+        self._atualizar(no)
+        fator = self._fator_balanceamento(no)
+        if fator > 1:
+            # Caso esquerda-direita: rotação dupla
+            if self._fator_balanceamento(no.esquerdo) < 0:
+                no.esquerdo = self._rotacionar_esquerda(no.esquerdo)
+            return self._rotacionar_direita(no)
+        if fator < -1:
+            # Caso direita-esquerda: rotação dupla
+            if self._fator_balanceamento(no.direito) > 0:
+                no.direito = self._rotacionar_direita(no.direito)
+            return self._rotacionar_esquerda(no)
+        return no
+
+    def _rebalancear_caminho(self, caminho):
+        """
+        Percorre o caminho (lista de nós da raiz até o ponto alterado) de baixo para cima,
+        rebalanceando cada nó e religando a subárvore resultante ao seu pai.
+        """
+        for i in range(len(caminho) - 1, -1, -1):
+            no = caminho[i]
+            nova_raiz = self._rebalancear(no)
+            if i == 0:
+                self.raiz = nova_raiz
+            else:
+                pai = caminho[i - 1]
+                if pai.esquerdo is no:
+                    pai.esquerdo = nova_raiz
+                else:
+                    pai.direito = nova_raiz
+
+    # --- Operações principais ---
+
+    def inserir(self, chave, valor):
+        """
+        Insere um novo nó na árvore.
+        Se a chave já existir, substitui o valor.
+        Complexidade: O(log n)
+        """
+        if self.raiz is None:
+            self.raiz = NoAVL(chave, valor)
+            return
+
+        caminho = []
+        atual = self.raiz
+        while atual is not None:
+            caminho.append(atual)
+            if chave < atual.chave:
+                atual = atual.esquerdo
+            elif chave > atual.chave:
+                atual = atual.direito
+            else:
+                # Chave já existe, atualiza valor (estrutura não muda)
+                atual.valor = valor
+                return
+
+        pai = caminho[-1]
+        if chave < pai.chave:
+            pai.esquerdo = NoAVL(chave, valor)
+        else:
+            pai.direito = NoAVL(chave, valor)
+        self._rebalancear_caminho(caminho)
+
+    def buscar(self, chave):
+        """
+        Busca o valor associado à chave.
+        Retorna None se não encontrar.
+        Complexidade: O(log n)
+        """
+        atual = self.raiz
+        while atual is not None:
+            if chave == atual.chave:
+                return atual.valor
+            atual = atual.esquerdo if chave < atual.chave else atual.direito
+        return None
+
+    def remover(self, chave):
+        """
+        Remove o nó com a chave especificada (não faz nada se a chave não existir).
+        Complexidade: O(log n)
+        """
+        caminho = []
+        atual = self.raiz
+        while atual is not None and atual.chave != chave:
+            caminho.append(atual)
+            atual = atual.esquerdo if chave < atual.chave else atual.direito
+        if atual is None:
+            return
+
+        if atual.esquerdo is not None and atual.direito is not None:
+            # Nó com dois filhos: copia o sucessor e passa a remover o sucessor
+            caminho.append(atual)
+            sucessor = atual.direito
+            while sucessor.esquerdo is not None:
+                caminho.append(sucessor)
+                sucessor = sucessor.esquerdo
+            atual.chave = sucessor.chave
+            atual.valor = sucessor.valor
+            atual = sucessor
+
+        # Aqui o nó tem no máximo um filho
+        filho = atual.esquerdo if atual.esquerdo is not None else atual.direito
+        if not caminho:
+            self.raiz = filho
+            return
+        pai = caminho[-1]
+        if pai.esquerdo is atual:
+            pai.esquerdo = filho
+        else:
+            pai.direito = filho
+        self._rebalancear_caminho(caminho)
@@ -1,7 +1,8 @@
 class NoArvore:
     """
     Nó da Árvore Binária de Busca.
-    Cada nó armazena uma chave (id), o valor (objeto) e referências para os filhos esquerdo e direito.
+    Cada nó armazena uma chave (id), o valor (objeto), referências para os filhos esquerdo e direito
+    e o tamanho (quantidade de nós) da subárvore enraizada nele, usado nas consultas por posição.
     """
 
     def __init__(self, chave, valor):
@@ -9,6 +10,11 @@ class NoArvore:
         self.valor = valor
         self.esquerdo = None
         self.direito = None
+        self.tamanho = 1
+
+
+def _tamanho(no):
+    return no.tamanho if no is not None else 0
 
 class ArvoreBinariaBusca:
     """
@@ -21,15 +27,93 @@ class ArvoreBinariaBusca:
     - buscar: retorna o valor dado a chave.
     - remover: remove um nó pela chave.
     - percurso_em_ordem: retorna lista dos valores em ordem crescente das chaves.
+    - iterar_em_ordem / iterar_intervalo: geram os pares sob demanda, sem montar a lista.
+    - buscar_intervalo, piso, teto, antecessor, sucessor: consultas por ordem das chaves.
+    - posicao / selecionar: estatísticas de ordem (usam o tamanho de cada subárvore).
+    - a_partir_de_ordenados: constrói a árvore já balanceada a partir de pares ordenados.
+    - mesclar: junta outra árvore a esta, intercalando os dois percursos em ordem.
 
     Complexidades médias:
     - Inserção, busca e remoção: O(log n) em árvores balanceadas,
       mas pode degradar para O(n) em piores casos (árvore degenerada).
+    - Consultas por ordem: O(h), h = altura; buscar_intervalo: O(h + k), k = pares retornados.
+    - a_partir_de_ordenados: O(n); mesclar: O(n + m).
     """
 
+    # Classe dos nós criados pela árvore (a AVL usa nós com altura)
+    CLASSE_NO = NoArvore
+
     def __init__(self):
         self.raiz = None
 
+    def __len__(self):
+        return _tamanho(self.raiz)
+
+    def _atualizar(self, no):
+        no.tamanho = 1 + _tamanho(no.esquerdo) + _tamanho(no.direito)
+
+    @classmethod
+    def a_partir_de_ordenados(cls, pares):
+        """
+        Cria a árvore a partir de pares (chave, valor) em ordem estritamente crescente de chave,
+        tomando o elemento do meio de cada trecho como raiz: a árvore resultante é perfeitamente
+        balanceada (altura mínima), sem comparações nem rotações.
+        Lança ValueError se as chaves não estiverem em ordem estritamente crescente.
+        Complexidade: O(n)
+        """
+        pares = list(pares)
+        for i in range(1, len(pares)):
+            if not pares[i - 1][0] < pares[i][0]:
+                raise ValueError("As chaves devem estar em ordem estritamente crescente.")
+        arvore = cls()
+        arvore.raiz = arvore._construir_balanceada(pares, 0, len(pares))
+        return arvore
+
+    def _construir_balanceada(self, pares, inicio, fim):
+        # Recursão de profundidade O(log n)
+        if inicio >= fim:
+            return None
+        meio = (inicio + fim) // 2
+        chave, valor = pares[meio]
+        no = self.CLASSE_NO(chave, valor)
+        no.esquerdo = self._construir_balanceada(pares, inicio, meio)
+        no.direito = self._construir_balanceada(pares, meio + 1, fim)
+        self._atualizar(no)
+        return no
+
+    def mesclar(self, outra, combinar=None):
+        """
+        Junta as chaves de `outra` a esta árvore (que é reconstruída balanceada; `outra` não muda).
+        Os dois percursos em ordem são intercalados como no Merge Sort. Para uma chave presente
+        nas duas, o valor fica combinar(valor_desta, valor_da_outra), ou o da outra se combinar
+        for None (como em inserir).
+        Complexidade: O(n + m)
+        """
+        pares = []
+        esta = self.iterar_em_ordem()
+        da_outra = outra.iterar_em_ordem()
+        par_esta = next(esta, None)
+        par_outra = next(da_outra, None)
+        while par_esta is not None and par_outra is not None:
+            if par_esta[0] < par_outra[0]:
+                pares.append(par_esta)
+                par_esta = next(esta, None)
+            elif par_outra[0] < par_esta[0]:
+                pares.append(par_outra)
+                par_outra = next(da_outra, None)
+            else:
+                valor = combinar(par_esta[1], par_outra[1]) if combinar is not None else par_outra[1]
+                pares.append((par_esta[0], valor))
+                par_esta = next(esta, None)
+                par_outra = next(da_outra, None)
+        if par_esta is not None:
+            pares.append(par_esta)
+            pares.extend(esta)
+        if par_outra is not None:
+            pares.append(par_outra)
+            pares.extend(da_outra)
+        self.raiz = self._construir_balanceada(pares, 0, len(pares))
+
     def inserir(self, chave, valor):
         """
         Insere um novo nó na árvore.
@@ -39,7 +123,7 @@ class ArvoreBinariaBusca:
 
     def _inserir_rec(self, no_atual, chave, valor):
         if no_atual is None:
-            return NoArvore(chave, valor)
+            return self.CLASSE_NO(chave, valor)
         if chave < no_atual.chave:
             no_atual.esquerdo = self._inserir_rec(no_atual.esquerdo, chave, valor)
         elif chave > no_atual.chave:
@@ -47,6 +131,7 @@ class ArvoreBinariaBusca:
         else:
             # Chave já existe, atualiza valor
             no_atual.valor = valor
+        self._atualizar(no_atual)
         return no_atual
 
     def buscar(self, chave):
@@ -97,6 +182,7 @@ class ArvoreBinariaBusca:
             no_atual.valor = sucessor.valor
             # Remove o sucessor da subárvore direita
             no_atual.direito = self._remover_rec(no_atual.direito, sucessor.chave)
+        self._atualizar(no_atual)
         return no_atual
 
     def _minimo(self, no):
@@ -109,12 +195,164 @@ class ArvoreBinariaBusca:
         return atual
 
     def percurso_em_ordem(self):
-        resultado = []
-        self._em_ordem_rec(self.raiz, resultado)
-        return resultado  # Lista de (chave, valor)
-
-    def _em_ordem_rec(self, no, resultado):
-        if no is not None:
-            self._em_ordem_rec(no.esquerdo, resultado)
-            resultado.append((no.chave, no.valor))  # retorna tuplas
-            self._em_ordem_rec(no.direito, resultado)
\ No newline at end of file
+        return list(self.iterar_em_ordem())  # Lista de (chave, valor)
+
+    def iterar_em_ordem(self):
+        """
+        Gera (chave, valor) em ordem crescente das chaves, sob demanda.
+        Usa uma pilha explícita (não depende do limite de recursão, mesmo em árvore degenerada).
+        Complexidade: O(n) no total; O(h) de memória, h = altura da árvore
+        """
+        return self.iterar_intervalo()
+
+    def iterar_intervalo(self, minimo=None, maximo=None):
+        """
+        Gera (chave, valor) com minimo <= chave <= maximo, em ordem crescente
+        (limite None = sem limite). Subárvores fora do intervalo não são visitadas.
+        Complexidade: O(h + k), k = pares gerados
+        """
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                if minimo is not None and atual.chave < minimo:
+                    # Toda a subárvore esquerda também é menor que o mínimo
+                    atual = atual.direito
+                else:
+                    pilha.append(atual)
+                    atual = atual.esquerdo
+            if not pilha:
+                return
+            atual = pilha.pop()
+            if maximo is not None and atual.chave > maximo:
+                return
+            yield atual.chave, atual.valor
+            atual = atual.direito
+
+    def buscar_intervalo(self, minimo=None, maximo=None):
+        """
+        Retorna a lista de (chave, valor) com minimo <= chave <= maximo, em ordem crescente.
+        Complexidade: O(h + k), k = pares retornados
+        """
+        return list(self.iterar_intervalo(minimo, maximo))
+
+    def piso(self, chave):
+        """
+        Retorna (chave, valor) da maior chave <= chave informada, ou None.
+        Complexidade: O(h)
+        """
+        encontrado = None
+        atual = self.raiz
+        while atual is not None:
+            if atual.chave == chave:
+                return atual.chave, atual.valor
+            if atual.chave < chave:
+                encontrado = atual
+                atual = atual.direito
+            else:
+                atual = atual.esquerdo
+        return (encontrado.chave, encontrado.valor) if encontrado is not None else None
+
+    def teto(self, chave):
+        """
+        Retorna (chave, valor) da menor chave >= chave informada, ou None.
+        Complexidade: O(h)
+        """
+        encontrado = None
+        atual = self.raiz
+        while atual is not None:
+            if atual.chave == chave:
+                return atual.chave, atual.valor
+            if atual.chave > chave:
+                encontrado = atual
+                atual = atual.esquerdo
+            else:
+                atual = atual.direito
+        return (encontrado.chave, encontrado.valor) if encontrado is not None else None
+
+    def antecessor(self, chave):
+        """
+        Retorna (chave, valor) da maior chave estritamente menor que a informada, ou None
+        (a chave informada não precisa existir na árvore).
+        Complexidade: O(h)
+        """
+        encontrado = None
+        atual = self.raiz
+        while atual is not None:
+            if atual.chave < chave:
+                encontrado = atual
+                atual = atual.direito
+            else:
+                atual = atual.esquerdo
+        return (encontrado.chave, encontrado.valor) if encontrado is not None else None
+
+    def sucessor(self, chave):
+        """
+        Retorna (chave, valor) da menor chave estritamente maior que a informada, ou None
+        (a chave informada não precisa existir na árvore).
+        Complexidade: O(h)
+        """
+        encontrado = None
+        atual = self.raiz
+        while atual is not None:
+            if atual.chave > chave:
+                encontrado = atual
+                atual = atual.esquerdo
+            else:
+                atual = atual.direito
+        return (encontrado.chave, encontrado.valor) if encontrado is not None else None
+
+    def posicao(self, chave):
+        """
+        Retorna quantas chaves da árvore são menores que a informada (posição, a partir de 0,
+        que a chave ocupa ou ocuparia na ordem crescente).
+        Complexidade: O(h)
+        """
+        menores = 0
+        atual = self.raiz
+        while atual is not None:
+            if chave <= atual.chave:
+                atual = atual.esquerdo
+            else:
+                menores += 1 + _tamanho(atual.esquerdo)
+                atual = atual.direito
+        return menores
+
+    def selecionar(self, posicao):
+        """
+        Retorna (chave, valor) da chave na posição informada da ordem crescente (a partir de 0;
+        posições negativas contam do fim). Lança IndexError fora do intervalo.
+        Complexidade: O(h)
+        """
+        total = len(self)
+        if posicao < 0:
+            posicao += total
+        if not 0 <= posicao < total:
+            raise IndexError("Posição fora do intervalo da árvore.")
+        atual = self.raiz
+        while True:
+            tamanho_esquerdo = _tamanho(atual.esquerdo)
+            if posicao < tamanho_esquerdo:
+                atual = atual.esquerdo
+            elif posicao == tamanho_esquerdo:
+                return atual.chave, atual.valor
+            else:
+                posicao -= tamanho_esquerdo + 1
+                atual = atual.direito
+
+    def dividir_em_faixas(self, partes):
+        """
+        Divide as chaves em até `partes` faixas (minimo, maximo) contíguas com quantidades
+        de chaves iguais (diferença de no máximo 1), para repartir o processamento.
+        Complexidade: O(partes · h)
+        """
+        if partes <= 0:
+            raise ValueError("A quantidade de partes deve ser positiva.")
+        total = len(self)
+        partes = min(partes, total)
+        faixas = []
+        for parte in range(partes):
+            inicio = parte * total // partes
+            fim = (parte + 1) * total // partes - 1
+            faixas.append((self.selecionar(inicio)[0], self.selecionar(fim)[0]))
+        return faixas
@@ -1,42 +1,142 @@
 class Fila:
     """
-    Implementa uma fila FIFO (First-In, First-Out).
+    Implementa uma fila FIFO (First-In, First-Out) sobre um buffer circular.
     Operações principais:
     - enfileirar: adicionar elemento no final da fila.
     - desenfileirar: remover e retornar o elemento do início da fila.
-    - esta_vazia: verifica se a fila está vazia.
+    - enfileirar_lote / desenfileirar_lote: versões em lote das operações acima.
+    - esta_vazia / esta_cheia: verificam o estado da fila.
+
+    O buffer é uma lista de tamanho fixo com índices de início e quantidade de elementos;
+    quando enche, dobra de tamanho (custo amortizado O(1)). Assim, nenhum elemento
+    precisa ser deslocado ao desenfileirar.
+
+    Se capacidade_maxima for informada, a fila não cresce além dela: enfileirar em uma
+    fila cheia lança OverflowError e enfileirar_lote aceita apenas o que couber, para
+    que o produtor consuma a fila antes de continuar (contrapressão).
     """
 
-    def __init__(self):
-        self._elementos = []
+    CAPACIDADE_INICIAL = 16
+
+    def __init__(self, capacidade_maxima=None):
+        if capacidade_maxima is not None and capacidade_maxima <= 0:
+            raise ValueError("A capacidade máxima da fila deve ser positiva.")
+        self._capacidade_maxima = capacidade_maxima
+        capacidade = self.CAPACIDADE_INICIAL
+        if capacidade_maxima is not None:
+            capacidade = min(capacidade, capacidade_maxima)
+        self._elementos = [None] * capacidade
+        self._inicio = 0
+        self._quantidade = 0
+
+    @property
+    def capacidade_maxima(self):
+        return self._capacidade_maxima
+
+    def _crescer(self):
+        """
+        Dobra o buffer (limitado pela capacidade máxima), reposicionando os elementos
+        a partir do índice 0.
+        Complexidade: O(n), amortizado O(1) por inserção.
+        """
+        capacidade = len(self._elementos)
+        nova_capacidade = capacidade * 2
+        if self._capacidade_maxima is not None:
+            nova_capacidade = min(nova_capacidade, self._capacidade_maxima)
+        fim = self._inicio + self._quantidade
+        novos = self._elementos[self._inicio:min(fim, capacidade)]
+        if fim > capacidade:
+            novos.extend(self._elementos[:fim - capacidade])
+        novos.extend([None] * (nova_capacidade - len(novos)))
+        self._elementos = novos
+        self._inicio = 0
 
     def enfileirar(self, item):
         """
         Adiciona um item no final da fila.
-        Complexidade: O(1)
+        Lança OverflowError se a fila estiver na capacidade máxima.
+        Complexidade: O(1) amortizado
         """
-        self._elementos.append(item)
+        if self._quantidade == len(self._elementos):
+            if self.esta_cheia():
+                raise OverflowError("Fila cheia: capacidade máxima atingida.")
+            self._crescer()
+        posicao = (self._inicio + self._quantidade) % len(self._elementos)
+        self._elementos[posicao] = item
+        self._quantidade += 1
 
     def desenfileirar(self):
         """
         Remove e retorna o item do início da fila.
         Se a fila estiver vazia, retorna None.
-        Complexidade: O(n), pois lista precisa deslocar elementos.
+        Complexidade: O(1)
         """
         if self.esta_vazia():
             return None
-        return self._elementos.pop(0)
+        item = self._elementos[self._inicio]
+        self._elementos[self._inicio] = None  # Libera a referência
+        self._inicio = (self._inicio + 1) % len(self._elementos)
+        self._quantidade -= 1
+        return item
+
+    def enfileirar_lote(self, itens):
+        """
+        Enfileira os itens de um iterável, em ordem, até acabar o iterável ou a fila encher.
+        Retorna a quantidade de itens enfileirados. Em uma fila limitada, o iterável não é
+        consumido além do que coube, então o mesmo iterador pode ser reenviado depois que a
+        fila for esvaziada.
+        Complexidade: O(k), k = itens enfileirados
+        """
+        iterador = iter(itens)
+        enfileirados = 0
+        # Verifica o espaço antes de consumir o próximo item, para não perdê-lo
+        while not self.esta_cheia():
+            try:
+                item = next(iterador)
+            except StopIteration:
+                break
+            self.enfileirar(item)
+            enfileirados += 1
+        return enfileirados
+
+    def desenfileirar_lote(self, quantidade=None):
+        """
+        Remove e retorna uma lista com até `quantidade` itens do início da fila
+        (todos, se quantidade for None).
+        Complexidade: O(k), k = itens retornados
+        """
+        if quantidade is None or quantidade > self._quantidade:
+            quantidade = self._quantidade
+        capacidade = len(self._elementos)
+        fim = self._inicio + quantidade
+        if fim <= capacidade:
+            lote = self._elementos[self._inicio:fim]
+            self._elementos[self._inicio:fim] = [None] * quantidade
+        else:
+            lote = self._elementos[self._inicio:] + self._elementos[:fim - capacidade]
+            self._elementos[self._inicio:] = [None] * (capacidade - self._inicio)
+            self._elementos[:fim - capacidade] = [None] * (fim - capacidade)
+        self._inicio = fim % capacidade if capacidade else 0
+        self._quantidade -= quantidade
+        return lote
 
     def esta_vazia(self):
         """
         Retorna True se a fila estiver vazia, False caso contrário.
         Complexidade: O(1)
         """
-        return len(self._elementos) == 0
+        return self._quantidade == 0
+
+    def esta_cheia(self):
+        """
+        Retorna True se a fila tiver capacidade máxima e ela tiver sido atingida.
+        Complexidade: O(1)
+        """
+        return self._capacidade_maxima is not None and self._quantidade >= self._capacidade_maxima
 
     def tamanho(self):
         """
         Retorna o tamanho atual da fila.
         Complexidade: O(1)
         """
-        return len(self._elementos)
+        return self._quantidade
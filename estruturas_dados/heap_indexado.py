@@ -0,0 +1,185 @@
+from heapq import heappush, heappop
+
+from estruturas_dados.selecao import ChaveInvertida
+
+
+class HeapIndexado:
+    """
+    Heap binário em que cada chave aparece uma única vez e tem a sua posição no
+    vetor guardada em um dicionário. Assim a prioridade de uma chave já presente
+    pode ser alterada (ou a chave removida) sem busca linear.
+
+    Por padrão é um heap de mínimo; com maximo=True, o topo é a maior prioridade.
+    Empates entre prioridades iguais não têm ordem garantida; use prioridades em
+    tupla (ex.: (contagem, -id)) quando a ordem dos empates importar.
+
+    Complexidades:
+    - a_partir_de: O(n)
+    - inserir_ou_atualizar / remover / extrair_topo / substituir_topo: O(log n)
+    - topo / prioridade / in: O(1)
+    - primeiros(k): O(k log k)
+    """
+
+    def __init__(self, maximo=False):
+        self._maximo = maximo
+        self._itens = []       # [prioridade, chave] em ordem de heap
+        self._posicoes = {}    # chave -> posição em _itens
+
+    @classmethod
+    def a_partir_de(cls, pares, maximo=False):
+        """
+        Monta o heap a partir de [(chave, prioridade)] com chaves distintas, descendo
+        cada nó interno de baixo para cima (heapify), sem inserir um item por vez.
+        Complexidade: O(n)
+        """
+        heap = cls(maximo)
+        heap._itens = [[prioridade, chave] for chave, prioridade in pares]
+        heap._posicoes = {item[1]: posicao for posicao, item in enumerate(heap._itens)}
+        for posicao in range(len(heap._itens) // 2 - 1, -1, -1):
+            heap._descer(posicao)
+        return heap
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, chave):
+        return chave in self._posicoes
+
+    def _antes(self, a, b):
+        # True se a prioridade a deve ficar acima de b no heap
+        return a > b if self._maximo else a < b
+
+    # _subir e _descer movem um "buraco" em vez de trocar pares a cada nível:
+    # cada item deslocado tem a posição atualizada uma vez e o item movido só no final.
+    def _subir(self, i):
+        itens, posicoes, maximo = self._itens, self._posicoes, self._maximo
+        item = itens[i]
+        prioridade = item[0]
+        while i > 0:
+            pai = (i - 1) >> 1
+            prioridade_pai = itens[pai][0]
+            if not (prioridade > prioridade_pai if maximo else prioridade < prioridade_pai):
+                break
+            itens[i] = itens[pai]
+            posicoes[itens[i][1]] = i
+            i = pai
+        itens[i] = item
+        posicoes[item[1]] = i
+
+    def _descer(self, i):
+        itens, posicoes, maximo = self._itens, self._posicoes, self._maximo
+        tamanho = len(itens)
+        item = itens[i]
+        prioridade = item[0]
+        while True:
+            filho = 2 * i + 1
+            if filho >= tamanho:
+                break
+            prioridade_filho = itens[filho][0]
+            direito = filho + 1
+            if direito < tamanho:
+                prioridade_direito = itens[direito][0]
+                if (prioridade_direito > prioridade_filho if maximo
+                        else prioridade_direito < prioridade_filho):
+                    filho, prioridade_filho = direito, prioridade_direito
+            if not (prioridade_filho > prioridade if maximo else prioridade_filho < prioridade):
+                break
+            itens[i] = itens[filho]
+            posicoes[itens[i][1]] = i
+            i = filho
+        itens[i] = item
+        posicoes[item[1]] = i
+
+    def inserir_ou_atualizar(self, chave, prioridade):
+        """
+        Insere a chave ou altera a sua prioridade, restaurando a propriedade do heap.
+        """
+        posicao = self._posicoes.get(chave)
+        if posicao is None:
+            self._itens.append([prioridade, chave])
+            posicao = self._posicoes[chave] = len(self._itens) - 1
+            self._subir(posicao)
+            return
+        anterior = self._itens[posicao][0]
+        self._itens[posicao][0] = prioridade
+        if self._antes(prioridade, anterior):
+            self._subir(posicao)
+        else:
+            self._descer(posicao)
+
+    def prioridade(self, chave):
+        """
+        Retorna a prioridade da chave (KeyError se não estiver no heap).
+        """
+        return self._itens[self._posicoes[chave]][0]
+
+    def remover(self, chave):
+        """
+        Remove a chave do heap (KeyError se não estiver no heap).
+        """
+        posicao = self._posicoes.pop(chave)
+        ultimo = self._itens.pop()
+        if posicao == len(self._itens):
+            return
+        self._itens[posicao] = ultimo
+        self._posicoes[ultimo[1]] = posicao
+        self._subir(posicao)
+        self._descer(self._posicoes[ultimo[1]])
+
+    def topo(self):
+        """
+        Retorna (chave, prioridade) do topo, sem remover. IndexError se estiver vazio.
+        """
+        if not self._itens:
+            raise IndexError("Heap vazio.")
+        prioridade, chave = self._itens[0]
+        return chave, prioridade
+
+    def extrair_topo(self):
+        """
+        Remove e retorna (chave, prioridade) do topo.
+        """
+        chave, prioridade = self.topo()
+        self.remover(chave)
+        return chave, prioridade
+
+    def substituir_topo(self, chave, prioridade):
+        """
+        Remove o topo e insere (chave, prioridade) com uma única descida, retornando
+        o (chave, prioridade) removido. A chave nova não pode estar no heap.
+        """
+        chave_removida, prioridade_removida = self.topo()
+        del self._posicoes[chave_removida]
+        self._itens[0] = [prioridade, chave]
+        self._posicoes[chave] = 0
+        self._descer(0)
+        return chave_removida, prioridade_removida
+
+    def primeiros(self, k):
+        """
+        Retorna os k primeiros (chave, prioridade) na ordem do heap, sem alterá-lo.
+        Percorre o heap a partir da raiz com uma fronteira auxiliar de no máximo
+        k + 1 posições, então não depende do tamanho total.
+        """
+        resultado = []
+        if k <= 0 or not self._itens:
+            return resultado
+        # heapq é de mínimo: no heap de máximo a prioridade é invertida
+        chave_fronteira = ChaveInvertida if self._maximo else (lambda prioridade: prioridade)
+        itens = self._itens
+        fronteira = [(chave_fronteira(itens[0][0]), 0)]
+        while fronteira and len(resultado) < k:
+            _, posicao = heappop(fronteira)
+            prioridade, chave = itens[posicao]
+            resultado.append((chave, prioridade))
+            for filho in (2 * posicao + 1, 2 * posicao + 2):
+                if filho < len(itens):
+                    heappush(fronteira, (chave_fronteira(itens[filho][0]), filho))
+        return resultado
+
+    def itens(self):
+        """
+        Retorna [(chave, prioridade)] em ordem arbitrária.
+        """
+        return [(chave, prioridade) for prioridade, chave in self._itens]
+
@@ -0,0 +1,94 @@
+class HistogramaDuracoes:
+    """
+    Acumulador de durações (inteiros) que guarda soma, contagem e a frequência
+    de cada valor distinto. Permite obter média, mediana e percentis sem
+    guardar nem percorrer novamente os valores individuais.
+
+    Complexidades:
+    - adicionar: O(1)
+    - media: O(1)
+    - mediana / percentil: O(d log d) na primeira consulta após novos valores
+      distintos (d = valores distintos), O(d) nas seguintes.
+    """
+
+    def __init__(self):
+        self._frequencias = {}
+        self._soma = 0
+        self._contagem = 0
+        self._valores_ordenados = None  # Cache das chaves ordenadas
+
+    @property
+    def soma(self):
+        return self._soma
+
+    @property
+    def contagem(self):
+        return self._contagem
+
+    def adicionar(self, valor, quantidade=1):
+        """
+        Registra `quantidade` ocorrências de `valor`.
+        """
+        if valor not in self._frequencias:
+            self._frequencias[valor] = 0
+            self._valores_ordenados = None
+        self._frequencias[valor] += quantidade
+        self._soma += valor * quantidade
+        self._contagem += quantidade
+
+    def exportar(self):
+        """
+        Retorna as frequências como lista de pares (valor, quantidade).
+        """
+        return list(self._frequencias.items())
+
+    @classmethod
+    def a_partir_de(cls, pares):
+        """
+        Reconstrói o histograma a partir dos pares exportados.
+        """
+        histograma = cls()
+        for valor, quantidade in pares:
+            histograma.adicionar(valor, quantidade)
+        return histograma
+
+    def media(self):
+        if self._contagem == 0:
+            return 0
+        return self._soma / self._contagem
+
+    def _valor_na_posicao(self, posicao):
+        """
+        Retorna o valor da posição (0-based) na sequência ordenada de todas as ocorrências.
+        """
+        if self._valores_ordenados is None:
+            self._valores_ordenados = sorted(self._frequencias)
+        acumulado = 0
+        for valor in self._valores_ordenados:
+            acumulado += self._frequencias[valor]
+            if posicao < acumulado:
+                return valor
+        return self._valores_ordenados[-1]
+
+    def percentil(self, p):
+        """
+        Percentil p (0 a 100) pelo método do posto mais próximo (nearest-rank).
+        Retorna 0 se não houver valores.
+        """
+        if self._contagem == 0:
+            return 0
+        if not 0 <= p <= 100:
+            raise ValueError("O percentil deve estar entre 0 e 100.")
+        posto = max(1, -(-p * self._contagem // 100))  # teto de p% de n
+        return self._valor_na_posicao(int(posto) - 1)
+
+    def mediana(self):
+        """
+        Mediana dos valores (média dos dois centrais quando a contagem é par).
+        """
+        if self._contagem == 0:
+            return 0
+        meio = self._contagem // 2
+        if self._contagem % 2:
+            return self._valor_na_posicao(meio)
+        return (self._valor_na_posicao(meio - 1) + self._valor_na_posicao(meio)) / 2
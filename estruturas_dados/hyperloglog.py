@@ -0,0 +1,168 @@
+import hashlib
+import math
+from array import array
+from collections import Counter
+
+MASCARA_64 = (1 << 64) - 1
+
+
+def hash_64(valor):
+    """
+    Hash de 64 bits bem distribuído e estável entre execuções (ao contrário de hash()).
+    Inteiros passam pelo finalizador do splitmix64; textos e bytes, pelo blake2b.
+    """
+    if isinstance(valor, int):
+        valor = (valor + 0x9E3779B97F4A7C15) & MASCARA_64
+        valor = ((valor ^ (valor >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+        valor = ((valor ^ (valor >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+        return valor ^ (valor >> 31)
+    if isinstance(valor, str):
+        valor = valor.encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(valor, digest_size=8).digest(), 'little')
+
+
+class HyperLogLog:
+    """
+    Estimativa da quantidade de elementos distintos (ex.: usuários únicos) em memória
+    fixa de 2^precisao bytes, com erro padrão relativo de cerca de 1,04 / sqrt(2^precisao)
+    (precisão 12: 4 KB e ~1,6%).
+
+    Os primeiros `precisao` bits do hash escolhem um registrador, que guarda a maior
+    posição do primeiro bit 1 vista nos bits restantes. Sketches de mesma precisão
+    podem ser mesclados (máximo por registrador), o que equivale a contar a união.
+
+    Enquanto poucos registradores estão ocupados, eles ficam em um dicionário
+    (representação esparsa), que é trocado pelo vetor completo ao passar de
+    2^precisao / 64 entradas: conjuntos pequenos não pagam os 2^precisao bytes.
+
+    Complexidades:
+    - adicionar / adicionar_hash: O(1)
+    - estimar / mesclar: O(2^precisao)
+    - exportar / a_partir_de: O(2^precisao) no vetor completo, O(registradores ocupados) no esparso
+    """
+
+    PRECISAO_MINIMA = 4
+    PRECISAO_MAXIMA = 16
+    PRECISAO_PADRAO = 12
+
+    __slots__ = ("_precisao", "_esparso", "_registradores")
+
+    def __init__(self, precisao=PRECISAO_PADRAO):
+        if not self.PRECISAO_MINIMA <= precisao <= self.PRECISAO_MAXIMA:
+            raise ValueError(f"A precisão deve estar entre {self.PRECISAO_MINIMA} e {self.PRECISAO_MAXIMA}.")
+        self._precisao = precisao
+        self._esparso = {}             # registrador -> valor (enquanto pequeno)
+        self._registradores = None     # bytearray de 2^precisao posições (após crescer)
+
+    @property
+    def precisao(self):
+        return self._precisao
+
+    @property
+    def erro_padrao(self):
+        return 1.04 / math.sqrt(1 << self._precisao)
+
+    def adicionar(self, valor):
+        self.adicionar_hash(hash_64(valor))
+
+    def adicionar_hash(self, valor_hash):
+        """
+        Registra um hash de 64 bits já calculado (permite calcular o hash uma vez
+        e atualizar vários sketches).
+        """
+        bits_restantes = 64 - self._precisao
+        indice = valor_hash >> bits_restantes
+        rank = bits_restantes - (valor_hash & ((1 << bits_restantes) - 1)).bit_length() + 1
+        registradores = self._registradores
+        if registradores is not None:
+            if rank > registradores[indice]:
+                registradores[indice] = rank
+        elif rank > self._esparso.get(indice, 0):
+            self._esparso[indice] = rank
+            if len(self._esparso) > (1 << self._precisao) // 64:
+                self._densificar()
+
+    def _densificar(self):
+        registradores = bytearray(1 << self._precisao)
+        for indice, rank in self._esparso.items():
+            registradores[indice] = rank
+        self._registradores = registradores
+        self._esparso = None
+
+    def estimar(self):
+        """
+        Retorna a quantidade estimada de elementos distintos. Para cardinalidades
+        pequenas usa a contagem linear (registradores vazios), que é mais precisa.
+        """
+        tamanho = 1 << self._precisao
+        if self._registradores is not None:
+            frequencias = Counter(self._registradores)
+        else:
+            frequencias = Counter(self._esparso.values())
+            frequencias[0] += tamanho - len(self._esparso)
+        soma = sum(quantidade * 2.0 ** -rank for rank, quantidade in frequencias.items())
+
+        if tamanho == 16:
+            alfa = 0.673
+        elif tamanho == 32:
+            alfa = 0.697
+        elif tamanho == 64:
+            alfa = 0.709
+        else:
+            alfa = 0.7213 / (1 + 1.079 / tamanho)
+        estimativa = alfa * tamanho * tamanho / soma
+
+        vazios = frequencias.get(0, 0)
+        if estimativa <= 2.5 * tamanho and vazios:
+            estimativa = tamanho * math.log(tamanho / vazios)
+        return int(round(estimativa))
+
+    def mesclar(self, outro):
+        """
+        Acrescenta a este sketch os elementos de `outro` (união). ValueError se as precisões diferirem.
+        """
+        if outro._precisao != self._precisao:
+            raise ValueError("Só é possível mesclar sketches de mesma precisão.")
+        if outro._registradores is None:
+            for indice, rank in outro._esparso.items():
+                if self._registradores is not None:
+                    if rank > self._registradores[indice]:
+                        self._registradores[indice] = rank
+                elif rank > self._esparso.get(indice, 0):
+                    self._esparso[indice] = rank
+            if self._registradores is None and len(self._esparso) > (1 << self._precisao) // 64:
+                self._densificar()
+            return
+        if self._registradores is None:
+            self._densificar()
+        self._registradores = bytearray(map(max, self._registradores, outro._registradores))
+
+    def exportar(self):
+        """
+        Retorna os registradores em bytes (para o snapshot): o vetor completo, com
+        2^precisao bytes, ou, na representação esparsa, um array('i') de
+        (registrador << 8) | valor, sempre menor que o vetor completo.
+        """
+        if self._registradores is not None:
+            return bytes(self._registradores)
+        return array('i', [(indice << 8) | rank for indice, rank in self._esparso.items()]).tobytes()
+
+    @classmethod
+    def a_partir_de(cls, precisao, dados):
+        """
+        Reconstrói o sketch a partir dos bytes de exportar.
+        """
+        sketch = cls(precisao)
+        if len(dados) == 1 << precisao:
+            sketch._registradores = bytearray(dados)
+            sketch._esparso = None
+        else:
+            entradas = array('i')
+            entradas.frombytes(dados)
+            sketch._esparso = {entrada >> 8: entrada & 0xFF for entrada in entradas}
+        return sketch
+
+    def copiar(self):
+        copia = HyperLogLog(self._precisao)
+        copia.mesclar(self)
+        return copia
@@ -0,0 +1,246 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+from entidades.interacao import datetime_para_epoch
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+
+
+def instante_para_epoch(instante):
+    """
+    Converte o limite de uma janela (None, segundos desde a época, datetime ou texto
+    ISO 'AAAA-MM-DD HH:MM:SS') em segundos desde a época.
+    Lança ValueError para texto em formato inválido.
+    """
+    if instante is None or isinstance(instante, int):
+        return instante
+    if isinstance(instante, datetime):
+        return datetime_para_epoch(instante)
+    return datetime_para_epoch(datetime.fromisoformat(instante))
+
+
+class _Bucket:
+    __slots__ = ("por_conteudo", "por_plataforma", "linhas")
+
+    def __init__(self):
+        self.por_conteudo = {}     # id_conteudo -> agregado
+        self.por_plataforma = {}   # id_plataforma -> agregado
+        self.linhas = array('q')   # índices das linhas do intervalo (para bordas da janela)
+
+
+class IndiceTemporal:
+    """
+    Índice das interações por intervalos de tempo fixos (buckets, por padrão de 1 hora),
+    construído sobre as colunas do ArmazenamentoColunarInteracoes.
+
+    Cada bucket guarda agregados prontos por conteúdo e por plataforma, no formato de
+    lista: uma contagem por tipo (na ordem de TIPOS_INTERACAO), seguida do tempo total
+    consumido e da quantidade de durações válidas (> 0). Uma consulta [inicio, fim)
+    soma os agregados dos buckets inteiramente dentro da janela e filtra, linha a linha,
+    apenas os (no máximo dois) buckets das bordas.
+
+    As linhas novas do armazenamento são indexadas sob demanda (atualizar), então o
+    índice acompanha a ingestão em lote, incremental ou a restauração de um snapshot.
+    O snapshot guarda os buckets já montados (exportar / restaurar); cada bucket
+    restaurado só vira dicionários no primeiro acesso.
+
+    Complexidades:
+    - atualizar: O(k), k = linhas novas
+    - exportar: O(B · e + m); restaurar: O(B), m = linhas indexadas
+    - agregar: O(log B + w · e + r), B = buckets, w = buckets na janela,
+      e = entradas por bucket, r = linhas dos buckets das bordas
+    """
+
+    TAMANHO_BUCKET_PADRAO = 3600
+    QUANTIDADE_TIPOS = len(ArmazenamentoColunarInteracoes.TIPOS_INTERACAO)
+    # Posições do tempo total e da quantidade de durações válidas no agregado
+    POSICAO_TEMPO = QUANTIDADE_TIPOS
+    POSICAO_DURACOES = QUANTIDADE_TIPOS + 1
+
+    def __init__(self, armazenamento, tamanho_bucket=TAMANHO_BUCKET_PADRAO):
+        if tamanho_bucket <= 0:
+            raise ValueError("O tamanho do bucket deve ser positivo.")
+        self._armazenamento = armazenamento
+        self._tamanho_bucket = tamanho_bucket
+        self._buckets = {}
+        self._chaves = []            # chaves dos buckets em ordem crescente
+        self._linhas_indexadas = 0
+        self._restaurados = None     # colunas exportadas de um snapshot (ver restaurar)
+        self._pendentes = {}         # chave -> posição do bucket restaurado ainda não montado
+
+    @property
+    def tamanho_bucket(self):
+        return self._tamanho_bucket
+
+    def __len__(self):
+        return len(self._chaves)
+
+    def _novo_agregado(self):
+        return [0] * (self.QUANTIDADE_TIPOS + 2)
+
+    def atualizar(self):
+        """
+        Indexa as linhas acrescentadas ao armazenamento desde a última atualização.
+        """
+        armazenamento = self._armazenamento
+        total = len(armazenamento)
+        if self._linhas_indexadas >= total:
+            return
+        timestamps = armazenamento.timestamps
+        ids_conteudo = armazenamento.ids_conteudo
+        ids_plataforma = armazenamento.ids_plataforma
+        codigos = armazenamento.codigos_tipo
+        duracoes = armazenamento.duracoes
+        tamanho = self._tamanho_bucket
+        posicao_tempo, posicao_duracoes = self.POSICAO_TEMPO, self.POSICAO_DURACOES
+
+        for indice in range(self._linhas_indexadas, total):
+            chave = timestamps[indice] // tamanho
+            bucket = self._buckets.get(chave) or self._bucket(chave)
+            if bucket is None:
+                bucket = self._buckets[chave] = _Bucket()
+                insort(self._chaves, chave)
+            bucket.linhas.append(indice)
+
+            codigo = codigos[indice]
+            duracao = duracoes[indice]
+            for agregados, chave_agregado in ((bucket.por_conteudo, ids_conteudo[indice]),
+                                              (bucket.por_plataforma, ids_plataforma[indice])):
+                agregado = agregados.get(chave_agregado)
+                if agregado is None:
+                    agregado = agregados[chave_agregado] = self._novo_agregado()
+                agregado[codigo] += 1
+                if duracao > 0:
+                    agregado[posicao_tempo] += duracao
+                    agregado[posicao_duracoes] += 1
+        self._linhas_indexadas = total
+
+    def agregar(self, inicio=None, fim=None):
+        """
+        Retorna (por_conteudo, por_plataforma) com os agregados das interações com
+        inicio <= timestamp < fim (limites None = sem limite; aceitam epoch, datetime ou texto ISO).
+        """
+        self.atualizar()
+        inicio = instante_para_epoch(inicio)
+        fim = instante_para_epoch(fim)
+        tamanho = self._tamanho_bucket
+        primeiro = 0 if inicio is None else bisect_left(self._chaves, inicio // tamanho)
+        ultimo = len(self._chaves) if fim is None else bisect_right(self._chaves, (fim - 1) // tamanho)
+
+        por_conteudo = {}
+        por_plataforma = {}
+        for chave in self._chaves[primeiro:ultimo]:
+            bucket = self._bucket(chave)
+            inteiro = ((inicio is None or chave * tamanho >= inicio)
+                       and (fim is None or (chave + 1) * tamanho <= fim))
+            if inteiro:
+                self._somar(por_conteudo, bucket.por_conteudo)
+                self._somar(por_plataforma, bucket.por_plataforma)
+            else:
+                self._somar_linhas(por_conteudo, por_plataforma, bucket.linhas, inicio, fim)
+        return por_conteudo, por_plataforma
+
+    def linhas(self, inicio=None, fim=None):
+        """
+        Gera os índices das linhas com inicio <= timestamp < fim, bucket a bucket
+        (em ordem de tempo entre buckets e de chegada dentro de cada bucket).
+        """
+        self.atualizar()
+        inicio = instante_para_epoch(inicio)
+        fim = instante_para_epoch(fim)
+        tamanho = self._tamanho_bucket
+        primeiro = 0 if inicio is None else bisect_left(self._chaves, inicio // tamanho)
+        ultimo = len(self._chaves) if fim is None else bisect_right(self._chaves, (fim - 1) // tamanho)
+        timestamps = self._armazenamento.timestamps
+        for chave in self._chaves[primeiro:ultimo]:
+            for indice in self._bucket(chave).linhas:
+                timestamp = timestamps[indice]
+                if (inicio is None or timestamp >= inicio) and (fim is None or timestamp < fim):
+                    yield indice
+
+    def _bucket(self, chave):
+        """
+        Retorna o bucket da chave (ou None), montando-o se veio de um snapshot e ainda
+        não foi acessado.
+        """
+        bucket = self._buckets.get(chave)
+        if bucket is None and chave in self._pendentes:
+            posicao = self._pendentes.pop(chave)
+            colunas = self._restaurados
+            bucket = self._buckets[chave] = _Bucket()
+            inicio, fim = colunas["linhas_ptr"][posicao:posicao + 2]
+            bucket.linhas = colunas["linhas"][inicio:fim]
+            largura = self.QUANTIDADE_TIPOS + 2
+            for agregados, nome in ((bucket.por_conteudo, "conteudo"), (bucket.por_plataforma, "plataforma")):
+                inicio, fim = colunas[nome + "_ptr"][posicao:posicao + 2]
+                valores = colunas[nome + "_valores"]
+                for entrada, chave_agregado in enumerate(colunas[nome + "_ids"][inicio:fim], inicio):
+                    agregados[chave_agregado] = valores[entrada * largura:(entrada + 1) * largura].tolist()
+            if not self._pendentes:
+                self._restaurados = None
+        return bucket
+
+    def exportar(self):
+        """
+        Retorna os buckets em colunas (arrays) para o snapshot, após indexar as linhas novas:
+        {"chaves", "linhas_ptr", "linhas", "conteudo_ptr", "conteudo_ids", "conteudo_valores",
+        "plataforma_ptr", "plataforma_ids", "plataforma_valores"}. As linhas e as entradas
+        do i-ésimo bucket ficam em [ptr[i], ptr[i + 1]); cada entrada tem QUANTIDADE_TIPOS + 2
+        valores no formato do agregado.
+        """
+        self.atualizar()
+        colunas = {"chaves": array('q', self._chaves), "linhas_ptr": array('q', [0]), "linhas": array('q')}
+        for nome in ("conteudo", "plataforma"):
+            colunas[nome + "_ptr"] = array('q', [0])
+            colunas[nome + "_ids"] = array('q')
+            colunas[nome + "_valores"] = array('q')
+        for chave in self._chaves:
+            bucket = self._bucket(chave)
+            colunas["linhas"].extend(bucket.linhas)
+            colunas["linhas_ptr"].append(len(colunas["linhas"]))
+            for agregados, nome in ((bucket.por_conteudo, "conteudo"), (bucket.por_plataforma, "plataforma")):
+                colunas[nome + "_ids"].extend(agregados)
+                for agregado in agregados.values():
+                    colunas[nome + "_valores"].extend(agregado)
+                colunas[nome + "_ptr"].append(len(colunas[nome + "_ids"]))
+        return colunas
+
+    def restaurar(self, colunas, linhas_indexadas):
+        """
+        Substitui o índice pelos buckets exportados (exportar) de um snapshot, que cobrem
+        as primeiras `linhas_indexadas` linhas do armazenamento. Cada bucket é montado
+        no primeiro acesso; linhas acrescentadas depois são indexadas normalmente.
+        """
+        self._buckets = {}
+        self._chaves = colunas["chaves"].tolist()
+        self._pendentes = {chave: posicao for posicao, chave in enumerate(self._chaves)}
+        self._restaurados = colunas if self._pendentes else None
+        self._linhas_indexadas = linhas_indexadas
+
+    @staticmethod
+    def _somar(destino, origem):
+        for chave, agregado in origem.items():
+            atual = destino.get(chave)
+            if atual is None:
+                destino[chave] = agregado[:]
+            else:
+                for i, valor in enumerate(agregado):
+                    atual[i] += valor
+
+    def _somar_linhas(self, por_conteudo, por_plataforma, linhas, inicio, fim):
+        armazenamento = self._armazenamento
+        for indice in linhas:
+            timestamp = armazenamento.timestamps[indice]
+            if (inicio is not None and timestamp < inicio) or (fim is not None and timestamp >= fim):
+                continue
+            codigo = armazenamento.codigos_tipo[indice]
+            duracao = armazenamento.duracoes[indice]
+            for agregados, chave in ((por_conteudo, armazenamento.ids_conteudo[indice]),
+                                     (por_plataforma, armazenamento.ids_plataforma[indice])):
+                agregado = agregados.get(chave)
+                if agregado is None:
+                    agregado = agregados[chave] = self._novo_agregado()
+                agregado[codigo] += 1
+                if duracao > 0:
+                    agregado[self.POSICAO_TEMPO] += duracao
+                    agregado[self.POSICAO_DURACOES] += 1
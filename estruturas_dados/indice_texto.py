@@ -0,0 +1,109 @@
+import unicodedata
+
+
+def normalizar_texto(texto):
+    """
+    Remove acentos (decomposição NFKD sem as marcas combinantes) e aplica casefold,
+    para que "Jornal", "jornal" e "JORNÁL" sejam equivalentes.
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return sem_acentos.casefold()
+
+
+class IndiceTexto:
+    """
+    Índice invertido de n-gramas para busca por substring em textos curtos (nomes).
+
+    Cada texto é normalizado (sem acentos, casefold) e todos os seus n-gramas de
+    tamanho 1 a TAMANHO_NGRAMA são associados à chave do documento (listas de postagem).
+    Uma consulta de até TAMANHO_NGRAMA caracteres é respondida diretamente pela sua
+    lista; consultas maiores intersectam as listas dos seus n-gramas (da menor para a
+    maior) e confirmam a substring apenas nos candidatos restantes.
+
+    Complexidades:
+    - adicionar / remover: O(t), t = tamanho do texto
+    - buscar: O(g · p_min + r), g = n-gramas da consulta, p_min = menor lista de postagem,
+      r = candidatos verificados; documentos sem os n-gramas da consulta não são visitados.
+    """
+
+    TAMANHO_NGRAMA = 3
+
+    def __init__(self):
+        self._postagens = {}   # n-grama -> conjunto de chaves
+        self._textos = {}      # chave -> texto normalizado
+
+    def __len__(self):
+        return len(self._textos)
+
+    def _ngramas(self, texto):
+        ngramas = set()
+        for tamanho in range(1, self.TAMANHO_NGRAMA + 1):
+            for i in range(len(texto) - tamanho + 1):
+                ngramas.add(texto[i:i + tamanho])
+        return ngramas
+
+    def adicionar(self, chave, texto):
+        """
+        Indexa (ou reindexa, se a chave já existir) o texto do documento.
+        """
+        if chave in self._textos:
+            self.remover(chave)
+        normalizado = normalizar_texto(texto)
+        self._textos[chave] = normalizado
+        for ngrama in self._ngramas(normalizado):
+            self._postagens.setdefault(ngrama, set()).add(chave)
+
+    def remover(self, chave):
+        """
+        Remove o documento do índice (não faz nada se a chave não existir).
+        """
+        normalizado = self._textos.pop(chave, None)
+        if normalizado is None:
+            return
+        for ngrama in self._ngramas(normalizado):
+            postagem = self._postagens.get(ngrama)
+            if postagem is not None:
+                postagem.discard(chave)
+                if not postagem:
+                    del self._postagens[ngrama]
+
+    def buscar(self, consulta):
+        """
+        Retorna o conjunto de chaves cujo texto contém a consulta (substring),
+        ignorando acentos e maiúsculas. Consulta vazia retorna todas as chaves.
+        """
+        consulta = normalizar_texto(consulta)
+        if not consulta:
+            return set(self._textos)
+        if len(consulta) <= self.TAMANHO_NGRAMA:
+            return set(self._postagens.get(consulta, ()))
+
+        tamanho = self.TAMANHO_NGRAMA
+        ngramas = {consulta[i:i + tamanho] for i in range(len(consulta) - tamanho + 1)}
+        postagens = []
+        for ngrama in ngramas:
+            postagem = self._postagens.get(ngrama)
+            if not postagem:
+                return set()
+            postagens.append(postagem)
+        postagens.sort(key=len)
+
+        candidatos = set(postagens[0])
+        for postagem in postagens[1:]:
+            candidatos &= postagem
+            if not candidatos:
+                return candidatos
+        # Os n-gramas podem aparecer fora de ordem: confirma a substring
+        return {chave for chave in candidatos if consulta in self._textos[chave]}
+
+    def buscar_prefixo(self, consulta):
+        """
+        Retorna o conjunto de chaves em que alguma palavra do texto começa com a consulta.
+        """
+        consulta = normalizar_texto(consulta).strip()
+        if not consulta:
+            return set(self._textos)
+        # Início de palavra: no começo do texto ou logo após um espaço
+        return {chave for chave in self.buscar(consulta)
+                if (" " + self._textos[chave]).find(" " + consulta) >= 0}
@@ -0,0 +1,133 @@
+"""
+Algoritmos de ordenação usados pelos relatórios.
+
+Todos são estáveis (elementos com chaves iguais mantêm a ordem original, inclusive
+com reverse=True), iterativos (não dependem do limite de recursão) e calculam a
+chave de cada elemento uma única vez: a ordenação é feita sobre os índices dos
+elementos, comparando as chaves já calculadas, e só no final a lista é reorganizada.
+
+As funções ordenam a lista recebida no próprio lugar e também a retornam.
+"""
+
+# Abaixo deste tamanho, os trechos são ordenados por inserção antes de serem intercalados
+TAMANHO_MINIMO_TRECHO = 32
+
+
+def _decorar(lista, key):
+    chaves = [key(item) for item in lista] if key is not None else list(lista)
+    return chaves, list(range(len(lista)))
+
+
+def _aplicar_ordem(lista, ordem):
+    lista[:] = [lista[i] for i in ordem]
+    return lista
+
+
+def _insertion_sort(ordem, chaves, inicio, fim, reverse):
+    """
+    Ordena ordem[inicio:fim] (índices) por inserção, comparando chaves[índice].
+    Complexidade: O(t²), t = fim - inicio
+    """
+    for i in range(inicio + 1, fim):
+        atual = ordem[i]
+        chave_atual = chaves[atual]
+        j = i - 1
+        # Desloca apenas enquanto a chave anterior for estritamente "maior" (estável)
+        if reverse:
+            while j >= inicio and chaves[ordem[j]] < chave_atual:
+                ordem[j + 1] = ordem[j]
+                j -= 1
+        else:
+            while j >= inicio and chave_atual < chaves[ordem[j]]:
+                ordem[j + 1] = ordem[j]
+                j -= 1
+        ordem[j + 1] = atual
+
+
+def insertion_sort(lista, key=None, reverse=False):
+    """
+    Insertion Sort estável para listas pequenas.
+    Complexidade: O(n²) no pior caso, O(n) em listas já ordenadas.
+    """
+    chaves, ordem = _decorar(lista, key)
+    _insertion_sort(ordem, chaves, 0, len(ordem), reverse)
+    return _aplicar_ordem(lista, ordem)
+
+
+def merge_sort(lista, key=None, reverse=False):
+    """
+    Merge Sort iterativo (bottom-up) e estável.
+    Primeiro ordena trechos de TAMANHO_MINIMO_TRECHO por inserção; depois intercala
+    trechos vizinhos, dobrando o tamanho a cada passada. Se dois trechos vizinhos
+    já estiverem em ordem, a intercalação é pulada (bom para entradas quase ordenadas).
+    Complexidade: O(n log n) no pior caso, O(n) em entradas já ordenadas; memória O(n).
+    """
+    chaves, ordem = _decorar(lista, key)
+    n = len(ordem)
+
+    for inicio in range(0, n, TAMANHO_MINIMO_TRECHO):
+        _insertion_sort(ordem, chaves, inicio, min(inicio + TAMANHO_MINIMO_TRECHO, n), reverse)
+
+    largura = TAMANHO_MINIMO_TRECHO
+    auxiliar = ordem[:]
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            if meio >= fim:
+                continue
+            # Trechos já em ordem: nada a intercalar
+            ultima_esq, primeira_dir = chaves[ordem[meio - 1]], chaves[ordem[meio]]
+            if not (ultima_esq < primeira_dir if reverse else primeira_dir < ultima_esq):
+                continue
+            auxiliar[inicio:fim] = ordem[inicio:fim]
+            i, j, k = inicio, meio, inicio
+            while i < meio and j < fim:
+                chave_esq, chave_dir = chaves[auxiliar[i]], chaves[auxiliar[j]]
+                # Só pega da direita quando ela vem estritamente antes (estável)
+                if (chave_esq < chave_dir) if reverse else (chave_dir < chave_esq):
+                    ordem[k] = auxiliar[j]
+                    j += 1
+                else:
+                    ordem[k] = auxiliar[i]
+                    i += 1
+                k += 1
+            if i < meio:
+                ordem[k:fim] = auxiliar[i:meio]
+            elif j < fim:
+                ordem[k:fim] = auxiliar[j:fim]
+        largura *= 2
+
+    return _aplicar_ordem(lista, ordem)
+
+
+def radix_sort(lista, key=None, reverse=False):
+    """
+    Radix Sort LSD (base 256) para chaves inteiras, estável.
+    Chaves negativas são deslocadas pelo menor valor; com reverse=True, a ordenação
+    crescente é feita sobre (maior - chave), o que mantém a estabilidade.
+    Complexidade: O(n · b), b = número de bytes da maior chave deslocada.
+    """
+    chaves, ordem = _decorar(lista, key)
+    if not chaves:
+        return lista
+    for chave in chaves:
+        if not isinstance(chave, int):
+            raise TypeError("radix_sort aceita apenas chaves inteiras.")
+
+    menor, maior = min(chaves), max(chaves)
+    if reverse:
+        deslocadas = [maior - chave for chave in chaves]
+    else:
+        deslocadas = [chave - menor for chave in chaves]
+
+    limite = maior - menor
+    deslocamento = 0
+    while (limite >> deslocamento) > 0:
+        baldes = [[] for _ in range(256)]
+        for indice in ordem:
+            baldes[(deslocadas[indice] >> deslocamento) & 0xFF].append(indice)
+        ordem = [indice for balde in baldes for indice in balde]
+        deslocamento += 8
+
+    return _aplicar_ordem(lista, ordem)
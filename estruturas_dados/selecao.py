@@ -0,0 +1,55 @@
+import heapq
+
+
+class ChaveInvertida:
+    """
+    Inverte a comparação de uma chave qualquer (números, textos...),
+    permitindo usar o heap mínimo do heapq como heap máximo.
+    Usada por selecionar_top_k e pelo HeapIndexado.
+    """
+
+    __slots__ = ("chave",)
+
+    def __init__(self, chave):
+        self.chave = chave
+
+    def __lt__(self, other):
+        return other.chave < self.chave
+
+    def __gt__(self, other):
+        return self.chave < other.chave
+
+    def __eq__(self, other):
+        return self.chave == other.chave
+
+
+def selecionar_top_k(itens, k, key=lambda x: x, reverse=True):
+    """
+    Retorna os k melhores itens de um iterável, já ordenados.
+    reverse=True seleciona as k maiores chaves; reverse=False, as k menores.
+
+    Usa um heap limitado a k elementos cuja raiz é o pior item selecionado até o
+    momento; cada novo item só entra se for melhor que a raiz. A chave de cada item
+    é calculada uma única vez.
+
+    Empates são resolvidos de forma determinística pela ordem de chegada: entre
+    chaves iguais, o item que apareceu primeiro fica à frente (como em uma
+    ordenação estável).
+
+    Complexidade: O(n log k) tempo, O(k) memória.
+    """
+    if k <= 0:
+        return []
+
+    heap = []
+    for indice, item in enumerate(itens):
+        chave = key(item)
+        # Entre chaves iguais, o índice maior (mais recente) é considerado pior
+        entrada = (chave if reverse else ChaveInvertida(chave), -indice, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entrada)
+        elif entrada[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entrada)
+
+    heap.sort(key=lambda entrada: entrada[:2], reverse=True)
+    return [entrada[2] for entrada in heap]
@@ -0,0 +1,179 @@
+import heapq
+
+from estruturas_dados.heap_indexado import HeapIndexado
+from estruturas_dados.selecao import ChaveInvertida, selecionar_top_k
+
+
+class SpaceSaving:
+    """
+    Itens mais frequentes (heavy hitters) de um fluxo usando no máximo `capacidade`
+    contadores, qualquer que seja a quantidade de itens distintos (algoritmo Space-Saving).
+
+    Com os contadores cheios, um item novo toma o lugar do menor contador (mínimo de um
+    HeapIndexado) e herda o seu valor como erro. Por isso a contagem de cada item
+    monitorado é um limite superior: contagem - erro <= real <= contagem. Todo item com
+    peso real maior que total / capacidade está garantidamente entre os monitorados.
+
+    Aceita pesos (ex.: segundos assistidos) além de contagens unitárias.
+
+    Complexidades:
+    - adicionar: O(log capacidade)
+    - adicionar_lote: O((capacidade + d) log capacidade), d = chaves do lote
+    - primeiros(k): O(capacidade log k)
+    - mesclar: O(capacidade log capacidade)
+    - Memória: O(capacidade)
+    """
+
+    CAPACIDADE_PADRAO = 1000
+
+    def __init__(self, capacidade=CAPACIDADE_PADRAO):
+        if capacidade <= 0:
+            raise ValueError("A capacidade deve ser positiva.")
+        self._capacidade = capacidade
+        self._contadores = HeapIndexado()   # chave -> contagem, com a menor no topo
+        self._erros = {}                    # chave -> erro máximo da contagem
+        self._total = 0
+
+    @property
+    def capacidade(self):
+        return self._capacidade
+
+    @property
+    def total(self):
+        return self._total
+
+    def __len__(self):
+        return len(self._contadores)
+
+    def adicionar(self, chave, peso=1):
+        if peso <= 0:
+            return
+        self._total += peso
+        contadores = self._contadores
+        if chave in contadores:
+            contadores.inserir_ou_atualizar(chave, contadores.prioridade(chave) + peso)
+        elif len(contadores) < self._capacidade:
+            contadores.inserir_ou_atualizar(chave, peso)
+            self._erros[chave] = 0
+        else:
+            # O novo item herda o menor contador (e o seu valor como erro)
+            chave_minima, contagem_minima = contadores.topo()
+            contadores.substituir_topo(chave, contagem_minima + peso)
+            del self._erros[chave_minima]
+            self._erros[chave] = contagem_minima
+
+    def adicionar_lote(self, pesos):
+        """
+        Soma de uma vez os pesos de um lote já agregados por chave ({chave: peso}),
+        como se mesclasse um resumo exato do lote. Se há contadores livres para todas as
+        chaves novas, o resultado é o de adicionar chave a chave; senão, cada chave nova
+        recebe o menor contador atual como contagem base e erro e ficam as `capacidade`
+        maiores contagens, sem uma substituição do mínimo do heap por chave nova.
+        As garantias são as de mesclar.
+        Complexidade: O(d log capacidade) com contadores livres; senão O((C + d) log C),
+        d = chaves do lote
+        """
+        contadores = self._contadores
+        if len(contadores) < self._capacidade:
+            novas = sum(1 for chave in pesos if chave not in contadores)
+            if len(contadores) + novas <= self._capacidade:
+                for chave, peso in pesos.items():
+                    self.adicionar(chave, peso)
+                return
+        candidatos, minimo = self._candidatos(0)
+        for chave, peso in pesos.items():
+            if peso <= 0:
+                continue
+            self._total += peso
+            candidato = candidatos.get(chave)
+            if candidato is None:
+                candidatos[chave] = [peso + minimo, minimo]
+            else:
+                candidato[0] += peso
+        self._manter_maiores(candidatos)
+
+    def mesclar(self, outro):
+        """
+        Soma a este resumo os contadores de outro SpaceSaving (outra parte do fluxo).
+        Uma chave ausente de um resumo cheio recebe o menor contador dele (o máximo que
+        ela pode ter tido ali) como contagem e erro; das chaves resultantes, ficam as
+        `capacidade` maiores. As contagens continuam limites superiores com
+        contagem - erro <= real, e o erro máximo continua total / capacidade.
+        Complexidade: O((C + C') log C), C' = contadores do outro
+        """
+        minimo_outro = outro._contadores.topo()[1] if len(outro._contadores) >= outro._capacidade else 0
+        candidatos, minimo = self._candidatos(minimo_outro)
+        for chave, contagem in outro._contadores.itens():
+            candidato = candidatos.get(chave)
+            if candidato is None:
+                candidatos[chave] = [contagem + minimo, outro._erros[chave] + minimo]
+            else:
+                candidato[0] += contagem - minimo_outro
+                candidato[1] += outro._erros[chave] - minimo_outro
+        self._manter_maiores(candidatos)
+        self._total += outro._total
+
+    def _candidatos(self, minimo_outro):
+        """
+        Retorna ({chave: [contagem, erro]} dos contadores somados a minimo_outro, menor
+        contador deste resumo ou 0 se ele não estiver cheio), para mesclar outro resumo.
+        """
+        minimo = self._contadores.topo()[1] if len(self._contadores) >= self._capacidade else 0
+        erros = self._erros
+        candidatos = {chave: [contagem + minimo_outro, erros[chave] + minimo_outro]
+                      for chave, contagem in self._contadores.itens()}
+        return candidatos, minimo
+
+    def _manter_maiores(self, candidatos):
+        """
+        Passa a monitorar as `capacidade` maiores contagens dos candidatos (empates pela
+        ordem de chegada, como em selecionar_top_k).
+        Complexidade: O(n log capacidade), n = candidatos
+        """
+        maiores = heapq.nlargest(self._capacidade, candidatos.items(), key=lambda par: par[1][0])
+        self._contadores = HeapIndexado.a_partir_de([(chave, contagem) for chave, (contagem, _) in maiores])
+        self._erros = {chave: erro for chave, (_, erro) in maiores}
+
+    def exportar(self):
+        """
+        Retorna [total, [(chave, contagem, erro)]] para o snapshot, na ordem interna do
+        heap: a_partir_de reconstrói o mesmo heap, e as próximas substituições do menor
+        contador acontecem como se o resumo não tivesse sido salvo.
+        """
+        return [self._total, [(chave, contagem, self._erros[chave]) for chave, contagem in self._contadores.itens()]]
+
+    @classmethod
+    def a_partir_de(cls, capacidade, dados):
+        """
+        Reconstrói o resumo a partir de exportar.
+        Complexidade: O(capacidade)
+        """
+        total, contadores = dados
+        resumo = cls(capacidade)
+        resumo._contadores = HeapIndexado.a_partir_de([(chave, contagem) for chave, contagem, _ in contadores])
+        resumo._erros = {chave: erro for chave, _, erro in contadores}
+        resumo._total = total
+        return resumo
+
+    def copiar(self):
+        """
+        Complexidade: O(capacidade)
+        """
+        return SpaceSaving.a_partir_de(self._capacidade, self.exportar())
+
+    def contagem(self, chave):
+        """
+        Retorna (contagem, erro) da chave, ou (0, 0) se ela não estiver sendo monitorada.
+        """
+        if chave not in self._contadores:
+            return 0, 0
+        return self._contadores.prioridade(chave), self._erros[chave]
+
+    def primeiros(self, k):
+        """
+        Retorna [(chave, contagem, erro)] das k maiores contagens (empates pela menor chave).
+        Complexidade: O(capacidade log k)
+        """
+        # O desempate faz parte da chave de seleção, sem ordenar todos os contadores
+        top = selecionar_top_k(self._contadores.itens(), k, key=lambda par: (par[1], ChaveInvertida(par[0])))
+        return [(chave, contagem, self._erros[chave]) for chave, contagem in top]
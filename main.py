@@ -1,5 +1,9 @@
 from analise.sistema import SistemaAnaliseEngajamento  # Importa a classe principal do sistema
 import os  # Para verificar se o arquivo CSV existe no caminho especificado
+from itertools import islice  # Para consumir os relatórios uma página por vez
+
+# Quantidade de itens (conteúdos ou usuários) exibidos por página nos relatórios longos
+TAMANHO_PAGINA = 10
 
 def exibir_menu():
     """
@@ -24,15 +28,59 @@ def exibir_menu():
     print("15. Pesquisar Plataforma e Listar Conteúdos Associados")
     print("16. Distribuição de Tipos de Interação por Plataforma")
     print("17. Pesquisar Conteudo por Categoria")
+    print("18. Atualizar com Novas Linhas do CSV")
+    print("19. Relatórios por Período")
+    print("20. Conteúdos em Alta")
+    print("21. Usuários Únicos (estimativa)")
+    print("22. Mais Ativos (usuários, conteúdos e pares)")
     print("0. Sair")
     return input("Escolha uma opção: ")
 
+def exibir_paginado(titulo, blocos, mensagem_vazio):
+    """
+    Exibe os blocos de um relatório gerado sob demanda, TAMANHO_PAGINA por vez.
+    O próprio gerador funciona como cursor: cada página só calcula os seus itens,
+    e nada além da página atual é calculado se o usuário parar.
+    """
+    pagina = list(islice(blocos, TAMANHO_PAGINA))
+    if not pagina:
+        print(mensagem_vazio)
+        return
+    print(titulo)
+    numero_pagina = 1
+    while pagina:
+        for bloco in pagina:
+            for texto in bloco:
+                print(texto)
+        proxima = list(islice(blocos, TAMANHO_PAGINA))
+        if not proxima:
+            break
+        resposta = input(f"Página {numero_pagina}. Enter para a próxima página ou 'q' para voltar ao menu: ")
+        if resposta.strip().lower() == "q":
+            break
+        pagina = proxima
+        numero_pagina += 1
+
+def salvar_estado():
+    """
+    Salva o snapshot e o checkpoint juntos, para que o estado possa ser retomado após reiniciar.
+    """
+    try:
+        sistema.salvar_snapshot(caminho_snapshot, caminho_csv)
+    except OSError as e:
+        print(f"Aviso: não foi possível salvar o snapshot: {e}")
+
 # Instancia o sistema que gerencia o processamento e análise dos dados
 sistema = SistemaAnaliseEngajamento()
 
 # Caminho do arquivo CSV com os dados brutos de interações
 caminho_csv = "interacoes_globo.csv"
 
+# Snapshot binário do estado processado (evita reprocessar o CSV se ele não mudou)
+caminho_snapshot = "interacoes_globo.snap"
+# Checkpoint da ingestão incremental (offset e linhas já processadas do CSV)
+caminho_checkpoint = "interacoes_globo.ckpt"
+
 # Flag que indica se os dados foram carregados e processados
 dados_processados = False
 
@@ -44,22 +92,42 @@ while True:
 
     if opcao == "1":
         if os.path.exists(caminho_csv):
-            sistema.carregar_interacoes_csv(caminho_csv)
-            sistema.processar_interacoes_da_fila()
+            # Reaproveita o snapshot se o CSV não mudou ou apenas recebeu novas linhas
+            sistema_salvo = SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, caminho_csv,
+                                                                       aceitar_acrescimo=True)
+            if sistema_salvo is not None:
+                linhas_novas = sistema_salvo.carregar_incremental(caminho_csv, caminho_checkpoint,
+                                                                  arquivo_completo=True)
+                if sistema_salvo.checkpoint_csv is None:
+                    # Checkpoint ausente ou de outro estado: não dá para continuar do snapshot
+                    sistema_salvo = None
+            if sistema_salvo is not None:
+                sistema = sistema_salvo
+                print(f"\nDados carregados do snapshot ({linhas_novas} linhas novas processadas).")
+            else:
+                # Lê e processa o CSV em lotes, sem manter o arquivo inteiro na fila
+                sistema = SistemaAnaliseEngajamento()
+                linhas_novas = sistema.carregar_incremental(caminho_csv, caminho_checkpoint, arquivo_completo=True)
+                print("\nDados do arquivo CSV foram processados com sucesso.")
+            if linhas_novas:
+                salvar_estado()
             dados_processados = True
-            print("\nDados do arquivo CSV foram processados com sucesso.")
         else:
             print(f"Arquivo CSV não encontrado: {caminho_csv}")
 
     elif opcao == "2":
         if dados_processados:
-            sistema.gerar_relatorio_engajamento_conteudos()
+            exibir_paginado("\n-> -> RESULTADOS DE ENGAJAMENTO DE CONTEÚDOS <- <-\n",
+                            sistema.iterar_relatorio_engajamento_conteudos(),
+                            "Nenhum conteúdo registrado para gerar relatório.")
         else:
             print("Primeiro processe o arquivo CSV (Opção 1).")
 
     elif opcao == "3":
         if dados_processados:
-            sistema.gerar_relatorio_atividade_usuarios()
+            exibir_paginado("\n-> -> RESULTADOS DE ATIVIDADE DE USUÁRIOS <- <-\n",
+                            sistema.iterar_relatorio_atividade_usuarios(),
+                            "Nenhum usuário registrado para gerar relatório.")
         else:
             print("Primeiro processe o arquivo CSV (Opção 1).")
 
@@ -166,6 +234,49 @@ while True:
         else:
             print("Primeiro processe o arquivo CSV (Opção 1).")
 
+    elif opcao == "18":
+        if dados_processados:
+            linhas_novas = sistema.carregar_incremental(caminho_csv, caminho_checkpoint)
+            if linhas_novas:
+                salvar_estado()
+            print(f"\n{linhas_novas} linhas novas processadas.")
+        else:
+            print("Primeiro processe o arquivo CSV (Opção 1).")
+
+    elif opcao == "19":
+        if dados_processados:
+            # Limites no formato AAAA-MM-DD HH:MM:SS; vazio = sem limite
+            inicio = input("\nInício do período (AAAA-MM-DD HH:MM:SS, vazio = sem limite): ").strip() or None
+            fim = input("Fim do período (exclusivo, vazio = sem limite): ").strip() or None
+            try:
+                sistema.gerar_relatorio_top_conteudos_consumidos(5, inicio=inicio, fim=fim)
+                sistema.relatorio_top_conteudos_mais_curtidos(inicio=inicio, fim=fim)
+                sistema.relatorio_top_conteudos_mais_visualizados(inicio=inicio, fim=fim)
+                sistema.relatorio_plataforma_maior_engajamento(inicio=inicio, fim=fim)
+                sistema.relatorio_distribuicao_interacoes_por_plataforma(inicio=inicio, fim=fim)
+            except ValueError:
+                print("Data inválida. Use o formato AAAA-MM-DD HH:MM:SS.")
+        else:
+            print("Primeiro processe o arquivo CSV (Opção 1).")
+
+    elif opcao == "20":
+        if dados_processados:
+            sistema.relatorio_conteudos_em_alta()
+        else:
+            print("Primeiro processe o arquivo CSV (Opção 1).")
+
+    elif opcao == "21":
+        if dados_processados:
+            sistema.relatorio_usuarios_unicos()
+        else:
+            print("Primeiro processe o arquivo CSV (Opção 1).")
+
+    elif opcao == "22":
+        if dados_processados:
+            sistema.relatorio_mais_ativos()
+        else:
+            print("Primeiro processe o arquivo CSV (Opção 1).")
+
     elif opcao == "0":
         print("Encerrando o programa, Volte Sempre")
         break
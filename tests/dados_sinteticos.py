@@ -0,0 +1,64 @@
+"""
+CSV sintético e comparação do estado completo de dois sistemas (relatórios e consultas),
+compartilhados pelos testes de snapshot e de ingestão paralela.
+"""
+import random
+
+from analise.sistema import SistemaAnaliseEngajamento
+
+CABECALHO = ("id_conteudo;nome_conteudo;id_usuario;timestamp_interacao;plataforma;tipo_interacao;"
+             "watch_duration_seconds;comment_text;tipo_conteudo;categorias\n")
+PLATAFORMAS = ("Globoplay", "G1", "TV Globo", "GE")
+TIPOS = ("view_start", "like", "share", "comment", "vote_bbb")
+PERIODOS = ((None, None), ("2024-10-20 10:30:00", "2024-10-21 02:00:00"), ("2024-10-21 00:00:00", None))
+
+
+def linhas_csv(quantidade, semente):
+    aleatorio = random.Random(semente)
+    linhas = []
+    for _ in range(quantidade):
+        id_conteudo = aleatorio.randrange(1, 61)
+        hora, minuto = divmod(aleatorio.randrange(30 * 60), 60)
+        linhas.append(";".join((
+            str(id_conteudo), f"Conteúdo {id_conteudo}", str(aleatorio.randrange(1, 301)),
+            f"2024-10-{20 + hora // 24} {hora % 24:02d}:{minuto:02d}:{aleatorio.randrange(60):02d}",
+            aleatorio.choice(PLATAFORMAS), aleatorio.choice(TIPOS), str(aleatorio.choice((0, 30, 600, 3600))),
+            aleatorio.choice(("", "Ótimo!", "ruim")), aleatorio.choice(("Vídeo", "Podcast", "Artigo")),
+            aleatorio.choice(("Novela", "Esporte,Futebol", "Jornalismo")),
+        )) + "\n")
+    return linhas
+
+
+def novo_sistema():
+    sistema = SistemaAnaliseEngajamento()
+    # Poucos contadores: os resumos Space-Saving precisam substituir itens
+    sistema.configurar_mais_ativos(20)
+    sistema.configurar_tendencias(90)
+    return sistema
+
+
+def estado(sistema, capsys):
+    """Resultados das consultas e relatórios que dependem das estruturas derivadas."""
+    capsys.readouterr()
+    for inicio, fim in PERIODOS:
+        sistema.gerar_relatorio_top_conteudos_consumidos(5, inicio, fim)
+        sistema.relatorio_plataforma_maior_engajamento(inicio, fim)
+        sistema.relatorio_tempo_medio_consumo_por_plataforma(inicio, fim)
+        sistema.relatorio_distribuicao_interacoes_por_plataforma(inicio, fim)
+    sistema.gerar_relatorio_engajamento_conteudos()
+    sistema.gerar_relatorio_atividade_usuarios()
+    sistema.relatorio_conteudos_em_alta()
+    sistema.relatorio_usuarios_unicos()
+    sistema.relatorio_mais_ativos(10)
+    relatorios = capsys.readouterr().out
+    consultas = [
+        [(conteudo.id_conteudo, contagem) for conteudo, contagem in sistema.conteudos_em_alta(20)],
+        [sistema.usuarios_unicos_periodo(inicio, fim) for inicio, fim in PERIODOS],
+        [sistema.usuarios_unicos_categoria(categoria) for categoria in ("novela", "esporte", "jornalismo")],
+        [sistema.usuarios_unicos_conteudo(id_conteudo) for id_conteudo in range(1, 61)],
+        [sistema.mais_ativos(dimensao, criterio, 20)
+         for dimensao in ("usuarios", "conteudos", "pares") for criterio in ("interacoes", "tempo")],
+        [[conteudo.id_conteudo for conteudo in sistema.recomendar_conteudos_por_categoria(categoria)]
+         for categoria in ("novela", "futebol", "jornalismo")],
+    ]
+    return relatorios, consultas
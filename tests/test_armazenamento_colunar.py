@@ -0,0 +1,66 @@
+import pytest
+
+from analise.sistema import SistemaAnaliseEngajamento
+from entidades.interacao import Interacao
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+
+CABECALHO = ("id_conteudo;nome_conteudo;id_usuario;timestamp_interacao;plataforma;tipo_interacao;"
+             "watch_duration_seconds;comment_text;tipo_conteudo;categorias\n")
+
+
+def _comprimentos(armazenamento):
+    return {len(coluna) for coluna in armazenamento.colunas().values()}
+
+
+def test_duracao_acima_de_32_bits_e_armazenada():
+    armazenamento = ArmazenamentoColunarInteracoes()
+    indice = armazenamento.adicionar(101, 1, 1, "view_start", 0, 99999999999, "ok")
+    assert armazenamento.duracoes[indice] == 99999999999
+    assert _comprimentos(armazenamento) == {1}
+    assert armazenamento.comentario(indice) == "ok"
+
+
+def test_valor_fora_do_intervalo_nao_altera_colunas():
+    armazenamento = ArmazenamentoColunarInteracoes()
+    armazenamento.adicionar(101, 1, 1, "like", 0, 10, "primeiro")
+    with pytest.raises(ValueError):
+        armazenamento.adicionar(101, 1, 1, "like", 0, 2 ** 70, "segundo")
+    with pytest.raises(ValueError):
+        armazenamento.adicionar(2 ** 70, 1, 1, "like", 0, 10, "terceiro")
+    assert _comprimentos(armazenamento) == {1}
+    assert armazenamento.comentarios == ["primeiro"]
+
+    indice = armazenamento.adicionar(102, 2, 1, "share", 0, 5, "quarto")
+    assert indice == 1
+    assert armazenamento.comentario(indice) == "quarto"
+
+
+def test_linha_com_duracao_fora_do_intervalo_nao_interrompe_ingestao(tmp_path):
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_text(
+        CABECALHO
+        + "1;Jornal Nacional;101;2024-10-20 20:05:12;TV Globo;view_start;99999999999;;Vídeo;Jornalismo\n"
+        + "1;Jornal Nacional;102;2024-10-20 20:06:12;TV Globo;view_start;" + str(2 ** 70) + ";;Vídeo;Jornalismo\n"
+        + "2;Novela Renascer;103;2024-10-20 21:15:30;Globoplay;like;0;;Vídeo;Novela\n",
+        encoding="utf-8",
+    )
+    sistema = SistemaAnaliseEngajamento()
+    assert sistema.carregar_incremental(str(caminho)) == 3
+
+    # A linha com duração acima de 64 bits é descartada; as colunas continuam alinhadas
+    armazenamento = sistema._armazenamento_colunar
+    assert _comprimentos(armazenamento) == {2}
+    assert armazenamento.duracoes[0] == 99999999999
+    assert [chave for chave, _, _ in sistema.mais_ativos("usuarios", "tempo")] == [101]
+
+
+def test_linha_rejeitada_nao_consome_id_de_interacao():
+    armazenamento = ArmazenamentoColunarInteracoes()
+    proximo = Interacao.proximo_id()
+    with pytest.raises(ValueError):
+        armazenamento.adicionar(2 ** 70, 1, 1, "like", 0, 10, "")
+    assert Interacao.proximo_id() == proximo
+
+    indice = armazenamento.adicionar(101, 1, 1, "like", 0, 10, "")
+    assert armazenamento.ids[indice] == proximo
+    assert Interacao.proximo_id() == proximo + 1
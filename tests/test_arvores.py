@@ -0,0 +1,171 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from estruturas_dados.arvore_avl import ArvoreAVL
+from estruturas_dados.arvore_binaria_busca import ArvoreBinariaBusca
+
+ARVORES = [ArvoreBinariaBusca, ArvoreAVL]
+
+
+def _verificar_estrutura(arvore):
+    """Confere ordem das chaves, tamanhos e (na AVL) alturas e balanceamento de cada nó."""
+    def verificar(no, minimo, maximo):
+        if no is None:
+            return 0, 0
+        assert minimo is None or no.chave > minimo
+        assert maximo is None or no.chave < maximo
+        tamanho_esquerdo, altura_esquerda = verificar(no.esquerdo, minimo, no.chave)
+        tamanho_direito, altura_direita = verificar(no.direito, no.chave, maximo)
+        assert no.tamanho == 1 + tamanho_esquerdo + tamanho_direito
+        altura = 1 + max(altura_esquerda, altura_direita)
+        if isinstance(arvore, ArvoreAVL):
+            assert no.altura == altura
+            assert abs(altura_esquerda - altura_direita) <= 1
+        return no.tamanho, altura
+
+    return verificar(arvore.raiz, None, None)[1]
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+def test_insercoes_e_remocoes_aleatorias(classe):
+    aleatorio = random.Random(1)
+    arvore = classe()
+    referencia = {}
+    for passo in range(4000):
+        chave = aleatorio.randrange(600)
+        if aleatorio.random() < 0.6:
+            arvore.inserir(chave, passo)
+            referencia[chave] = passo
+        else:
+            arvore.remover(chave)
+            referencia.pop(chave, None)
+        if passo % 250 == 0:
+            _verificar_estrutura(arvore)
+            assert arvore.percurso_em_ordem() == sorted(referencia.items())
+    _verificar_estrutura(arvore)
+    assert arvore.percurso_em_ordem() == sorted(referencia.items())
+    assert len(arvore) == len(referencia)
+    for chave in range(-1, 601):
+        assert arvore.buscar(chave) == referencia.get(chave)
+
+
+@pytest.mark.parametrize("chaves", [range(5000), range(5000, 0, -1)])
+def test_avl_com_chaves_ordenadas_continua_balanceada(chaves):
+    # Na BST simples esta sequência geraria uma árvore degenerada (altura n)
+    arvore = ArvoreAVL()
+    for chave in chaves:
+        arvore.inserir(chave, str(chave))
+    altura = _verificar_estrutura(arvore)
+    # Limite de altura da AVL: 1,44 log2(n + 2)
+    assert altura <= 1.44 * (len(arvore) + 2).bit_length()
+    for chave in list(chaves)[::2]:
+        arvore.remover(chave)
+    _verificar_estrutura(arvore)
+    assert [chave for chave, _ in arvore.iterar_em_ordem()] == sorted(list(chaves)[1::2])
+
+
+def _arvore_aleatoria(classe, semente, quantidade=300):
+    aleatorio = random.Random(semente)
+    arvore = classe()
+    referencia = {}
+    for chave in aleatorio.sample(range(0, 3000, 3), quantidade):
+        arvore.inserir(chave, -chave)
+        referencia[chave] = -chave
+    for chave in aleatorio.sample(sorted(referencia), quantidade // 3):
+        arvore.remover(chave)
+        del referencia[chave]
+    return arvore, sorted(referencia.items())
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+def test_consultas_por_ordem_equivalem_a_lista_ordenada(classe):
+    arvore, pares = _arvore_aleatoria(classe, 2)
+    chaves = [chave for chave, _ in pares]
+    # Consultas com chaves presentes, ausentes e fora dos extremos
+    for consulta in range(-5, 3006):
+        posicao = bisect_left(chaves, consulta)
+        apos = bisect_right(chaves, consulta)
+        assert arvore.posicao(consulta) == posicao
+        assert arvore.piso(consulta) == (pares[apos - 1] if apos > 0 else None)
+        assert arvore.teto(consulta) == (pares[posicao] if posicao < len(pares) else None)
+        assert arvore.antecessor(consulta) == (pares[posicao - 1] if posicao > 0 else None)
+        assert arvore.sucessor(consulta) == (pares[apos] if apos < len(pares) else None)
+    for posicao in range(-len(pares), len(pares)):
+        assert arvore.selecionar(posicao) == pares[posicao]
+    for posicao in (len(pares), -len(pares) - 1):
+        with pytest.raises(IndexError):
+            arvore.selecionar(posicao)
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+def test_intervalos_equivalem_ao_filtro_da_lista(classe):
+    arvore, pares = _arvore_aleatoria(classe, 3)
+    aleatorio = random.Random(4)
+    limites = [None, -10, 0, 3000, 5000] + [aleatorio.randrange(-10, 3010) for _ in range(40)]
+    for minimo in limites:
+        for maximo in limites:
+            esperado = [(chave, valor) for chave, valor in pares
+                        if (minimo is None or chave >= minimo) and (maximo is None or chave <= maximo)]
+            assert arvore.buscar_intervalo(minimo, maximo) == esperado
+            assert list(arvore.iterar_intervalo(minimo, maximo)) == esperado
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+@pytest.mark.parametrize("partes", [1, 3, 7, 200, 1000])
+def test_dividir_em_faixas_cobre_todas_as_chaves(classe, partes):
+    arvore, pares = _arvore_aleatoria(classe, 5)
+    faixas = arvore.dividir_em_faixas(partes)
+    assert len(faixas) == min(partes, len(pares))
+    quantidades = [len(arvore.buscar_intervalo(minimo, maximo)) for minimo, maximo in faixas]
+    assert sum(quantidades) == len(pares)
+    assert max(quantidades) - min(quantidades) <= 1
+    assert [par for minimo, maximo in faixas for par in arvore.buscar_intervalo(minimo, maximo)] == pares
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+@pytest.mark.parametrize("quantidade", [0, 1, 2, 3, 100, 1023, 1024])
+def test_a_partir_de_ordenados_gera_arvore_de_altura_minima(classe, quantidade):
+    pares = [(chave * 2, str(chave)) for chave in range(quantidade)]
+    arvore = classe.a_partir_de_ordenados(iter(pares))
+    assert _verificar_estrutura(arvore) == quantidade.bit_length()
+    assert arvore.percurso_em_ordem() == pares
+    # Continua utilizável como uma árvore montada por inserções
+    arvore.inserir(1, "novo")
+    arvore.remover(0)
+    _verificar_estrutura(arvore)
+    assert arvore.percurso_em_ordem() == sorted(dict(pares[1:] + [(1, "novo")]).items())
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+@pytest.mark.parametrize("chaves", [[1, 1], [1, 3, 2], [5, 4]])
+def test_a_partir_de_ordenados_rejeita_chaves_fora_de_ordem(classe, chaves):
+    with pytest.raises(ValueError):
+        classe.a_partir_de_ordenados([(chave, None) for chave in chaves])
+
+
+@pytest.mark.parametrize("classe", ARVORES)
+@pytest.mark.parametrize("tamanhos", [(0, 0), (0, 50), (50, 0), (200, 300), (500, 7)])
+def test_mesclar_equivale_a_uniao_dos_dicionarios(classe, tamanhos):
+    aleatorio = random.Random(sum(tamanhos))
+    primeira = {chave: ("a", chave) for chave in aleatorio.sample(range(1000), tamanhos[0])}
+    segunda = {chave: ("b", chave) for chave in aleatorio.sample(range(1000), tamanhos[1])}
+    arvore = classe()
+    for chave, valor in primeira.items():
+        arvore.inserir(chave, valor)
+    outra = classe.a_partir_de_ordenados(sorted(segunda.items()))
+
+    arvore.mesclar(outra, combinar=lambda valor, valor_da_outra: ("ab", valor[1]))
+    esperado = {**primeira, **segunda}
+    for chave in primeira.keys() & segunda.keys():
+        esperado[chave] = ("ab", chave)
+    assert arvore.percurso_em_ordem() == sorted(esperado.items())
+    assert _verificar_estrutura(arvore) == len(esperado).bit_length()
+    # A outra árvore não muda
+    assert outra.percurso_em_ordem() == sorted(segunda.items())
+
+    # Sem combinar, prevalece o valor da outra árvore (como em inserir)
+    arvore = classe.a_partir_de_ordenados(sorted(primeira.items()))
+    arvore.mesclar(outra)
+    assert arvore.percurso_em_ordem() == sorted({**primeira, **segunda}.items())
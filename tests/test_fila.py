@@ -0,0 +1,72 @@
+import random
+from collections import deque
+
+import pytest
+
+from estruturas_dados.fila import Fila
+
+
+def _operar(fila, referencia, aleatorio):
+    """Uma operação aleatória na fila e a mesma no deque de referência."""
+    operacao = aleatorio.random()
+    if operacao < 0.4:
+        item = aleatorio.random()
+        if fila.esta_cheia():
+            with pytest.raises(OverflowError):
+                fila.enfileirar(item)
+        else:
+            fila.enfileirar(item)
+            referencia.append(item)
+    elif operacao < 0.55:
+        itens = [aleatorio.random() for _ in range(aleatorio.randrange(40))]
+        iterador = iter(itens)
+        quantidade = fila.enfileirar_lote(iterador)
+        referencia.extend(itens[:quantidade])
+        # O que não coube continua no iterador
+        assert list(iterador) == itens[quantidade:]
+    elif operacao < 0.85:
+        assert fila.desenfileirar() == (referencia.popleft() if referencia else None)
+    else:
+        quantidade = aleatorio.choice([None, 0, 1, aleatorio.randrange(60)])
+        esperado = list(referencia) if quantidade is None else list(referencia)[:quantidade]
+        assert fila.desenfileirar_lote(quantidade) == esperado
+        for _ in esperado:
+            referencia.popleft()
+    assert fila.tamanho() == len(referencia)
+    assert fila.esta_vazia() == (not referencia)
+
+
+@pytest.mark.parametrize("capacidade_maxima", [None, 1, 5, 16, 33])
+def test_operacoes_aleatorias_equivalem_a_deque(capacidade_maxima):
+    aleatorio = random.Random(capacidade_maxima)
+    fila = Fila(capacidade_maxima)
+    referencia = deque()
+    for _ in range(5000):
+        _operar(fila, referencia, aleatorio)
+        if capacidade_maxima is not None:
+            assert len(fila._elementos) <= capacidade_maxima
+            assert fila.esta_cheia() == (len(referencia) == capacidade_maxima)
+    assert fila.desenfileirar_lote() == list(referencia)
+
+
+def test_crescimento_com_o_buffer_dando_a_volta():
+    fila = Fila()
+    # Avança o início para o meio do buffer e faz os elementos darem a volta
+    for item in range(Fila.CAPACIDADE_INICIAL):
+        fila.enfileirar(item)
+    for _ in range(10):
+        fila.desenfileirar()
+    for item in range(Fila.CAPACIDADE_INICIAL, Fila.CAPACIDADE_INICIAL + 10):
+        fila.enfileirar(item)
+    assert fila._inicio == 10 and len(fila._elementos) == Fila.CAPACIDADE_INICIAL
+
+    fila.enfileirar("cresce")
+    assert len(fila._elementos) == 2 * Fila.CAPACIDADE_INICIAL
+    assert fila.desenfileirar_lote() == list(range(10, Fila.CAPACIDADE_INICIAL + 10)) + ["cresce"]
+    # Referências liberadas ao desenfileirar
+    assert fila._elementos == [None] * len(fila._elementos)
+
+
+def test_capacidade_maxima_invalida():
+    with pytest.raises(ValueError):
+        Fila(0)
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from estruturas_dados.hyperloglog import HyperLogLog
+
+CARDINALIDADES = [10, 100, 1000, 10000, 100000]
+
+
+def _valores(quantidade, semente):
+    # Ids de usuário sorteados sem repetição, como no CSV
+    return random.Random(semente).sample(range(1, 10 ** 12), quantidade)
+
+
+def _sketch(valores, precisao=HyperLogLog.PRECISAO_PADRAO):
+    sketch = HyperLogLog(precisao)
+    for valor in valores:
+        sketch.adicionar(valor)
+    return sketch
+
+
+def _tolerancia(sketch, cardinalidade):
+    # Três erros padrão (1,04 / sqrt(2^precisao)) da cardinalidade real
+    return 3 * sketch.erro_padrao * cardinalidade
+
+
+@pytest.mark.parametrize("precisao", [10, 12, 14])
+@pytest.mark.parametrize("cardinalidade", CARDINALIDADES)
+def test_estimativa_dentro_de_tres_erros_padrao(precisao, cardinalidade):
+    valores = _valores(cardinalidade, semente=cardinalidade + precisao)
+    sketch = _sketch(valores + valores[: cardinalidade // 2], precisao)  # repetidos não contam
+    real = len(set(valores))
+    assert abs(sketch.estimar() - real) <= _tolerancia(sketch, real)
+
+
+def test_estimativa_com_textos():
+    valores = [f"usuario-{indice}" for indice in range(20000)]
+    sketch = _sketch(valores)
+    assert abs(sketch.estimar() - len(set(valores))) <= _tolerancia(sketch, len(valores))
+
+
+def test_troca_de_esparso_para_denso_nao_altera_a_estimativa():
+    sketch = HyperLogLog(12)
+    limite = (1 << 12) // 64
+    valores = _valores(5000, semente=1)
+    posicao = 0
+    while sketch._registradores is None:
+        anterior = sketch.copiar()
+        sketch.adicionar(valores[posicao])
+        posicao += 1
+    # Trocou ao passar do limite de registradores ocupados
+    assert len(anterior._esparso) == limite
+    assert sketch._esparso is None
+
+    # O mesmo conteúdo nas duas representações gera a mesma estimativa
+    denso = anterior.copiar()
+    denso._densificar()
+    assert denso.estimar() == anterior.estimar()
+
+    for valor in valores[posicao:]:
+        sketch.adicionar(valor)
+    assert abs(sketch.estimar() - len(valores)) <= _tolerancia(sketch, len(valores))
+
+
+@pytest.mark.parametrize("tamanhos", [(50, 80), (50, 30000), (30000, 50), (30000, 40000)])
+def test_mesclar_equivale_a_uniao(tamanhos):
+    # Combina esparso e denso nos dois sentidos; metade do menor conjunto é comum aos dois
+    valores = _valores(sum(tamanhos), semente=sum(tamanhos))
+    primeiro = valores[: tamanhos[0]]
+    segundo = valores[tamanhos[0]:] + primeiro[: min(tamanhos) // 2]
+
+    mesclado = _sketch(primeiro)
+    mesclado.mesclar(_sketch(segundo))
+    uniao = _sketch(primeiro + segundo)
+
+    assert mesclado.estimar() == uniao.estimar()
+    real = len(set(primeiro) | set(segundo))
+    assert abs(mesclado.estimar() - real) <= _tolerancia(mesclado, real)
+
+
+def test_mesclar_precisoes_diferentes():
+    with pytest.raises(ValueError):
+        HyperLogLog(10).mesclar(HyperLogLog(12))
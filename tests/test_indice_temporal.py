@@ -0,0 +1,152 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from analise.sistema import SistemaAnaliseEngajamento
+from entidades.interacao import datetime_para_epoch, epoch_para_datetime
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+from estruturas_dados.indice_temporal import IndiceTemporal
+
+CABECALHO = ("id_conteudo;nome_conteudo;id_usuario;timestamp_interacao;plataforma;tipo_interacao;"
+             "watch_duration_seconds;comment_text;tipo_conteudo;categorias\n")
+HORA = 3600
+INICIO = datetime_para_epoch(datetime(2024, 10, 20))
+
+
+def _timestamp(aleatorio):
+    # Metade das linhas exatamente na borda de uma hora ou a um segundo dela
+    hora = INICIO + aleatorio.randrange(-3, 30) * HORA
+    if aleatorio.random() < 0.5:
+        return hora + aleatorio.choice((-1, 0, 1))
+    return hora + aleatorio.randrange(HORA)
+
+
+def _adicionar_linhas(armazenamento, quantidade, aleatorio):
+    tipos = ArmazenamentoColunarInteracoes.TIPOS_INTERACAO
+    for _ in range(quantidade):
+        armazenamento.adicionar(aleatorio.randrange(50), aleatorio.randrange(1, 20), aleatorio.randrange(4),
+                                aleatorio.choice(tipos), _timestamp(aleatorio), aleatorio.choice((0, 0, 45, 600)),
+                                "", interacao_id=len(armazenamento))
+
+
+def _filtro(armazenamento, inicio, fim):
+    return [indice for indice, timestamp in enumerate(armazenamento.timestamps)
+            if (inicio is None or timestamp >= inicio) and (fim is None or timestamp < fim)]
+
+
+def _agregar_por_filtro(armazenamento, inicio, fim):
+    """Os agregados de IndiceTemporal.agregar calculados percorrendo todas as linhas."""
+    por_conteudo, por_plataforma = {}, {}
+    for indice in _filtro(armazenamento, inicio, fim):
+        for agregados, chave in ((por_conteudo, armazenamento.ids_conteudo[indice]),
+                                 (por_plataforma, armazenamento.ids_plataforma[indice])):
+            agregado = agregados.setdefault(chave, [0] * (IndiceTemporal.QUANTIDADE_TIPOS + 2))
+            agregado[armazenamento.codigos_tipo[indice]] += 1
+            if armazenamento.duracoes[indice] > 0:
+                agregado[IndiceTemporal.POSICAO_TEMPO] += armazenamento.duracoes[indice]
+                agregado[IndiceTemporal.POSICAO_DURACOES] += 1
+    return por_conteudo, por_plataforma
+
+
+def _janelas(aleatorio):
+    # Bordas de hora, um segundo antes e depois, janelas vazias, invertidas e abertas
+    limites = [None] + [INICIO + hora * HORA + desvio for hora in (-4, 0, 1, 2, 7, 29, 31) for desvio in (-1, 0, 1)]
+    janelas = [(inicio, fim) for inicio in limites for fim in limites]
+    janelas += [(inicio, inicio + aleatorio.randrange(1, 3 * HORA))
+                for inicio in (INICIO + aleatorio.randrange(-3 * HORA, 30 * HORA) for _ in range(60))]
+    return janelas
+
+
+def _verificar(indice, armazenamento, aleatorio):
+    for inicio, fim in _janelas(aleatorio):
+        assert indice.agregar(inicio, fim) == _agregar_por_filtro(armazenamento, inicio, fim), (inicio, fim)
+        linhas = list(indice.linhas(inicio, fim))
+        assert sorted(linhas) == _filtro(armazenamento, inicio, fim)
+        # Em ordem de bucket e, dentro do bucket, de chegada
+        assert linhas == sorted(linhas, key=lambda linha: (armazenamento.timestamps[linha] // HORA, linha))
+
+
+@pytest.mark.parametrize("tamanho_bucket", [HORA, 900, 7 * 60 + 1])
+def test_agregar_e_linhas_equivalem_ao_filtro_por_timestamp(tamanho_bucket):
+    aleatorio = random.Random(tamanho_bucket)
+    armazenamento = ArmazenamentoColunarInteracoes()
+    indice = IndiceTemporal(armazenamento, tamanho_bucket)
+    _adicionar_linhas(armazenamento, 1500, aleatorio)
+    for inicio, fim in _janelas(aleatorio):
+        assert indice.agregar(inicio, fim) == _agregar_por_filtro(armazenamento, inicio, fim), (inicio, fim)
+        assert sorted(indice.linhas(inicio, fim)) == _filtro(armazenamento, inicio, fim)
+
+    # Linhas acrescentadas depois da primeira consulta são indexadas sob demanda
+    _adicionar_linhas(armazenamento, 500, aleatorio)
+    for inicio, fim in _janelas(aleatorio):
+        assert indice.agregar(inicio, fim) == _agregar_por_filtro(armazenamento, inicio, fim), (inicio, fim)
+
+
+def test_linhas_em_ordem_de_bucket():
+    aleatorio = random.Random(1)
+    armazenamento = ArmazenamentoColunarInteracoes()
+    _adicionar_linhas(armazenamento, 1000, aleatorio)
+    _verificar(IndiceTemporal(armazenamento), armazenamento, aleatorio)
+
+
+def test_indice_restaurado_equivale_ao_filtro():
+    aleatorio = random.Random(2)
+    armazenamento = ArmazenamentoColunarInteracoes()
+    _adicionar_linhas(armazenamento, 1000, aleatorio)
+    original = IndiceTemporal(armazenamento)
+    colunas = original.exportar()
+
+    restaurado = IndiceTemporal(armazenamento)
+    restaurado.restaurar(colunas, len(armazenamento))
+    _adicionar_linhas(armazenamento, 300, aleatorio)
+    _verificar(restaurado, armazenamento, aleatorio)
+
+
+def test_limites_como_texto_e_datetime():
+    aleatorio = random.Random(3)
+    armazenamento = ArmazenamentoColunarInteracoes()
+    _adicionar_linhas(armazenamento, 500, aleatorio)
+    indice = IndiceTemporal(armazenamento)
+    inicio, fim = INICIO + 2 * HORA, INICIO + 5 * HORA
+    esperado = indice.agregar(inicio, fim)
+    assert indice.agregar(epoch_para_datetime(inicio), epoch_para_datetime(fim)) == esperado
+    assert indice.agregar(str(epoch_para_datetime(inicio)), str(epoch_para_datetime(fim))) == esperado
+
+
+def _linha_csv(id_conteudo, id_usuario, momento, tipo, duracao):
+    return (f"{id_conteudo};Conteúdo {id_conteudo};{id_usuario};{momento:%Y-%m-%d %H:%M:%S};"
+            f"{['Globoplay', 'G1', 'TV Globo'][id_usuario % 3]};{tipo};{duracao};;"
+            f"{['Vídeo', 'Podcast', 'Artigo'][id_conteudo % 3]};Novela\n")
+
+
+def test_relatorios_por_periodo_equivalem_a_carregar_so_as_linhas_do_periodo(tmp_path, capsys):
+    aleatorio = random.Random(4)
+    momentos = [epoch_para_datetime(_timestamp(aleatorio)) for _ in range(1500)]
+    linhas = [(aleatorio.randrange(1, 15), aleatorio.randrange(1, 40), momento,
+               aleatorio.choice(ArmazenamentoColunarInteracoes.TIPOS_INTERACAO), aleatorio.choice((0, 30, 600)))
+              for momento in momentos]
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_text(CABECALHO + "".join(_linha_csv(*linha) for linha in linhas), encoding="utf-8")
+    sistema = SistemaAnaliseEngajamento()
+    sistema.carregar_e_processar_em_lotes(str(caminho))
+
+    inicio = datetime(2024, 10, 20, 3)
+    for fim in (inicio + timedelta(hours=1), inicio + timedelta(hours=5), inicio + timedelta(hours=5, seconds=1)):
+        # O mesmo CSV apenas com inicio <= momento < fim, processado sem período
+        caminho_periodo = tmp_path / "periodo.csv"
+        caminho_periodo.write_text(CABECALHO + "".join(_linha_csv(*linha) for linha in linhas
+                                                       if inicio <= linha[2] < fim), encoding="utf-8")
+        periodo = SistemaAnaliseEngajamento()
+        periodo.carregar_e_processar_em_lotes(str(caminho_periodo))
+        capsys.readouterr()
+
+        texto_inicio, texto_fim = f"{inicio:%Y-%m-%d %H:%M:%S}", f"{fim:%Y-%m-%d %H:%M:%S}"
+        for relatorio in ("gerar_relatorio_top_conteudos_consumidos", "relatorio_top_conteudos_mais_visualizados",
+                          "relatorio_top_conteudos_mais_curtidos", "relatorio_total_interacoes_por_tipo_conteudo"):
+            getattr(sistema, relatorio)(inicio=texto_inicio, fim=texto_fim)
+            por_periodo = capsys.readouterr().out
+            getattr(periodo, relatorio)()
+            assert por_periodo == capsys.readouterr().out, relatorio
+        assert sorted(sistema._agregados_plataformas(texto_inicio, texto_fim).values()) == \
+            sorted(periodo._agregados_plataformas().values())
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from analise.sistema import SistemaAnaliseEngajamento
+from estruturas_dados.indice_texto import IndiceTexto, normalizar_texto
+
+CABECALHO = ("id_conteudo;nome_conteudo;id_usuario;timestamp_interacao;plataforma;tipo_interacao;"
+             "watch_duration_seconds;comment_text;tipo_conteudo;categorias\n")
+# Letras com e sem acento, maiúsculas e espaços, para muitas coincidências parciais
+LETRAS = "aáâãeéêioóôõuúcçnAÁÉÇN "
+
+
+def _texto(aleatorio, minimo, maximo):
+    return "".join(aleatorio.choice(LETRAS) for _ in range(aleatorio.randint(minimo, maximo)))
+
+
+def _varredura(textos, consulta):
+    # A busca antiga percorria todos os nomes; aqui com a mesma normalização do índice
+    consulta = normalizar_texto(consulta)
+    return {chave for chave, texto in textos.items() if consulta in normalizar_texto(texto)}
+
+
+def _consultas(aleatorio, textos):
+    consultas = ["", " ", "a", "A", "ã", "ç", "xyz", "aaaaaaaaaa"]
+    for _ in range(300):
+        if textos and aleatorio.random() < 0.6:
+            # Trecho de um texto existente, com tamanhos abaixo e acima do n-grama
+            texto = aleatorio.choice(list(textos.values()))
+            inicio = aleatorio.randrange(len(texto) + 1)
+            consultas.append(texto[inicio:inicio + aleatorio.randint(1, 2 * IndiceTexto.TAMANHO_NGRAMA + 2)])
+        else:
+            consultas.append(_texto(aleatorio, 1, 6))
+    return consultas
+
+
+def test_buscar_equivale_a_varredura_com_adicoes_e_remocoes():
+    aleatorio = random.Random(1)
+    indice = IndiceTexto()
+    textos = {}
+    for rodada in range(6):
+        for _ in range(150):
+            chave = aleatorio.randrange(300)
+            if aleatorio.random() < 0.75:
+                # Reindexa chaves já existentes com outro texto
+                textos[chave] = _texto(aleatorio, 0, 14)
+                indice.adicionar(chave, textos[chave])
+            else:
+                textos.pop(chave, None)
+                indice.remover(chave)
+        assert len(indice) == len(textos)
+        for consulta in _consultas(aleatorio, textos):
+            assert indice.buscar(consulta) == _varredura(textos, consulta), consulta
+
+
+def test_sem_acentos_equivale_a_busca_antiga():
+    # Em textos sem acentos a normalização é o mesmo lower() da busca antiga
+    aleatorio = random.Random(2)
+    textos = {chave: "".join(aleatorio.choice("abcAB ") for _ in range(aleatorio.randint(0, 12)))
+              for chave in range(200)}
+    indice = IndiceTexto()
+    for chave, texto in textos.items():
+        indice.adicionar(chave, texto)
+    for consulta in _consultas(aleatorio, textos):
+        if consulta.isascii():
+            esperado = {chave for chave, texto in textos.items() if consulta.lower() in texto.lower()}
+            assert indice.buscar(consulta) == esperado
+
+
+def test_buscar_prefixo_equivale_a_varredura_das_palavras():
+    aleatorio = random.Random(3)
+    textos = {chave: _texto(aleatorio, 0, 14) for chave in range(200)}
+    indice = IndiceTexto()
+    for chave, texto in textos.items():
+        indice.adicionar(chave, texto)
+    for consulta in _consultas(aleatorio, textos):
+        normalizada = normalizar_texto(consulta).strip()
+        # Começa no início do texto ou logo após um espaço (pode continuar nas palavras seguintes)
+        esperado = set()
+        for chave, texto in textos.items():
+            texto = normalizar_texto(texto)
+            if any(texto.startswith(normalizada, i) for i in range(len(texto) + 1) if i == 0 or texto[i - 1] == " "):
+                esperado.add(chave)
+        assert indice.buscar_prefixo(consulta) == esperado
+
+
+@pytest.mark.parametrize("consulta", ["a", "Jo", "jor", "JORN", "nação", "nacao", "NAÇÃO", "ção ", "o c", "é", "z"])
+def test_buscar_conteudo_por_nome_equivale_a_percorrer_os_conteudos(tmp_path, consulta):
+    nomes = ["Jornal Nacional", "Jornal da Globo", "Coração Valente", "Conversa com Bial", "Nação Zumbi",
+             "É de Casa", "Encontro", "Amazônia", "Mais Você", "jornal hoje"]
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_text(CABECALHO + "".join(
+        f"{id_conteudo};{nome};{100 + id_conteudo};2024-10-20 20:00:00;Globoplay;like;0;;Vídeo;Geral\n"
+        for id_conteudo, nome in enumerate(nomes, 1)), encoding="utf-8")
+    sistema = SistemaAnaliseEngajamento()
+    sistema.carregar_e_processar_em_lotes(str(caminho))
+
+    resultado = sistema.buscar_conteudo_por_nome(consulta)
+    esperado = [conteudo for _, conteudo in sistema._arvore_conteudos.percurso_em_ordem()
+                if normalizar_texto(consulta) in normalizar_texto(conteudo.nome_conteudo)]
+    assert resultado == esperado
+    assert [conteudo.id_conteudo for conteudo in resultado] == sorted(conteudo.id_conteudo for conteudo in resultado)
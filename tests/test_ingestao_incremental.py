@@ -0,0 +1,56 @@
+from analise.sistema import SistemaAnaliseEngajamento
+
+CABECALHO = ("id_conteudo;nome_conteudo;id_usuario;timestamp_interacao;plataforma;tipo_interacao;"
+             "watch_duration_seconds;comment_text;tipo_conteudo;categorias\n")
+LINHA_1 = "1;Jornal Nacional;101;2024-10-20 20:05:12;TV Globo;like;0;;Vídeo;Jornalismo\n"
+
+
+def _acrescentar(caminho, texto):
+    with open(caminho, 'ab') as arquivo:
+        arquivo.write(texto.encode('utf-8'))
+
+
+def test_linha_sendo_escrita_fica_para_a_proxima_chamada(tmp_path, capsys):
+    caminho = tmp_path / "interacoes.csv"
+    # A última linha já tem todos os separadores, mas a categoria ainda está sendo escrita
+    caminho.write_bytes((CABECALHO + LINHA_1
+                         + "2;Novela Renascer;102;2024-10-20 21:15:30;Globoplay;like;0;;Vídeo;Novela,Dr").encode('utf-8'))
+    sistema = SistemaAnaliseEngajamento()
+    assert sistema.carregar_incremental(str(caminho)) == 1
+    assert sistema._arvore_conteudos.buscar(2) is None
+
+    _acrescentar(caminho, "ama\n")
+    assert sistema.carregar_incremental(str(caminho)) == 1
+    assert "Erro" not in capsys.readouterr().out
+    assert sistema._arvore_conteudos.buscar(2).categoria == "novela,drama"
+    assert sistema.checkpoint_csv["linhas"] == 2
+    assert len(sistema._armazenamento_colunar) == 2
+
+
+def test_campo_entre_aspas_sendo_escrito_fica_para_a_proxima_chamada(tmp_path, capsys):
+    caminho = tmp_path / "interacoes.csv"
+    # A quebra de linha dentro do comentário não encerra o registro
+    caminho.write_bytes((CABECALHO + LINHA_1
+                         + '2;Novela Renascer;102;2024-10-20 21:15:30;Globoplay;comment;0;"Adorei\n'
+                         + 'o capítulo').encode('utf-8'))
+    sistema = SistemaAnaliseEngajamento()
+    assert sistema.carregar_incremental(str(caminho)) == 1
+
+    _acrescentar(caminho, ' de hoje";Vídeo;Novela\n')
+    assert sistema.carregar_incremental(str(caminho)) == 1
+    assert "Erro" not in capsys.readouterr().out
+    assert sistema._armazenamento_colunar.comentario(1) == "Adorei\no capítulo de hoje"
+
+
+def test_arquivo_completo_le_ultima_linha_sem_quebra(tmp_path):
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_bytes((CABECALHO + LINHA_1
+                         + "2;Novela Renascer;102;2024-10-20 21:15:30;Globoplay;like;0;;Vídeo;Novela").encode('utf-8'))
+    sistema = SistemaAnaliseEngajamento()
+    assert sistema.carregar_incremental(str(caminho), arquivo_completo=True) == 2
+    assert sistema._arvore_conteudos.buscar(2).categoria == "novela"
+
+    # Uma linha acrescentada depois (iniciando com quebra de linha) continua sendo lida
+    _acrescentar(caminho, "\n" + LINHA_1)
+    assert sistema.carregar_incremental(str(caminho), arquivo_completo=True) == 1
+    assert len(sistema._armazenamento_colunar) == 3
@@ -0,0 +1,35 @@
+import pytest
+
+from analise.mais_ativos import MotorMaisAtivos
+from dados_sinteticos import CABECALHO, estado, linhas_csv, novo_sistema
+
+
+def _colunas(sistema):
+    # Os ids das interações vêm de um contador global, diferente entre os dois sistemas
+    return {nome: list(coluna) for nome, coluna in sistema._armazenamento_colunar.colunas().items()
+            if nome != "ids"}
+
+
+@pytest.mark.parametrize("processos, blocos_por_processo", [(1, 1), (1, 7), (2, 3)])
+def test_paralelo_equivale_ao_serial(tmp_path, capsys, monkeypatch, processos, blocos_por_processo):
+    # Lotes dos mais ativos menores que os blocos e que os lotes da fila
+    monkeypatch.setattr(MotorMaisAtivos, "LINHAS_POR_LOTE", 256)
+    caminho = tmp_path / "interacoes.csv"
+    linhas = linhas_csv(3000, 5)
+    # Linhas rejeitadas no meio dos blocos seguem o caminho serial
+    linhas[700] = "7;Conteúdo 7;abc;2024-10-20 10:00:00;G1;like;0;;Vídeo;Novela\n"
+    linhas[2100] = "8;Conteúdo 8;9;2024-10-20 10:00:00;G1;like;100000000000000000000;;Vídeo;Novela\n"
+    caminho.write_text(CABECALHO + "".join(linhas), encoding="utf-8")
+
+    serial = novo_sistema()
+    assert serial.carregar_e_processar_em_lotes(str(caminho)) == 3000
+    erros_serial = capsys.readouterr().out
+    assert erros_serial.count("Erro") == 2
+    paralelo = novo_sistema()
+    assert paralelo.carregar_csv_paralelo(str(caminho), processos, blocos_por_processo) == 3000
+    assert capsys.readouterr().out == erros_serial
+
+    assert _colunas(paralelo) == _colunas(serial)
+    # Inclui os mais ativos: os resumos Space-Saving (20 contadores, com substituições)
+    # recebem as linhas na ordem do arquivo nos dois caminhos
+    assert estado(paralelo, capsys) == estado(serial, capsys)
@@ -0,0 +1,60 @@
+import csv
+
+from analise import leitor_csv
+from analise.leitor_csv import interpretar_linha, ler_csv_mmap
+from analise.sistema import SistemaAnaliseEngajamento
+
+CABECALHO = ("id_conteudo;nome_conteudo;id_usuario;timestamp_interacao;plataforma;tipo_interacao;"
+             "watch_duration_seconds;comment_text;tipo_conteudo;categorias\n")
+
+LINHAS = (
+    '1;Jornal Nacional;101;2024-10-20 20:05:12;TV Globo;comment;0;"Ótima\nedição; parabéns";Vídeo;Jornalismo\n'
+    '2;Novela Renascer;102;2024-10-20 21:15:30;Globoplay;comment;0;"Linha 1\r\n""Linha"" 2\n\nfim";Vídeo;Novela\n'
+    '3;Podcast Café;103;2024-10-20 22:00:00;Globoplay;like;0;Tela de 5" boa;Podcast;Conversa\n'
+    '4;Jogo do Brasil;104;2024-10-21 16:00:00;"Premiere";view_start;7200;"";Vídeo;Esportes\n'
+)
+
+
+def _esperado(caminho):
+    # O que o processamento original (csv.DictReader + interpretar_linha) produz
+    resultado = []
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in csv.DictReader(arquivo, delimiter=';'):
+            try:
+                resultado.append(interpretar_linha(linha))
+            except Exception:
+                resultado.append(linha)
+    return resultado
+
+
+def test_campo_entre_aspas_com_quebra_de_linha(tmp_path, monkeypatch):
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_bytes((CABECALHO + LINHAS).encode('utf-8'))
+    esperado = _esperado(caminho)
+    assert len(esperado) == 4
+    assert esperado[0][7] == "Ótima\nedição; parabéns"
+
+    assert list(ler_csv_mmap(str(caminho))) == esperado
+    # Blocos pequenos cortam o registro com aspas entre dois blocos
+    monkeypatch.setattr(leitor_csv, "TAMANHO_BLOCO", 16)
+    assert list(ler_csv_mmap(str(caminho))) == esperado
+
+
+def test_aspas_nao_fechadas_vao_ate_o_fim(tmp_path):
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_bytes((CABECALHO + LINHAS + '5;Gshow;105;2024-10-21 17:00:00;Gshow;comment;0;"sem fim\n'
+                         + '6;Gshow;106;2024-10-21 17:00:00;Gshow;like;0;;Vídeo;Reality\n').encode('utf-8'))
+    assert list(ler_csv_mmap(str(caminho))) == _esperado(caminho)
+
+
+def test_carregamento_em_lotes_preserva_comentario_com_quebra(tmp_path, capsys):
+    caminho = tmp_path / "interacoes.csv"
+    caminho.write_bytes((CABECALHO + LINHAS).encode('utf-8'))
+    sistema = SistemaAnaliseEngajamento()
+    assert sistema.carregar_e_processar_em_lotes(str(caminho)) == 4
+    assert "Erro" not in capsys.readouterr().out
+
+    armazenamento = sistema._armazenamento_colunar
+    assert len(armazenamento) == 4
+    assert armazenamento.comentario(0) == "Ótima\nedição; parabéns"
+    assert armazenamento.comentario(1) == 'Linha 1\n"Linha" 2\n\nfim'
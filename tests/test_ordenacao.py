@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from estruturas_dados.ordenacao import insertion_sort, merge_sort, radix_sort
+
+TAMANHOS = [0, 1, 2, 31, 32, 33, 100, 1000, 3000]
+
+
+def _registros(quantidade, semente, menor=-50, maior=50):
+    # Muitas chaves repetidas; o índice original identifica a ordem de chegada
+    aleatorio = random.Random(semente)
+    return [(aleatorio.randint(menor, maior), indice) for indice in range(quantidade)]
+
+
+def _primeiro(registro):
+    return registro[0]
+
+
+@pytest.mark.parametrize("ordenar", [merge_sort, radix_sort, insertion_sort])
+@pytest.mark.parametrize("quantidade", TAMANHOS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_equivale_a_sorted_e_e_estavel(ordenar, quantidade, reverse):
+    registros = _registros(quantidade, quantidade)
+    # sorted é estável também com reverse=True
+    esperado = sorted(registros, key=_primeiro, reverse=reverse)
+    lista = list(registros)
+    assert ordenar(lista, key=_primeiro, reverse=reverse) is lista
+    assert lista == esperado
+
+
+@pytest.mark.parametrize("ordenar", [merge_sort, radix_sort])
+@pytest.mark.parametrize("entrada", ["crescente", "decrescente", "iguais"])
+def test_entradas_ja_ordenadas(ordenar, entrada):
+    registros = _registros(2000, 7)
+    if entrada == "crescente":
+        registros.sort(key=_primeiro)
+    elif entrada == "decrescente":
+        registros.sort(key=_primeiro, reverse=True)
+    else:
+        registros = [(5, indice) for indice in range(2000)]
+    for reverse in (False, True):
+        lista = list(registros)
+        ordenar(lista, key=_primeiro, reverse=reverse)
+        assert lista == sorted(registros, key=_primeiro, reverse=reverse)
+
+
+def test_radix_sort_com_chaves_grandes_e_negativas():
+    registros = _registros(3000, 8, menor=-2 ** 62, maior=2 ** 62)
+    registros += [(chave, indice) for chave, indice in registros[:500:7]]  # repetidas
+    lista = list(registros)
+    radix_sort(lista, key=_primeiro)
+    assert lista == sorted(registros, key=_primeiro)
+
+
+def test_radix_sort_rejeita_chaves_nao_inteiras():
+    with pytest.raises(TypeError):
+        radix_sort([1, 2.5, 3])
+
+
+def test_merge_sort_com_chaves_compostas_e_sem_key():
+    aleatorio = random.Random(9)
+    nomes = [aleatorio.choice("abc") * aleatorio.randrange(1, 4) for _ in range(500)]
+    lista = list(nomes)
+    merge_sort(lista)
+    assert lista == sorted(nomes)
+
+    registros = [(-(indice % 7), nome, indice) for indice, nome in enumerate(nomes)]
+    lista = list(registros)
+    merge_sort(lista, key=lambda registro: (registro[0], registro[1]), reverse=True)
+    assert lista == sorted(registros, key=lambda registro: (registro[0], registro[1]), reverse=True)
+
+
+@pytest.mark.parametrize("ordenar", [merge_sort, radix_sort, insertion_sort])
+def test_chave_calculada_uma_vez_por_elemento(ordenar):
+    chamadas = []
+
+    def chave(registro):
+        chamadas.append(registro)
+        return registro[0]
+
+    registros = _registros(80, 10)
+    ordenar(list(registros), key=chave)
+    assert len(chamadas) == len(registros)
@@ -0,0 +1,70 @@
+import random
+
+from analise.recomendacao import MotorRecomendacao
+
+
+class ConteudoFicticio:
+    """Expõe apenas o que o MotorRecomendacao lê de um Conteudo."""
+
+    def __init__(self, id_conteudo, categorias):
+        self.id_conteudo = id_conteudo
+        self.categorias = categorias
+        self.interacoes = 0
+        self.tempo = 0
+
+    def calcular_total_interacoes_engajamento(self):
+        return self.interacoes
+
+    def calcular_tempo_total_consumo(self):
+        return self.tempo
+
+
+def _ranking_esperado(conteudos, categoria, peso_interacoes, peso_tempo):
+    membros = [conteudo for conteudo in conteudos if categoria in conteudo.categorias]
+    max_interacoes = max(conteudo.interacoes for conteudo in membros)
+    max_tempo = max(conteudo.tempo for conteudo in membros)
+
+    def pontuacao(conteudo):
+        valor = 0.0
+        if max_interacoes:
+            valor += peso_interacoes * (conteudo.interacoes / max_interacoes)
+        if max_tempo:
+            valor += peso_tempo * (conteudo.tempo / max_tempo)
+        return valor
+
+    return [conteudo.id_conteudo for conteudo in sorted(membros, key=lambda c: (-pontuacao(c), c.id_conteudo))]
+
+
+def test_ranking_mantido_a_cada_interacao_igual_ao_recalculo():
+    aleatorio = random.Random(7)
+    categorias = ["novela", "esporte", "jornalismo"]
+    conteudos = [ConteudoFicticio(id_conteudo, aleatorio.sample(categorias, aleatorio.randint(1, 2)))
+                 for id_conteudo in range(1, 41)]
+    motor = MotorRecomendacao()
+    registrados = {}  # só entram no ranking os conteúdos que já receberam interações
+    for passo in range(2000):
+        conteudo = aleatorio.choice(conteudos)
+        registrados[conteudo.id_conteudo] = conteudo
+        conteudo.interacoes += aleatorio.randint(0, 1)
+        conteudo.tempo += aleatorio.choice([0, 0, 30, 600])
+        motor.atualizar_conteudo(conteudo)
+        if passo % 97 == 0:
+            for categoria in conteudo.categorias:
+                obtidos = [c.id_conteudo for c in motor.recomendar(categoria, 10)]
+                assert obtidos == _ranking_esperado(registrados.values(), categoria, 0.6, 0.4)[:10]
+                obtidos = [c.id_conteudo for c in motor.recomendar(categoria, 10, 0.2, 0.8)]
+                assert obtidos == _ranking_esperado(registrados.values(), categoria, 0.2, 0.8)[:10]
+
+    for categoria in categorias:
+        completo = [conteudo.id_conteudo for conteudo, _ in motor.ranking(categoria)]
+        assert completo == _ranking_esperado(registrados.values(), categoria, 0.6, 0.4)
+
+
+def test_cache_de_pesos_personalizados_e_limitado():
+    motor = MotorRecomendacao()
+    conteudo = ConteudoFicticio(1, ["novela"])
+    conteudo.interacoes = 3
+    motor.atualizar_conteudo(conteudo)
+    for i in range(3 * MotorRecomendacao.LIMITE_RANKINGS_PERSONALIZADOS):
+        assert motor.recomendar("novela", 1, peso_interacoes=i / 1000, peso_tempo=1.0) == [conteudo]
+    assert len(motor._rankings_personalizados) == MotorRecomendacao.LIMITE_RANKINGS_PERSONALIZADOS
@@ -0,0 +1,96 @@
+import os
+import struct
+
+from analise import snapshot
+from analise.mais_ativos import MotorMaisAtivos
+from analise.sistema import SistemaAnaliseEngajamento
+from dados_sinteticos import CABECALHO, estado, linhas_csv, novo_sistema
+
+
+def test_snapshot_restaura_o_mesmo_estado(tmp_path, capsys, monkeypatch):
+    # Lotes pequenos: o snapshot guarda lotes completos e as linhas do lote incompleto
+    monkeypatch.setattr(MotorMaisAtivos, "LINHAS_POR_LOTE", 256)
+    caminho_csv = tmp_path / "interacoes.csv"
+    caminho_csv.write_text(CABECALHO + "".join(linhas_csv(3000, 1)), encoding="utf-8")
+    caminho_snapshot = str(tmp_path / "estado.snap")
+    sistema = novo_sistema()
+    sistema.carregar_e_processar_em_lotes(str(caminho_csv))
+    esperado = estado(sistema, capsys)
+    sistema.salvar_snapshot(caminho_snapshot, str(caminho_csv))
+
+    restaurado = SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv))
+    assert restaurado is not None
+    armazenamento = restaurado._armazenamento_colunar
+    # As estruturas derivadas vêm prontas: nada é indexado a partir das colunas
+    assert restaurado._indice_temporal._linhas_indexadas == len(armazenamento)
+    assert restaurado._usuarios_unicos._linhas_indexadas == len(armazenamento)
+    assert restaurado._mais_ativos._linhas_processadas == len(armazenamento) // 256 * 256
+    assert restaurado._mais_ativos.capacidade == 20
+    assert restaurado._motor_tendencias.janela_minutos == 90
+
+    assert {nome: list(coluna) for nome, coluna in armazenamento.colunas().items()} == \
+        {nome: list(coluna) for nome, coluna in sistema._armazenamento_colunar.colunas().items()}
+    assert estado(restaurado, capsys) == esperado
+
+
+def test_ingestao_continua_apos_restaurar(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(MotorMaisAtivos, "LINHAS_POR_LOTE", 256)
+    # Metade do CSV, snapshot, reinício e o restante pela ingestão incremental:
+    # o resultado é o mesmo de ler o arquivo inteiro de uma vez
+    linhas = linhas_csv(3000, 2)
+    caminho_csv = tmp_path / "interacoes.csv"
+    caminho_checkpoint = str(tmp_path / "estado.ckpt")
+    caminho_snapshot = str(tmp_path / "estado.snap")
+    caminho_csv.write_text(CABECALHO + "".join(linhas[:1500]), encoding="utf-8")
+    sistema = novo_sistema()
+    sistema.carregar_incremental(str(caminho_csv), caminho_checkpoint)
+    sistema.mais_ativos("usuarios")
+    sistema.salvar_snapshot(caminho_snapshot, str(caminho_csv))
+
+    with open(caminho_csv, "a", encoding="utf-8") as arquivo:
+        arquivo.write("".join(linhas[1500:]))
+    restaurado = SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv),
+                                                             aceitar_acrescimo=True)
+    assert restaurado.carregar_incremental(str(caminho_csv), caminho_checkpoint) == 1500
+
+    completo = novo_sistema()
+    completo.carregar_e_processar_em_lotes(str(caminho_csv))
+    assert estado(restaurado, capsys) == estado(completo, capsys)
+
+
+def test_snapshot_de_outra_versao_e_ignorado(tmp_path):
+    caminho_csv = tmp_path / "interacoes.csv"
+    caminho_csv.write_text(CABECALHO + "".join(linhas_csv(50, 3)), encoding="utf-8")
+    caminho_snapshot = str(tmp_path / "estado.snap")
+    sistema = novo_sistema()
+    sistema.carregar_e_processar_em_lotes(str(caminho_csv))
+    sistema.salvar_snapshot(caminho_snapshot, str(caminho_csv))
+
+    with open(caminho_snapshot, "r+b") as arquivo:
+        arquivo.seek(8)
+        arquivo.write(struct.pack("<H", snapshot.VERSAO + 1))
+    assert SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv)) is None
+
+
+def test_snapshot_invalidado_quando_o_csv_muda(tmp_path):
+    caminho_csv = tmp_path / "interacoes.csv"
+    linhas = linhas_csv(60, 4)
+    caminho_csv.write_text(CABECALHO + "".join(linhas[:50]), encoding="utf-8")
+    caminho_snapshot = str(tmp_path / "estado.snap")
+    sistema = novo_sistema()
+    sistema.carregar_e_processar_em_lotes(str(caminho_csv))
+    sistema.salvar_snapshot(caminho_snapshot, str(caminho_csv))
+    assert SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv)) is not None
+
+    # Mesmo tamanho, mas modificado depois do snapshot
+    info = os.stat(caminho_csv)
+    os.utime(caminho_csv, ns=(info.st_atime_ns, info.st_mtime_ns + 10 ** 9))
+    assert SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv)) is None
+
+    # Linhas acrescentadas: só é aceito com aceitar_acrescimo
+    os.utime(caminho_csv, ns=(info.st_atime_ns, info.st_mtime_ns))
+    with open(caminho_csv, "a", encoding="utf-8") as arquivo:
+        arquivo.write("".join(linhas[50:]))
+    assert SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv)) is None
+    assert SistemaAnaliseEngajamento.carregar_snapshot(caminho_snapshot, str(caminho_csv),
+                                                       aceitar_acrescimo=True) is not None
@@ -0,0 +1,126 @@
+import random
+from collections import Counter
+
+import pytest
+
+from analise.mais_ativos import MotorMaisAtivos
+from estruturas_dados.armazenamento_colunar import ArmazenamentoColunarInteracoes
+from estruturas_dados.space_saving import SpaceSaving
+
+CAPACIDADE = 50
+
+
+def _fluxo(quantidade, semente, pesos=False):
+    # Poucas chaves frequentes e uma cauda longa (distribuição de Zipf aproximada)
+    aleatorio = random.Random(semente)
+    chaves = [int(1000 / (aleatorio.random() * 999 + 1)) * 7919 % 10007 for _ in range(quantidade)]
+    return [(chave, aleatorio.randrange(1, 100) if pesos else 1) for chave in chaves]
+
+
+def _reais(*fluxos):
+    reais = Counter()
+    for fluxo in fluxos:
+        for chave, peso in fluxo:
+            reais[chave] += peso
+    return reais
+
+
+def _verificar_garantias(resumo, reais):
+    total = sum(reais.values())
+    assert resumo.total == total
+    assert len(resumo) <= resumo.capacidade
+    for chave, contagem, erro in resumo.primeiros(resumo.capacidade):
+        assert contagem - erro <= reais[chave] <= contagem
+        assert erro <= total / resumo.capacidade
+    # Todo item com peso real acima de total / capacidade é monitorado
+    for chave, real in reais.items():
+        if real > total / resumo.capacidade:
+            assert resumo.contagem(chave)[0] >= real
+
+
+@pytest.mark.parametrize("pesos", [False, True])
+def test_garantias_de_erro(pesos):
+    fluxo = _fluxo(20000, 1, pesos)
+    resumo = SpaceSaving(CAPACIDADE)
+    for chave, peso in fluxo:
+        resumo.adicionar(chave, peso)
+    _verificar_garantias(resumo, _reais(fluxo))
+
+
+@pytest.mark.parametrize("tamanho_lote", [1, 37, 1000])
+def test_adicionar_lote_mantem_as_garantias(tamanho_lote):
+    fluxo = _fluxo(20000, 2, pesos=True)
+    resumo = SpaceSaving(CAPACIDADE)
+    for inicio in range(0, len(fluxo), tamanho_lote):
+        resumo.adicionar_lote(_reais(fluxo[inicio:inicio + tamanho_lote]))
+    _verificar_garantias(resumo, _reais(fluxo))
+
+
+def test_adicionar_lote_com_contadores_livres_equivale_a_adicionar():
+    lote = Counter({chave: chave % 5 + 1 for chave in range(CAPACIDADE - 10)})
+    um_a_um = SpaceSaving(CAPACIDADE)
+    um_a_um.adicionar(3, 2)
+    for chave, peso in lote.items():
+        um_a_um.adicionar(chave, peso)
+    em_lote = SpaceSaving(CAPACIDADE)
+    em_lote.adicionar(3, 2)
+    em_lote.adicionar_lote(lote)
+    assert em_lote.exportar() == um_a_um.exportar()
+
+
+@pytest.mark.parametrize("tamanhos", [(10, 20), (20000, 30), (30, 20000), (20000, 15000)])
+def test_mesclar_mantem_as_garantias(tamanhos):
+    # Resumos cheios e não cheios nos dois sentidos; as chaves se repetem entre as partes
+    primeiro = _fluxo(tamanhos[0], 3, pesos=True)
+    segundo = _fluxo(tamanhos[1], 4, pesos=True)
+    resumo = SpaceSaving(CAPACIDADE)
+    for chave, peso in primeiro:
+        resumo.adicionar(chave, peso)
+    outro = SpaceSaving(CAPACIDADE)
+    for chave, peso in segundo:
+        outro.adicionar(chave, peso)
+    resumo.mesclar(outro)
+    _verificar_garantias(resumo, _reais(primeiro, segundo))
+
+
+def test_copiar_e_independente():
+    resumo = SpaceSaving(3)
+    for chave in (1, 2, 3, 1):
+        resumo.adicionar(chave)
+    copia = resumo.copiar()
+    copia.adicionar(4, 5)
+    assert resumo.exportar() == [4, [(2, 1, 0), (1, 2, 0), (3, 1, 0)]]
+    assert copia.contagem(4) == (6, 1)
+
+
+def _armazenamento(quantidade, semente):
+    aleatorio = random.Random(semente)
+    armazenamento = ArmazenamentoColunarInteracoes()
+    for indice in range(quantidade):
+        armazenamento.adicionar(aleatorio.randrange(300), aleatorio.randrange(40), 1, "view_start",
+                                1729400000 + indice, aleatorio.choice((0, 30, 600)), "", interacao_id=indice)
+    return armazenamento
+
+
+def test_mais_ativos_nao_depende_de_quando_atualizar_e_chamado(monkeypatch):
+    monkeypatch.setattr(MotorMaisAtivos, "LINHAS_POR_LOTE", 100)
+    completo = _armazenamento(1050, 5)
+    colunas = completo.colunas()
+    esperado = MotorMaisAtivos(completo, 20)
+
+    parcial = ArmazenamentoColunarInteracoes()
+    motor = MotorMaisAtivos(parcial, 20)
+    resultados = []
+    # Linhas chegando em pedaços que não coincidem com os lotes, com consultas no meio
+    for inicio, fim in ((0, 1), (1, 150), (150, 200), (200, 777), (777, 1050)):
+        for indice in range(inicio, fim):
+            parcial.adicionar(colunas["ids_usuario"][indice], colunas["ids_conteudo"][indice], 1, "view_start",
+                              colunas["timestamps"][indice], colunas["duracoes"][indice], "", interacao_id=indice)
+        resultados.append(motor.mais_ativos("pares", "tempo", 5))
+        motor.atualizar()
+    assert motor._linhas_processadas == 1000
+
+    for dimensao in MotorMaisAtivos.DIMENSOES:
+        for criterio in MotorMaisAtivos.CRITERIOS:
+            assert motor.mais_ativos(dimensao, criterio, 20) == esperado.mais_ativos(dimensao, criterio, 20)
+    assert resultados[-1] == esperado.mais_ativos("pares", "tempo", 5)